@@ -9,115 +9,92 @@ Usage example:
 """
 import argparse
 import time
-import math
 import random
-from collections import deque
 
 import networkx as nx
 
-from src.graph_loader import generate_directed_ER, generate_directed_clique
-from src.greedy_packing import find_greedy_packing, bfs_subtree_nodes
-from src.pmcover import pmcover_half
-from src.pmcover_continuous import pmcover_continuous
-from src.pmcover_lazy import pmcover_lazy
+from src.csr_graph import from_networkx
+from src.graph_loader import (
+    generate_directed_ER, generate_directed_clique, generate_sparse_directed_ER
+)
+from src.greedy_packing import build_ball_index, find_greedy_packing
+from src.cover_instance import build_cover_instance, reduce_cover_instance
+from src.pmcover_auto import ENGINES, pmcover
+from src.snapshot import open_edge_list
 from src.complete import complete
 from src.simulator import simulate_broadcast_rounds
 
 
-def build_cover_instance(
-    G: nx.DiGraph,
-    root: int,
-    terminals: set,
-    packs: list,
-    D_star: int,
-    k: int
-):
-    """
-    Constructs the partition-matroid cover instance after greedy packing.
-    A = {root} ∪ all terminals covered by packs.
-    C = V \ A.
-    For each edge a->c with a in A, c in C, define the set of terminals
-    reachable from c within D_star hops (restricted to C).
-    Budgets[a] is set to ceil(sqrt(k)) for all a in A.
-    Returns: sets, budgets, cover_map
-      - sets: Dict[(a,c), Set[terminal]]
-      - budgets: Dict[a, int]
-      - cover_map: Dict[c, List[terminal]] for complete()
-    """
-    # Determine A and C
-    covered_by_packs = set().union(*packs) if packs else set()
-    A = {root} | covered_by_packs
-    C = set(G.nodes()) - A
-
-    # Budgets: use rho = ceil(sqrt(k)) as degree bound
-    rho = math.ceil(math.sqrt(k))
-    budgets = {a: rho for a in A}
-
-    sets = {}
-    cover_map = {}
-
-    # For each a->c edge crossing A->C, compute coverage
-    for a in A:
-        for c in G.successors(a):
-            if c not in C:
-                continue
-            # BFS from c restricted to C up to depth D_star
-            visited = {c}
-            queue = deque([(c, 0)])
-            while queue:
-                u, d = queue.popleft()
-                if d >= D_star:
-                    continue
-                for v in G.successors(u):
-                    if v in C and v not in visited:
-                        visited.add(v)
-                        queue.append((v, d + 1))
-            cover = visited & terminals
-            if cover:
-                sets[(a, c)] = cover
-                cover_map[c] = list(cover)
-
-    return sets, budgets, cover_map
-
-
 def parse_args():
     p = argparse.ArgumentParser(
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
-    p.add_argument("--graph", choices=["ER", "clique"], required=True,
+    p.add_argument("--graph", choices=["ER", "clique", "file"], required=True,
                    help="Graph type")
-    p.add_argument("--n",     type=int,   required=True,
-                   help="Number of nodes")
+    p.add_argument("--n",     type=int,   default=None,
+                   help="Number of nodes (required unless --graph file)")
+    p.add_argument("--edges", type=str,   default=None,
+                   help="Edge-list path for --graph file (cached as a CSR snapshot)")
     p.add_argument("--p",     type=float, default=0.01,
                    help="ER edge probability")
     p.add_argument("--t_ratio", type=float, default=0.2,
                    help="Fraction of nodes chosen as terminals")
     p.add_argument("--k_ratio", type=float, default=0.5,
                    help="Fraction of terminals to inform (k/t)")
-    p.add_argument("--D_star",  type=int,   default=3,
-                   help="Depth bound for greedy packing / cover BFS")
+    p.add_argument("--D_star",  type=int,   default=[3], nargs="+",
+                   help="Depth bound(s) for greedy packing / cover BFS; "
+                        "several values run a sweep over one shared ball index")
+    p.add_argument("--pmcover", choices=["auto"] + sorted(ENGINES), default="auto",
+                   help="Cover engine; auto runs a cheap greedy and escalates "
+                        "to continuous greedy only if it misses the target")
+    p.add_argument("--time_budget", type=float, default=None,
+                   help="Seconds allowed for the cover step (auto only)")
     p.add_argument("--iters",   type=int,   default=20,
                    help="Iterations for continuous-greedy")
     p.add_argument("--samples", type=int,   default=20,
                    help="Samples per iteration for continuous-greedy")
-    return p.parse_args()
+    p.add_argument("--gradient", choices=["exact", "shared", "sample"],
+                   default="exact",
+                   help="Continuous-greedy gradient: closed form, shared-sample "
+                        "or per-coordinate Monte Carlo")
+    p.add_argument("--seed", type=int, default=None,
+                   help="Seed for the shared-sample gradient and stochastic greedy")
+    p.add_argument("--backend", choices=["nx", "csr"], default="nx",
+                   help="Graph representation used by the pipeline")
+    args = p.parse_args()
+    if args.graph == "file" and args.edges is None:
+        p.error("--graph file requires --edges")
+    if args.graph != "file" and args.n is None:
+        p.error(f"--graph {args.graph} requires --n")
+    return args
 
 
 def main():
     args = parse_args()
 
-    # 1. Generate graph
-    if args.graph == "ER":
+    # 1. Generate (or load) graph
+    stored_root, stored_terminals = None, None
+    if args.graph == "file":
+        G, stored_root, stored_terminals = open_edge_list(args.edges)
+        args.n = G.number_of_nodes()
+    elif args.graph == "ER" and args.backend == "csr":
+        G = generate_sparse_directed_ER(args.n, args.p, seed=42)
+    elif args.graph == "ER":
         G = generate_directed_ER(args.n, args.p, seed=42)
     else:
-        G = generate_directed_clique(args.n)
+        G = generate_directed_clique(args.n, implicit=args.backend == "csr")
+    if args.backend == "csr" and isinstance(G, nx.DiGraph):
+        G = from_networkx(G)
 
-    root = 0
+    root = 0 if stored_root is None else stored_root
     nodes = list(G.nodes())
 
-    # 2. Sample terminals
-    t = max(1, int(args.t_ratio * args.n))
-    terminals = set(random.sample(nodes, t))
+    # 2. Sample terminals (unless the snapshot stores them)
+    if stored_terminals is not None:
+        terminals = set(stored_terminals)
+    else:
+        t = max(1, int(args.t_ratio * args.n))
+        terminals = set(random.sample(nodes, t))
     if root in terminals:
         terminals.remove(root)
     t = len(terminals)
@@ -125,12 +102,29 @@ def main():
     # 3. Compute k
     k = max(1, int(args.k_ratio * t))
 
+    depths = sorted(set(args.D_star))
     print(f"\nGraph: {args.graph}(n={args.n}, p={args.p}), "
-          f"terminals={t}, k={k}, D*={args.D_star}\n")
+          f"terminals={t}, k={k}, D*={', '.join(map(str, depths))}\n")
+
+    # One index at the largest depth, with hop distances, serves the sweep
+    ball_index = None
+    if len(depths) > 1:
+        start = time.perf_counter()
+        ball_index = build_ball_index(G, terminals, depths[-1], distances=True)
+        print(f"Ball index (D ≤ {depths[-1]}) built in "
+              f"{time.perf_counter() - start:.3f}s\n")
+
+    for D_star in depths:
+        if len(depths) > 1:
+            print(f"--- D* = {D_star} ---")
+        run_pipeline(G, root, terminals, k, D_star, args, ball_index)
 
+
+def run_pipeline(G, root, terminals, k, D_star, args, ball_index=None):
     # 4. Greedy Packing
     start = time.perf_counter()
-    packs = find_greedy_packing(G, root, terminals, k, args.D_star)
+    packs = find_greedy_packing(G, root, terminals, k, D_star, lazy=True,
+                                ball_index=ball_index)
     gp_time = time.perf_counter() - start
     covered = set().union(*packs) if packs else set()
     print(f"Greedy packing → {len(packs)} packs, "
@@ -141,36 +135,36 @@ def main():
 
     # 6. Build cover instance
     sets, budgets, cover_map = build_cover_instance(
-        G, root, terminals, packs, args.D_star, k
+        G, root, terminals, packs, D_star, k
     )
-
-    # 7. PMCover variants
-    # 7a. half
-    start = time.perf_counter()
-    half_sel = pmcover_half(sets, budgets, k_rem)
-    half_time = time.perf_counter() - start
-    half_cov = len(set().union(*(sets[key] for key in half_sel)))
-    print(f"PMCover half → covered {half_cov}/{k_rem} in {half_time:.3f}s")
-
-    # 7b. full (continuous)
-    start = time.perf_counter()
-    full_sel = pmcover_continuous(sets, budgets, k_rem,
-                                  iters=args.iters,
-                                  samples=args.samples)
-    full_time = time.perf_counter() - start
-    full_cov = len(set().union(*(sets[key] for key in full_sel)))
-    print(f"PMCover full → covered {full_cov}/{k_rem} in {full_time:.3f}s")
-
-    # 7c. lazy
+    # Drop dominated keys per anchor and share identical sets
+    sets, reduction = reduce_cover_instance(sets)
+    print(f"Cover instance → {reduction['keys_before']} → "
+          f"{reduction['keys_after']} keys, "
+          f"{reduction['distinct_before']} → {reduction['distinct_after']} "
+          f"distinct sets, {reduction['elements_before']} → "
+          f"{reduction['elements_after']} elements")
+
+    # 7. PMCover (one engine, or auto: cheap greedy first, continuous
+    #    greedy only if the greedy misses a reachable target)
+    options = {}
+    if args.pmcover in ("auto", "continuous"):
+        options = dict(iters=args.iters, samples=args.samples,
+                       gradient=args.gradient, seed=args.seed)
+    elif args.pmcover == "stochastic":
+        options = dict(seed=args.seed)
+    report = {}
     start = time.perf_counter()
-    lazy_sel = pmcover_lazy(sets, budgets, k_rem)
-    lazy_time = time.perf_counter() - start
-    lazy_cov = len(set().union(*(sets[key] for key in lazy_sel)))
-    print(f"PMCover lazy → covered {lazy_cov}/{k_rem} in {lazy_time:.3f}s\n")
+    sel = pmcover(sets, budgets, k_rem, method=args.pmcover,
+                  time_budget=args.time_budget, report=report, **options)
+    pm_time = time.perf_counter() - start
+    pm_cov = len(set().union(*(sets[key] for key in sel)))
+    print(f"PMCover {args.pmcover} ({' → '.join(report['engines']) or 'nothing to do'}) "
+          f"→ covered {pm_cov}/{k_rem} in {pm_time:.3f}s\n")
 
     # 8. Stitch and simulate
     start = time.perf_counter()
-    T = complete(G, root, packs, lazy_sel, cover_map, k)
+    T = complete(G, root, packs, sel, cover_map, k)
     rounds = simulate_broadcast_rounds(T, root, terminals)
     sim_time = time.perf_counter() - start
     print(f"Broadcast rounds → {rounds} rounds in {sim_time:.3f}s\n")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Time build_cover_instance (BFS and sparse-matrix engines) against the
+per-edge construction it replaced (one restricted BFS for every a->c
+edge) on directed ER graphs.
+
+Usage:
+  python -m experiments.run_cover_instance_benchmark
+"""
+
+import os
+import sys
+import time
+import random
+
+# add project root to path so we can import src/
+ROOT = os.path.abspath(os.path.join(__file__, os.pardir, os.pardir))
+sys.path.insert(0, ROOT)
+
+from src.bfs import bfs_subtree_nodes
+from src.cover_instance import build_cover_instance
+from src.graph_loader import generate_sparse_directed_ER
+from src.greedy_packing import find_greedy_packing
+
+def per_edge_cover_sets(G, root, terminals, packs, D_star):
+    covered = set().union(*packs) if packs else set()
+    A = {root} | covered
+    C = set(G.nodes()) - A
+    sets = {}
+    for a in A:
+        for c in G.successors(a):
+            if c not in C:
+                continue
+            cover = bfs_subtree_nodes(G, c, D_star, allowed=C) & terminals
+            if cover:
+                sets[(a, c)] = cover
+    return sets
+
+def run_case(n, p, t_ratio, D_star, seed=0):
+    G = generate_sparse_directed_ER(n, p, seed=seed)
+    rng = random.Random(seed)
+    terms = set(rng.sample(range(1, n), max(1, int(t_ratio * n))))
+    k = len(terms)
+    packs = find_greedy_packing(G, 0, terms, k, D_star, lazy=True)
+
+    t0 = time.perf_counter()
+    ref = per_edge_cover_sets(G, 0, terms, packs, D_star)
+    per_edge_time = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    sets, _, cover_map = build_cover_instance(G, 0, terms, packs, D_star, k)
+    shared_time = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    sparse_sets, _, _ = build_cover_instance(G, 0, terms, packs, D_star, k,
+                                             engine="sparse")
+    sparse_time = time.perf_counter() - t0
+    assert sets == ref == sparse_sets
+    distinct = len({id(s) for s in sets.values()})
+    print(f"{n:>7} {p:>8.1e} {len(sets):>7} {distinct:>8} "
+          f"{per_edge_time:>10.3f} {shared_time:>10.3f} {sparse_time:>10.3f}")
+
+def main():
+    print(f"{'n':>7} {'p':>8} {'keys':>7} {'distinct':>8} "
+          f"{'per-edge':>10} {'shared':>10} {'sparse':>10}")
+    for n, p in [(2000, 5e-3), (10000, 1e-3), (20000, 5e-4)]:
+        run_case(n, p, t_ratio=0.3, D_star=3)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Cost of a D_star sweep: rebuilding the ball index / cover instance for
+every depth versus recording hop distances once at the largest depth.
+
+Usage:
+  python -m experiments.run_depth_sweep
+"""
+
+import os
+import sys
+import time
+import random
+
+# add project root to path so we can import src/
+ROOT = os.path.abspath(os.path.join(__file__, os.pardir, os.pardir))
+sys.path.insert(0, ROOT)
+
+from src.cover_instance import CoverDistances, build_cover_instance
+from src.graph_loader import generate_sparse_directed_ER
+from src.greedy_packing import build_ball_index, find_greedy_packing
+
+def run_case(n, p, t_ratio, depths, seed=0):
+    G = generate_sparse_directed_ER(n, p, seed=seed)
+    rng = random.Random(seed)
+    terms = set(rng.sample(range(1, n), max(1, int(t_ratio * n))))
+    k = len(terms)
+    D_max = max(depths)
+    print(f"\nER(n={n}, p={p}), |T|={k}, D* in {depths}")
+
+    # packing: one index per depth vs one index with distances
+    t0 = time.perf_counter()
+    per_depth = [find_greedy_packing(G, 0, terms, k, D, lazy=True) for D in depths]
+    per_depth_time = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    index = build_ball_index(G, terms, D_max, distances=True)
+    swept = [find_greedy_packing(G, 0, terms, k, D, lazy=True, ball_index=index)
+             for D in depths]
+    swept_time = time.perf_counter() - t0
+    assert [[sorted(pk) for pk in packs] for packs in swept] == \
+           [[sorted(pk) for pk in packs] for packs in per_depth]
+    t0 = time.perf_counter()
+    find_greedy_packing(G, 0, terms, k, D_max, lazy=True)
+    largest_time = time.perf_counter() - t0
+
+    # cover instance for fixed packs: per depth vs one CoverDistances
+    packs = swept[-1]
+    t0 = time.perf_counter()
+    per_depth_sets = [build_cover_instance(G, 0, terms, packs, D, k)[0] for D in depths]
+    cover_time = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    distances = CoverDistances(G, 0, terms, packs, D_max)
+    swept_sets = [distances.instance(D, k)[0] for D in depths]
+    cover_swept_time = time.perf_counter() - t0
+    assert swept_sets == per_depth_sets
+
+    print(f"{'stage':>10} {'per-depth':>10} {'swept':>10} {'largest':>10}")
+    print(f"{'packing':>10} {per_depth_time:>10.3f} {swept_time:>10.3f} {largest_time:>10.3f}")
+    print(f"{'cover':>10} {cover_time:>10.3f} {cover_swept_time:>10.3f} {'':>10}")
+
+def main():
+    for n, p in [(5000, 1e-3), (20000, 2.5e-4)]:
+        run_case(n, p, t_ratio=0.2, depths=[1, 2, 3, 4])
+
+if __name__ == "__main__":
+    main()
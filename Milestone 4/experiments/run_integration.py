@@ -7,7 +7,6 @@ Verifies that each stage runs without errors and prints plausible metrics.
 import os
 import sys
 import time
-import math
 import random
 
 # ensure project root (parent of experiments/) is on PYTHONPATH
@@ -18,41 +17,12 @@ import networkx as nx
 
 from src.graph_loader import generate_directed_clique
 from src.greedy_packing import find_greedy_packing
+from src.cover_instance import build_cover_instance, reduce_cover_instance
 from src.pmcover import pmcover_half
 from src.pmcover_continuous import pmcover_continuous
 from src.pmcover_lazy import pmcover_lazy
 from src.complete import complete
 from src.simulator import simulate_broadcast_rounds
-from collections import deque
-
-def build_cover_instance(G, root, terminals, packs, D_star, k):
-    # same helper as demo
-    covered_by_packs = set().union(*packs) if packs else set()
-    A = {root} | covered_by_packs
-    C = set(G.nodes()) - A
-    rho = math.ceil(math.sqrt(k))
-    budgets = {a: rho for a in A}
-    sets = {}
-    cover_map = {}
-    for a in A:
-        for c in G.successors(a):
-            if c not in C:
-                continue
-            visited = {c}
-            queue = deque([(c, 0)])
-            while queue:
-                u, d = queue.popleft()
-                if d >= D_star:
-                    continue
-                for v in G.successors(u):
-                    if v in C and v not in visited:
-                        visited.add(v)
-                        queue.append((v, d + 1))
-            cover = visited & terminals
-            if cover:
-                sets[(a, c)] = cover
-                cover_map[c] = list(cover)
-    return sets, budgets, cover_map
 
 def main():
     # parameters for a small smoke test
@@ -66,7 +36,7 @@ def main():
     print(f"\n=== RUNNING INTEGRATION TEST (clique n={n}) ===\n")
 
     # 1) build clique
-    G = generate_directed_clique(n)
+    G = generate_directed_clique(n, implicit=True)
     root = 0
     nodes = list(G.nodes())
 
@@ -90,6 +60,8 @@ def main():
 
     # 5) build cover instance
     sets, budgets, cover_map = build_cover_instance(G, root, terminals, packs, D_star, k)
+    sets, reduction = reduce_cover_instance(sets)
+    print(f"Cover instance: {reduction['keys_before']} → {reduction['keys_after']} keys")
 
     # 6) pmcover variants
     t0 = time.perf_counter()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Compare sketch-based approximate greedy packing against the exact path
+on sparse directed ER graphs: packs found, terminals covered, runtime.
+
+Usage:
+  python -m experiments.run_packing_sketch_benchmark
+"""
+
+import os
+import sys
+import time
+import random
+
+# add project root to path so we can import src/
+ROOT = os.path.abspath(os.path.join(__file__, os.pardir, os.pardir))
+sys.path.insert(0, ROOT)
+
+from src.graph_loader import generate_sparse_directed_ER
+from src.greedy_packing import find_greedy_packing
+
+def run_case(n, p, t_ratio, D_star, sketch_sizes, exact_tops, seed=0):
+    G = generate_sparse_directed_ER(n, p, seed=seed)
+    rng = random.Random(seed)
+    terms = set(rng.sample(range(1, n), max(1, int(t_ratio * n))))
+    k = len(terms)
+    print(f"\nER(n={n}, p={p}), |T|={k}, D*={D_star}")
+
+    t0 = time.perf_counter()
+    exact = find_greedy_packing(G, 0, terms, k, D_star, lazy=True)
+    exact_time = time.perf_counter() - t0
+    exact_cov = sum(len(pack) for pack in exact)
+    print(f"{'mode':>18} {'packs':>6} {'covered':>8} {'quality':>8} {'time(s)':>8}")
+    print(f"{'exact':>18} {len(exact):>6} {exact_cov:>8} {1.0:>8.3f} {exact_time:>8.3f}")
+
+    for sketch_size in sketch_sizes:
+        for exact_top in exact_tops:
+            t0 = time.perf_counter()
+            packs = find_greedy_packing(G, 0, terms, k, D_star, engine="sketch",
+                                        sketch_size=sketch_size,
+                                        exact_top=exact_top, seed=seed)
+            elapsed = time.perf_counter() - t0
+            cov = sum(len(pack) for pack in packs)
+            label = f"sketch k={sketch_size} top={exact_top}"
+            quality = cov / exact_cov if exact_cov else 1.0
+            print(f"{label:>18} {len(packs):>6} {cov:>8} {quality:>8.3f} {elapsed:>8.3f}")
+
+def main():
+    sketch_sizes = [8, 32]
+    exact_tops = [1, 16]
+    for n, p in [(20000, 2e-4), (100000, 4e-5)]:
+        run_case(n, p, t_ratio=0.1, D_star=4,
+                 sketch_sizes=sketch_sizes, exact_tops=exact_tops)
+
+if __name__ == "__main__":
+    main()
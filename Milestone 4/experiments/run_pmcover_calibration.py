@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Re-fit the engine costs behind pmcover(method="auto")
+(src/pmcover_auto.DEFAULT_COSTS) on this machine and print them in the
+form to paste back, next to the bundled values.
+
+Usage:
+  python -m experiments.run_pmcover_calibration
+"""
+
+import os
+import sys
+
+# add project root to path so we can import src/
+ROOT = os.path.abspath(os.path.join(__file__, os.pardir, os.pardir))
+sys.path.insert(0, ROOT)
+
+from src.pmcover_auto import COST_TERMS, DEFAULT_COSTS, calibrate
+
+def main():
+    costs = calibrate()
+    print(f"{'engine':>12} " + " ".join(f"{term:>10}" for term in COST_TERMS))
+    for name, coef in costs.items():
+        print(f"{name:>12} " + " ".join(f"{c:>10.1e}" for c in coef))
+        bundled = DEFAULT_COSTS.get(name)
+        if bundled:
+            print(f"{'bundled':>12} " + " ".join(f"{c:>10.1e}" for c in bundled))
+    print("\nDEFAULT_COSTS = {")
+    for name, coef in costs.items():
+        print(f'    "{name}": ({", ".join(f"{c:.1e}" for c in coef)}),')
+    print("}")
+
+if __name__ == "__main__":
+    main()
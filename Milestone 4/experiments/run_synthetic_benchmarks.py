@@ -10,9 +10,8 @@ Generate synthetic benchmarks on directed ER graphs:
 import os
 import sys
 import time
-import math
 import random
-from collections import deque, defaultdict
+from collections import defaultdict
 
 import matplotlib.pyplot as plt
 import networkx as nx
@@ -23,39 +22,13 @@ sys.path.insert(0, ROOT)
 
 from src.graph_loader import generate_directed_ER
 from src.greedy_packing import find_greedy_packing
+from src.cover_instance import build_cover_instance, reduce_cover_instance
 from src.pmcover import pmcover_half
 from src.pmcover_continuous import pmcover_continuous
 from src.pmcover_lazy import pmcover_lazy
 from src.complete import complete
 from src.simulator import simulate_broadcast_rounds
 
-def build_cover_instance(G, root, terminals, packs, D_star, k):
-    covered = set().union(*packs) if packs else set()
-    A = {root} | covered
-    C = set(G.nodes()) - A
-    rho = math.ceil(math.sqrt(k))
-    budgets = {a: rho for a in A}
-    sets = {}
-    cover_map = {}
-    for a in A:
-        for c in G.successors(a):
-            if c not in C:
-                continue
-            vis = {c}
-            q = deque([(c,0)])
-            while q:
-                u,d = q.popleft()
-                if d >= D_star: continue
-                for v in G.successors(u):
-                    if v in C and v not in vis:
-                        vis.add(v)
-                        q.append((v,d+1))
-            cov = vis & terminals
-            if cov:
-                sets[(a,c)] = cov
-                cover_map[c] = list(cov)
-    return sets, budgets, cover_map
-
 def run_trial(n, p, t_ratio, k_ratio, D_star, iters, samples):
     """
     Run one trial on ER(n,p). Returns dict of:
@@ -81,7 +54,7 @@ def run_trial(n, p, t_ratio, k_ratio, D_star, iters, samples):
 
         # greedy packing
         t0 = time.perf_counter()
-        packs = find_greedy_packing(G, root, terms, k, D_star)
+        packs = find_greedy_packing(G, root, terms, k, D_star, lazy=True)
         gp_time = time.perf_counter() - t0
         
         # To ensure cover algorithms get used, artificially limit greedy packing coverage
@@ -108,8 +81,9 @@ def run_trial(n, p, t_ratio, k_ratio, D_star, iters, samples):
 
         k_rem = max(1, k - gp_cov)  # Ensure at least 1 remaining to force cover algorithms to run
         sets, budgets, cover_map = build_cover_instance(G, root, terms - set().union(*packs) if packs else terms, packs, D_star, k)
+        sets, reduction = reduce_cover_instance(sets)
         
-        print(f"Sets count: {len(sets)}, k_rem: {k_rem}")
+        print(f"Sets count: {reduction['keys_before']} -> {len(sets)} after pruning, k_rem: {k_rem}")
 
         # pmcover half
         t0 = time.perf_counter()
@@ -0,0 +1,271 @@
+# src/ball_index.py
+
+import copy
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Union
+import numpy as np
+import networkx as nx
+
+from src.bfs import bfs_distances, bfs_levels, bfs_subtree_nodes
+from src.clique_graph import CliqueGraph
+from src.csr_graph import CSRGraph
+from src.sparse_reach import reachability_matrix
+
+class BallIndex:
+    """
+    Depth-bounded reachable sets ("balls") of every node of G, computed once.
+
+    ball(u) is the set of nodes reachable from u within `max_depth` hops,
+    i.e. bfs_subtree_nodes(G, u, max_depth). Balls are stored compactly in
+    CSR form: the members of node i's ball are
+    members[indptr[i]:indptr[i+1]], as positions into `nodes`.
+
+    Build one index per (graph, max_depth) and pass it to
+    find_greedy_packing to reuse it across rounds and across queries.
+    The index is a snapshot: it must be rebuilt if G changes.
+
+    The reverse index (node -> indexed sources whose ball contains it) is
+    the transpose of the same arrays and is built on first use.
+
+    With `distances=True` the hop distance of every member is kept in
+    `depths` (parallel to `members`), and at_depth(D) derives the index of
+    any D ≤ max_depth without another traversal, so a D_star sweep builds
+    a single index at its largest depth.
+    """
+
+    def __init__(
+        self,
+        G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
+        max_depth: int,
+        sources: Optional[Iterable[Hashable]] = None,
+        engine: str = "bfs",
+        distances: bool = False
+    ):
+        """
+        :param G: the graph
+        :param max_depth: hop bound D of every ball
+        :param sources: nodes whose balls are indexed (default: all nodes)
+        :param engine: "bfs" (one search per source) or "sparse" (all balls
+                       at once by sparse boolean matrix products)
+        :param distances: also store member hop distances (see at_depth)
+        """
+        self.max_depth = max_depth
+        self.nodes: List[Hashable] = list(G.nodes())
+        n = len(self.nodes)
+        self._identity = self.nodes == list(range(n))
+        self._pos = None if self._identity else {u: i for i, u in enumerate(self.nodes)}
+
+        sources = self.nodes if sources is None else list(sources)
+        self._row = {u: r for r, u in enumerate(sources)}
+        dtype = np.int32 if n < 2**31 else np.int64
+        self.depths: Optional[np.ndarray] = None
+        if engine == "sparse":
+            reach = reachability_matrix(G, sources, max_depth, distances=distances)
+            self.indptr = reach.indptr.astype(np.int64, copy=False)
+            self.members = reach.indices.astype(dtype, copy=False)
+            if distances:
+                self.depths = (reach.data - 1).astype(np.int16)
+        elif engine == "bfs":
+            indptr = np.zeros(len(sources) + 1, dtype=np.int64)
+            chunks = []
+            depth_chunks = []
+            # one seen mask reused by every CSR search
+            scratch = np.zeros(n, dtype=bool) if isinstance(G, CSRGraph) else None
+            for r, u in enumerate(sources):
+                if distances:
+                    levels = bfs_levels(G, u, max_depth, scratch=scratch)
+                    ball = [v for level in levels for v in level]
+                else:
+                    ball = bfs_subtree_nodes(G, u, max_depth, scratch=scratch)
+                if not self._identity:
+                    ball = [self._pos[v] for v in ball]
+                arr = np.fromiter(ball, dtype=dtype, count=len(ball))
+                if distances:
+                    hops = np.repeat(np.arange(len(levels), dtype=np.int16),
+                                     [len(level) for level in levels])
+                    order = np.argsort(arr)
+                    arr = arr[order]
+                    depth_chunks.append(hops[order])
+                else:
+                    arr.sort()
+                chunks.append(arr)
+                indptr[r + 1] = indptr[r] + len(arr)
+            self.indptr = indptr
+            self.members = np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype)
+            if distances:
+                self.depths = (np.concatenate(depth_chunks) if depth_chunks
+                               else np.empty(0, dtype=np.int16))
+        else:
+            raise ValueError(f"unknown ball engine {engine!r}")
+        self._sources = sources
+        self._rev_indptr: Optional[np.ndarray] = None
+        self._rev_rows: Optional[np.ndarray] = None
+        self._rev_depths: Optional[np.ndarray] = None
+        # index this one was derived from by at_depth
+        self._deeper: Optional["BallIndex"] = None
+
+    def __contains__(self, u) -> bool:
+        return u in self._row
+
+    def at_depth(self, depth: int) -> "BallIndex":
+        """
+        The index of the same sources at hop bound `depth` ≤ max_depth,
+        filtered from the stored distances (requires distances=True).
+        """
+        if depth == self.max_depth:
+            return self
+        if depth > self.max_depth or self.depths is None:
+            raise ValueError(
+                f"cannot derive depth {depth} from an index of depth "
+                f"{self.max_depth}" + ("" if self.depths is not None
+                                       else " built without distances")
+            )
+        keep = self.depths <= depth
+        kept_before = np.concatenate(([0], np.cumsum(keep)))
+        view = copy.copy(self)
+        view.max_depth = depth
+        view.indptr = kept_before[self.indptr]
+        view.members = self.members[keep]
+        view.depths = self.depths[keep]
+        # the reverse index is filtered from this one's instead of re-sorted
+        view._rev_indptr = view._rev_rows = view._rev_depths = None
+        view._deeper = self
+        return view
+
+    def __len__(self) -> int:
+        return len(self._row)
+
+    def ball_array(self, u: Hashable) -> np.ndarray:
+        """Positions (into `nodes`) of the members of ball(u), ascending."""
+        r = self._row[u]
+        return self.members[self.indptr[r]:self.indptr[r + 1]]
+
+    def ball(self, u: Hashable) -> List[Hashable]:
+        """Members of ball(u) as node labels."""
+        positions = self.ball_array(u).tolist()
+        if self._identity:
+            return positions
+        return [self.nodes[i] for i in positions]
+
+    def ball_size(self, u: Hashable) -> int:
+        r = self._row[u]
+        return int(self.indptr[r + 1] - self.indptr[r])
+
+    def containing(self, v: Hashable) -> List[Hashable]:
+        """Indexed sources whose ball contains node v."""
+        if self._rev_indptr is None:
+            self._build_reverse()
+        i = v if self._identity else self._pos[v]
+        rows = self._rev_rows[self._rev_indptr[i]:self._rev_indptr[i + 1]]
+        return [self._sources[r] for r in rows.tolist()]
+
+    def _build_reverse(self) -> None:
+        if self._deeper is not None:
+            deeper = self._deeper
+            if deeper._rev_indptr is None:
+                deeper._build_reverse()
+            keep = deeper._rev_depths <= self.max_depth
+            kept_before = np.concatenate(([0], np.cumsum(keep)))
+            self._rev_indptr = kept_before[deeper._rev_indptr]
+            self._rev_rows = deeper._rev_rows[keep]
+            self._rev_depths = deeper._rev_depths[keep]
+            return
+        rows = np.repeat(
+            np.arange(len(self._sources), dtype=self.members.dtype),
+            np.diff(self.indptr)
+        )
+        order = np.argsort(self.members, kind="stable")
+        rev_indptr = np.zeros(len(self.nodes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.members, minlength=len(self.nodes)),
+                  out=rev_indptr[1:])
+        self._rev_indptr = rev_indptr
+        self._rev_rows = rows[order]
+        if self.depths is not None:
+            self._rev_depths = self.depths[order]
+
+    def terminals_in_ball(self, u: Hashable, terminals: Set[Hashable]) -> Set[Hashable]:
+        """The members of `terminals` inside ball(u)."""
+        return terminals.intersection(self.ball(u))
+
+    def nbytes(self) -> int:
+        """Memory held by the ball arrays (and the reverse index, if built)."""
+        total = self.indptr.nbytes + self.members.nbytes
+        if self.depths is not None:
+            total += self.depths.nbytes
+        if self._rev_indptr is not None:
+            total += self._rev_indptr.nbytes + self._rev_rows.nbytes
+        if self._rev_depths is not None:
+            total += self._rev_depths.nbytes
+        return total
+
+
+class TerminalBallIndex:
+    """
+    Terminal-centric counterpart of BallIndex for sparse terminal sets.
+
+    Instead of a forward ball per node, it runs one depth-bounded BFS
+    backwards (over predecessor edges) from each terminal t; every node it
+    reaches has t in its ball. This yields each node's covered terminals
+    after |T| traversals instead of n. Full balls and the reverse map are
+    not stored: ball(u) and containing(v) run a single BFS on demand, which
+    greedy packing only needs for accepted packs.
+
+    With `distances=True` each node's terminals are kept with their hop
+    distance, and at_depth(D) answers any D ≤ max_depth.
+    """
+
+    def __init__(
+        self,
+        G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
+        max_depth: int,
+        terminals: Iterable[Hashable],
+        distances: bool = False
+    ):
+        self.graph = G
+        self.max_depth = max_depth
+        self.terminals = frozenset(terminals)
+        self._cover: Dict[Hashable, Set[Hashable]] = {}
+        # node -> {terminal: hops}, only kept with distances=True
+        self._hops: Optional[Dict[Hashable, Dict[Hashable, int]]] = {} if distances else None
+        # one seen mask reused by every CSR search
+        scratch = np.zeros(G.number_of_nodes(), dtype=bool) if isinstance(G, CSRGraph) else None
+        for t in self.terminals:
+            if t not in G:
+                continue
+            if distances:
+                for u, d in bfs_distances(G, t, max_depth, reverse=True,
+                                          scratch=scratch).items():
+                    self._cover.setdefault(u, set()).add(t)
+                    self._hops.setdefault(u, {})[t] = d
+            else:
+                for u in bfs_subtree_nodes(G, t, max_depth, reverse=True, scratch=scratch):
+                    self._cover.setdefault(u, set()).add(t)
+
+    def at_depth(self, depth: int) -> "TerminalBallIndex":
+        """The index at hop bound `depth` ≤ max_depth (needs distances)."""
+        if depth == self.max_depth:
+            return self
+        if depth > self.max_depth or self._hops is None:
+            raise ValueError(
+                f"cannot derive depth {depth} from an index of depth "
+                f"{self.max_depth}" + ("" if self._hops is not None
+                                       else " built without distances")
+            )
+        view = copy.copy(self)
+        view.max_depth = depth
+        view._cover, view._hops = {}, {}
+        for u, hops in self._hops.items():
+            kept = {t: d for t, d in hops.items() if d <= depth}
+            if kept:
+                view._cover[u] = set(kept)
+                view._hops[u] = kept
+        return view
+
+    def ball(self, u: Hashable) -> List[Hashable]:
+        return list(bfs_subtree_nodes(self.graph, u, self.max_depth))
+
+    def containing(self, v: Hashable) -> List[Hashable]:
+        return list(bfs_subtree_nodes(self.graph, v, self.max_depth, reverse=True))
+
+    def terminals_in_ball(self, u: Hashable, terminals: Set[Hashable]) -> Set[Hashable]:
+        """The members of `terminals` (indexed ones only) inside ball(u)."""
+        return terminals.intersection(self._cover.get(u, ()))
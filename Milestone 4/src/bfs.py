@@ -0,0 +1,249 @@
+# src/bfs.py
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+import numpy as np
+import networkx as nx
+
+from src.clique_graph import CliqueGraph
+from src.csr_graph import CSRGraph
+
+# Frontier size at which CSR searches switch from per-node Python expansion
+# to frontier_bfs; below it the NumPy call overhead outweighs the gather
+FRONTIER_BFS_MIN = 64
+
+def frontier_bfs(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    sources: Union[int, Iterable[int]],
+    max_depth: Optional[int] = None,
+    exclude: Optional[np.ndarray] = None,
+    scratch: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Level-synchronous BFS over CSR arrays (nodes 0..n-1).
+
+    Each level gathers the successor slices of the whole frontier with one
+    NumPy fancy-index, drops already-seen nodes through a boolean mask and
+    keeps the first occurrence of every new node, so nodes are visited in
+    exactly the order of a deque BFS.
+
+    :param sources: start node(s), visited at depth 0
+    :param max_depth: hop limit (None = unbounded)
+    :param exclude: boolean mask of nodes never stepped onto (sources are
+                    always visited); e.g. the complement of C = V \\ A
+    :param scratch: all-False boolean array of length n used as the seen
+                    mask instead of allocating one; only the visited
+                    entries are set, and they are cleared again on return
+    :returns: (visited, depth) -- visited node ids in BFS order and their
+              hop depths
+    """
+    n = len(indptr) - 1
+    sources = np.atleast_1d(np.asarray(sources, dtype=np.int64))
+    _, first = np.unique(sources, return_index=True)
+    frontier = sources[np.sort(first)]
+    seen = np.zeros(n, dtype=bool) if scratch is None else scratch
+    if exclude is not None:
+        exclude = exclude.astype(bool, copy=False)
+    seen[frontier] = True
+    levels = [frontier]
+    depth = 0
+    while len(frontier) and (max_depth is None or depth < max_depth):
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            break
+        # slot positions of every successor of the frontier, in order
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        nbrs = indices[offsets + np.arange(total)]
+        fresh = ~seen[nbrs]
+        if exclude is not None:
+            fresh &= ~exclude[nbrs]
+        nbrs = nbrs[fresh]
+        if len(nbrs) == 0:
+            break
+        # first occurrence of each new node keeps deque discovery order
+        _, first = np.unique(nbrs, return_index=True)
+        first.sort()
+        nxt = nbrs[first].astype(np.int64, copy=False)
+        seen[nxt] = True
+        levels.append(nxt)
+        frontier = nxt
+        depth += 1
+    visited = np.concatenate(levels)
+    if scratch is not None:
+        scratch[visited] = False
+    depths = np.repeat(np.arange(len(levels)), [len(level) for level in levels])
+    return visited, depths
+
+def _csr_levels(
+    G: CSRGraph,
+    source: int,
+    max_depth: int,
+    allowed: Optional[Set[int]],
+    exclude: Optional[np.ndarray],
+    reverse: bool,
+    scratch: Optional[np.ndarray] = None
+) -> Tuple[Set[int], List[List[int]]]:
+    """
+    Depth-bounded CSR search returning (visited, levels), where levels[d]
+    lists the nodes first reached at hop d. Levels are expanded per node
+    while the frontier is small and handed to frontier_bfs once it reaches
+    FRONTIER_BFS_MIN nodes, with `scratch` (allocated here if None) as its
+    seen mask; the mask is all-False again when this returns.
+    """
+    indptr, indices = G.reverse_arrays() if reverse else (G.indptr, G.indices)
+    vectorize = allowed is None
+    visited = {source}
+    frontier = [source]
+    levels = [frontier]
+    depth = 0
+    while frontier and depth < max_depth:
+        if vectorize and len(frontier) >= FRONTIER_BFS_MIN:
+            if scratch is None:
+                scratch = np.zeros(len(indptr) - 1, dtype=bool)
+            earlier = np.fromiter(visited, dtype=np.int64, count=len(visited))
+            scratch[earlier] = True
+            rest, depths = frontier_bfs(indptr, indices, frontier, max_depth - depth,
+                                           exclude=exclude, scratch=scratch)
+            scratch[earlier] = False
+            visited.update(rest.tolist())
+            # depth-0 entries of `rest` are the current frontier
+            bounds = np.searchsorted(depths, np.arange(1, depths[-1] + 2))
+            levels.extend(rest[lo:hi].tolist() for lo, hi in zip(bounds, bounds[1:]))
+            break
+        nxt = []
+        for u in frontier:
+            for v in indices[indptr[u]:indptr[u + 1]].tolist():
+                if v in visited:
+                    continue
+                if allowed is not None and v not in allowed:
+                    continue
+                if exclude is not None and exclude[v]:
+                    continue
+                visited.add(v)
+                nxt.append(v)
+        frontier = nxt
+        depth += 1
+        if nxt:
+            levels.append(nxt)
+    return visited, levels
+
+def csr_subtree_nodes(
+    G: CSRGraph,
+    source: int,
+    max_depth: int,
+    allowed: Optional[Set[int]] = None,
+    exclude: Optional[np.ndarray] = None,
+    reverse: bool = False,
+    scratch: Optional[np.ndarray] = None
+) -> Set[int]:
+    """
+    bfs_subtree_nodes for CSR graphs, expanding small frontiers per node and
+    large ones with frontier_bfs. A restriction is given either as an
+    `allowed` set or as an `exclude` mask; only the mask form (built once,
+    reused by many searches) is vectorized, since turning a set into a mask
+    costs O(|allowed|) per call. Callers running many searches pass one
+    all-False length-n `scratch` mask, so no search allocates O(n).
+    """
+    visited, _ = _csr_levels(G, source, max_depth, allowed, exclude, reverse, scratch)
+    return visited
+
+def bfs_levels(
+    G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
+    source: int,
+    max_depth: int,
+    allowed: Optional[Set[int]] = None,
+    exclude: Optional[np.ndarray] = None,
+    reverse: bool = False,
+    scratch: Optional[np.ndarray] = None
+) -> List[List[int]]:
+    """
+    The nodes bfs_subtree_nodes would visit with the same arguments, grouped
+    by hop distance: levels[d] holds the nodes first reached at hop d. One
+    search up to D_max therefore answers every depth D ≤ D_max
+    (levels[:D + 1]). `exclude` (a mask, CSR graphs only) is an
+    alternative to `allowed`; `scratch` is csr_subtree_nodes' reusable
+    seen mask (ignored for other graphs).
+    """
+    if isinstance(G, CSRGraph):
+        _, levels = _csr_levels(G, source, max_depth, allowed, exclude, reverse, scratch)
+        return levels
+    if exclude is not None:
+        raise ValueError("exclude masks are only supported for CSR graphs")
+    if isinstance(G, CliqueGraph) and max_depth >= 1:
+        rest = [v for v in (G.nodes() if allowed is None else allowed) if v != source]
+        return [[source], rest] if rest else [[source]]
+    step = G.predecessors if reverse else G.successors
+    visited = {source}
+    frontier = [source]
+    levels = [frontier]
+    for _ in range(max_depth):
+        nxt = []
+        for u in frontier:
+            for v in step(u):
+                if allowed is not None and v not in allowed:
+                    continue
+                if v not in visited:
+                    visited.add(v)
+                    nxt.append(v)
+        if not nxt:
+            break
+        levels.append(nxt)
+        frontier = nxt
+    return levels
+
+def bfs_distances(
+    G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
+    source: int,
+    max_depth: int,
+    allowed: Optional[Set[int]] = None,
+    exclude: Optional[np.ndarray] = None,
+    reverse: bool = False,
+    scratch: Optional[np.ndarray] = None
+) -> Dict[int, int]:
+    """Hop distance of every node in bfs_levels(...), as {node: hops}."""
+    levels = bfs_levels(G, source, max_depth, allowed, exclude, reverse, scratch)
+    return {v: d for d, level in enumerate(levels) for v in level}
+
+def bfs_subtree_nodes(
+    G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
+    source: int,
+    max_depth: int,
+    allowed: Optional[Set[int]] = None,
+    reverse: bool = False,
+    scratch: Optional[np.ndarray] = None
+) -> Set[int]:
+    """
+    Perform a breadth‐first search from `source` up to `max_depth` hops,
+    and return the set of all visited nodes.
+
+    If `allowed` is given, the search only steps onto nodes in `allowed`
+    (the source itself is always included). With `reverse=True` the search
+    follows predecessor edges, returning every node whose depth-bounded
+    ball contains `source`. `scratch` is csr_subtree_nodes' reusable seen
+    mask (CSR graphs only).
+    """
+    if isinstance(G, CliqueGraph) and max_depth >= 1:
+        # every node is one hop away
+        visited = set(G.nodes()) if allowed is None else set(allowed)
+        visited.add(source)
+        return visited
+    if isinstance(G, CSRGraph):
+        return csr_subtree_nodes(G, source, max_depth, allowed=allowed, reverse=reverse,
+                                 scratch=scratch)
+    step = G.predecessors if reverse else G.successors
+    visited = {source}
+    queue = deque([(source, 0)])
+    while queue:
+        u, depth = queue.popleft()
+        if depth >= max_depth:
+            continue
+        for v in step(u):
+            if allowed is not None and v not in allowed:
+                continue
+            if v not in visited:
+                visited.add(v)
+                queue.append((v, depth + 1))
+    return visited
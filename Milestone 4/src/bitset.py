@@ -0,0 +1,75 @@
+# src/bitset.py
+
+from typing import Hashable, Iterable, List
+import numpy as np
+
+if hasattr(int, "bit_count"):
+    def popcount(bits: int) -> int:
+        """Number of set bits of a non-negative Python int."""
+        return bits.bit_count()
+else:  # Python < 3.10
+    def popcount(bits: int) -> int:
+        """Number of set bits of a non-negative Python int."""
+        return bin(bits).count("1")
+
+_BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+def _popcount_words_table(words: np.ndarray) -> np.ndarray:
+    """popcount_words via a per-byte lookup table."""
+    words = np.ascontiguousarray(words)
+    as_bytes = words.view(np.uint8).reshape(words.shape + (words.itemsize,))
+    return _BYTE_COUNTS[as_bytes].sum(axis=-1, dtype=np.uint8)
+
+if hasattr(np, "bitwise_count"):
+    def popcount_words(words: np.ndarray) -> np.ndarray:
+        """Element-wise set-bit counts of an unsigned integer array."""
+        return np.bitwise_count(words)
+else:  # NumPy < 2.0
+    popcount_words = _popcount_words_table
+
+def bits_from_positions(positions: Iterable[int], size: int) -> int:
+    """Bitmap (Python int) with bit i set for every i in `positions`."""
+    positions = np.fromiter(positions, dtype=np.int64)
+    if len(positions) <= 32:
+        # a few shifts beat building a byte mask of the whole universe
+        bits = 0
+        for i in positions.tolist():
+            bits |= 1 << i
+        return bits
+    mask = np.zeros(size, dtype=bool)
+    mask[positions] = True
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+def positions_from_bits(bits: int) -> List[int]:
+    """Ascending positions of the set bits of `bits`."""
+    if not bits:
+        return []
+    raw = np.frombuffer(bits.to_bytes((bits.bit_length() + 7) // 8, "little"),
+                        dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder="little")).tolist()
+
+class BitIndexer:
+    """
+    Assigns contiguous bit positions to a fixed universe of items so that
+    subsets can be held as Python big-int bitmaps. Intersection, union and
+    difference then run word-parallel in C, and sizes come from popcount.
+    """
+
+    def __init__(self, items: Iterable[Hashable]):
+        self.items: List[Hashable] = list(items)
+        self.position = {x: i for i, x in enumerate(self.items)}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def to_bits(self, subset: Iterable[Hashable]) -> int:
+        """Bitmap of `subset`; items outside the universe are ignored."""
+        position = self.position
+        return bits_from_positions(
+            (position[x] for x in subset if x in position), len(self.items)
+        )
+
+    def from_bits(self, bits: int) -> List[Hashable]:
+        """Items whose bits are set, in universe order."""
+        items = self.items
+        return [items[i] for i in positions_from_bits(bits)]
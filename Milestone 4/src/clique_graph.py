@@ -0,0 +1,61 @@
+# src/clique_graph.py
+
+from typing import Iterator, List, Tuple
+
+
+class CliqueGraph:
+    """
+    Implicit complete digraph on nodes 0..n-1 (every ordered pair u != v).
+
+    No edges are stored; successors are generated on demand, so the graph
+    costs O(1) memory. It exposes the same read API as CSRGraph, and the
+    pipeline stages recognize it to short-circuit traversals whose answer
+    is known in closed form (every depth ≥ 1 ball is the whole vertex set).
+    """
+
+    def __init__(self, n: int):
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        self._n = n
+
+    def number_of_nodes(self) -> int:
+        return self._n
+
+    def number_of_edges(self) -> int:
+        return self._n * (self._n - 1) if self._n else 0
+
+    def nodes(self) -> range:
+        return range(self._n)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._n))
+
+    def __contains__(self, u) -> bool:
+        try:
+            return 0 <= u < self._n and int(u) == u
+        except TypeError:
+            return False
+
+    def successors(self, u: int) -> List[int]:
+        return list(range(u)) + list(range(u + 1, self._n))
+
+    neighbors = successors
+    predecessors = successors
+
+    def out_degree(self, u: int) -> int:
+        return self._n - 1
+
+    def has_edge(self, u: int, v: int) -> bool:
+        return u != v and u in self and v in self
+
+    def edges(self) -> Iterator[Tuple[int, int]]:
+        for u in range(self._n):
+            for v in range(self._n):
+                if u != v:
+                    yield (u, v)
+
+    def __repr__(self) -> str:
+        return f"CliqueGraph(n={self._n})"
@@ -1,11 +1,49 @@
 # src/complete.py
 
 import math
-from typing import Dict, List, Tuple
+from collections import deque
+from typing import Dict, List, Tuple, Union
 import networkx as nx
 
+from src.clique_graph import CliqueGraph
+from src.csr_graph import CSRGraph
+
+def shortest_path(
+    G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
+    source: int,
+    target: int
+) -> List[int]:
+    """
+    Unweighted shortest path from `source` to `target`.
+
+    Delegates to networkx for DiGraphs; CSR and other graph types run a
+    plain BFS over `G.successors` that stops at the target, so a nearby
+    target costs only the nodes dequeued before it, never O(n). Raises
+    nx.NetworkXNoPath if `target` is unreachable, matching nx.shortest_path.
+    """
+    if isinstance(G, nx.Graph):
+        return nx.shortest_path(G, source=source, target=target)
+    if source not in G or target not in G:
+        raise nx.NodeNotFound(f"Either source {source} or target {target} is not in G")
+    if isinstance(G, CliqueGraph):
+        return [source] if source == target else [source, target]
+    parent = {source: None}
+    queue = deque([source])
+    while queue:
+        u = queue.popleft()
+        if u == target:
+            path = [u]
+            while parent[path[-1]] is not None:
+                path.append(parent[path[-1]])
+            return path[::-1]
+        for v in G.successors(u):
+            if v not in parent:
+                parent[v] = u
+                queue.append(v)
+    raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+
 def complete(
-    G: nx.DiGraph,
+    G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
     root: int,
     packs: List[List[int]],
     cover_edges: List[Tuple[int, int]],
@@ -28,7 +66,7 @@ def complete(
         reps = [pack[0] for pack in packs[:rho]]
         for rep in reps:
             try:
-                path = nx.shortest_path(G, source=root, target=rep)
+                path = shortest_path(G, root, rep)
                 T.add_nodes_from(path)
                 T.add_edges_from(zip(path, path[1:]))
             except nx.NetworkXNoPath:
@@ -42,7 +80,7 @@ def complete(
         rep = pack[0]
         # path root → rep
         try:
-            path = nx.shortest_path(G, source=root, target=rep)
+            path = shortest_path(G, root, rep)
             T.add_nodes_from(path)
             T.add_edges_from(zip(path, path[1:]))
             # paths rep → each terminal in pack
@@ -50,7 +88,7 @@ def complete(
                 if term == rep:
                     continue
                 try:
-                    subpath = nx.shortest_path(G, source=rep, target=term)
+                    subpath = shortest_path(G, rep, term)
                     T.add_nodes_from(subpath)
                     T.add_edges_from(zip(subpath, subpath[1:]))
                 except nx.NetworkXNoPath:
@@ -75,7 +113,7 @@ def complete(
                 
             try:
                 # path c → term
-                subpath = nx.shortest_path(G, source=c, target=term)
+                subpath = shortest_path(G, c, term)
                 T.add_nodes_from(subpath)
                 T.add_edges_from(zip(subpath, subpath[1:]))
             except nx.NetworkXNoPath:
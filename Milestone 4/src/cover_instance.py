@@ -0,0 +1,318 @@
+# src/cover_instance.py
+
+import math
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+import numpy as np
+import networkx as nx
+
+from src.bfs import bfs_levels, bfs_subtree_nodes, csr_subtree_nodes
+from src.clique_graph import CliqueGraph
+from src.csr_graph import CSRGraph
+from src.sparse_reach import reachability_matrix
+
+def _restriction_masks(
+    G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
+    C: Set[int]
+) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    For CSR graphs, the V \\ C exclude mask and an all-False seen mask
+    shared by every search restricted to C; (None, None) otherwise.
+    """
+    if not isinstance(G, CSRGraph):
+        return None, None
+    exclude = np.ones(G.number_of_nodes(), dtype=bool)
+    exclude[np.fromiter(C, dtype=np.int64, count=len(C))] = False
+    return exclude, np.zeros(G.number_of_nodes(), dtype=bool)
+
+def _crossing_covers(
+    G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
+    A: Set[int],
+    C: Set[int],
+    terminals: Set[int],
+    D_star: int
+) -> Iterator[Tuple[int, Set[int], List[int]]]:
+    """
+    (c, cover, sources) for every c in C with an edge from A and a nonempty
+    cover: the terminals reachable from c within D_star hops restricted to
+    C, found by one search per c, and the a in A with an edge a -> c.
+    """
+    if isinstance(G, CliqueGraph) and D_star >= 1:
+        # every c reaches all of C in one hop, from every a
+        shared = C & terminals
+        if shared:
+            sources = list(A)
+            for c in C:
+                yield c, shared, sources
+        return
+    exclude, scratch = _restriction_masks(G, C)
+    for c in C:
+        sources = [a for a in G.predecessors(c) if a in A]
+        if not sources:
+            continue
+        # BFS from c restricted to C up to depth D_star
+        if exclude is not None:
+            visited = csr_subtree_nodes(G, c, D_star, exclude=exclude, scratch=scratch)
+        else:
+            visited = bfs_subtree_nodes(G, c, D_star, allowed=C)
+        cover = visited & terminals
+        if cover:
+            yield c, cover, sources
+
+def build_cover_instance(
+    G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
+    root: int,
+    terminals: Set[int],
+    packs: List[List[int]],
+    D_star: int,
+    k: int,
+    engine: str = "bfs"
+) -> Tuple[Dict[Tuple[int, int], Set[int]], Dict[int, int], Dict[int, List[int]]]:
+    """
+    Constructs the partition-matroid cover instance after greedy packing.
+    A = {root} ∪ all terminals covered by packs.
+    C = V \\ A.
+    For each edge a->c with a in A, c in C, define the set of terminals
+    reachable from c within D_star hops (restricted to C).
+    Budgets[a] is set to ceil(sqrt(k)) for all a in A.
+
+    The restricted BFS depends only on c, so it runs once per distinct c
+    and every key (a, c) shares the same cover-set object; treat the sets
+    as read-only.
+
+    engine="bfs" runs those searches one by one; engine="sparse" computes
+    every c's reachable terminals together as a sparse boolean
+    sources × terminals matrix (see sparse_reach), which pays off for
+    small D_star on moderately dense graphs.
+
+    Returns: sets, budgets, cover_map
+      - sets: Dict[(a,c), Set[terminal]]
+      - budgets: Dict[a, int]
+      - cover_map: Dict[c, List[terminal]] for complete()
+    """
+    # Determine A and C
+    covered_by_packs = set().union(*packs) if packs else set()
+    A = {root} | covered_by_packs
+    C = set(G.nodes()) - A
+
+    # Budgets: use rho = ceil(sqrt(k)) as degree bound
+    rho = math.ceil(math.sqrt(k))
+    budgets = {a: rho for a in A}
+
+    sets: Dict[Tuple[int, int], Set[int]] = {}
+    cover_map: Dict[int, List[int]] = {}
+    # nonempty cover per distinct crossing c
+    cover_of: Dict[int, Set[int]] = {}
+    if engine not in ("bfs", "sparse"):
+        raise ValueError(f"unknown cover-instance engine {engine!r}")
+    if engine == "sparse" and not (isinstance(G, CliqueGraph) and D_star >= 1):
+        crossing = list(dict.fromkeys(
+            c for a in A for c in G.successors(a) if c in C
+        ))
+        # visited nodes other than c all lie in C
+        term_list = [t for t in terminals if t in C]
+        exclude, _ = _restriction_masks(G, C)
+        if exclude is None:
+            exclude = np.fromiter((u not in C for u in G.nodes()), dtype=bool)
+        reach = reachability_matrix(G, crossing, D_star, targets=term_list,
+                                    exclude=exclude)
+        for i, c in enumerate(crossing):
+            row = reach.indices[reach.indptr[i]:reach.indptr[i + 1]].tolist()
+            if row:
+                cover_of[c] = {term_list[j] for j in row}
+                cover_map[c] = list(cover_of[c])
+    else:
+        previous = None
+        for c, cover, _ in _crossing_covers(G, A, C, terminals, D_star):
+            if cover is not previous:
+                # a clique graph yields one shared cover for every c
+                previous, listed = cover, list(cover)
+            cover_of[c] = cover
+            cover_map[c] = listed
+
+    # One key per a->c edge crossing A->C with a nonempty cover
+    for a in A:
+        for c in G.successors(a):
+            cover = cover_of.get(c)
+            if cover:
+                sets[(a, c)] = cover
+
+    return sets, budgets, cover_map
+
+def stream_cover_instance(
+    G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
+    root: int,
+    terminals: Set[int],
+    packs: List[List[int]],
+    D_star: int,
+    k: int
+) -> Tuple[Dict[int, int], Iterator[Tuple[Tuple[int, int], Set[int]]]]:
+    """
+    build_cover_instance's budgets plus a lazy stream of its (key, cover)
+    pairs, for pmcover_streaming on instances too large to materialize.
+
+    The stream walks the distinct crossing targets c, runs c's restricted
+    search once and yields ((a, c), cover) for every a in A with an edge
+    a -> c, so only one cover set is alive at a time. Pairs come c-major
+    rather than in build_cover_instance's key order; empty covers are
+    skipped.
+    """
+    covered_by_packs = set().union(*packs) if packs else set()
+    A = {root} | covered_by_packs
+    rho = math.ceil(math.sqrt(k))
+    budgets = {a: rho for a in A}
+
+    def pairs() -> Iterator[Tuple[Tuple[int, int], Set[int]]]:
+        C = set(G.nodes()) - A
+        for c, cover, sources in _crossing_covers(G, A, C, terminals, D_star):
+            for a in sources:
+                yield (a, c), cover
+
+    return budgets, pairs()
+
+def reduce_cover_instance(
+    sets: Dict[Tuple[int, int], Set[int]]
+) -> Tuple[Dict[Tuple[int, int], Set[int]], Dict[str, int]]:
+    """
+    Shrink a cover instance before handing it to pmcover.
+
+    Within each partition (anchor a), a key whose cover set is contained in
+    another key's set is dropped: both draw on the same budget, so the
+    larger set is always at least as good. Among equal sets the first key
+    in iteration order is kept, which is the one the greedy variants pick
+    on ties; empty sets are dropped. Identical sets under different
+    anchors are then collapsed onto one shared set object. Key order is
+    preserved.
+
+    Returns (reduced_sets, stats) with stats keys: keys_before, keys_after,
+    distinct_before, distinct_after (distinct cover sets by content), and
+    elements_before, elements_after (sum of set sizes).
+    """
+    by_anchor: Dict[int, List[Tuple[int, int]]] = {}
+    for key in sets:
+        by_anchor.setdefault(key[0], []).append(key)
+
+    kept: Set[Tuple[int, int]] = set()
+    for keys in by_anchor.values():
+        # largest first (stable), so every dominator is kept before the
+        # sets it dominates are examined
+        ordered = sorted(keys, key=lambda key: -len(sets[key]))
+        # element -> kept sets of this anchor containing it
+        holders: Dict[int, List[Set[int]]] = {}
+        for key in ordered:
+            items = sets[key]
+            if not items:
+                # an empty set never has positive gain
+                continue
+            rarest = min(items, key=lambda x: len(holders.get(x, ())))
+            if any(items <= other for other in holders.get(rarest, ())):
+                continue
+            kept.add(key)
+            for x in items:
+                holders.setdefault(x, []).append(items)
+
+    shared: Dict[frozenset, Set[int]] = {}
+    reduced: Dict[Tuple[int, int], Set[int]] = {}
+    for key, items in sets.items():
+        if key in kept:
+            reduced[key] = shared.setdefault(frozenset(items), items)
+
+    stats = {
+        "keys_before": len(sets),
+        "keys_after": len(reduced),
+        "distinct_before": len({frozenset(items) for items in sets.values()}),
+        "distinct_after": len(shared),
+        "elements_before": sum(len(items) for items in sets.values()),
+        "elements_after": sum(len(items) for items in reduced.values()),
+    }
+    return reduced, stats
+
+class CoverDistances:
+    """
+    Restricted hop distances behind build_cover_instance, recorded once up
+    to `max_depth` for a fixed packing, so the cover instance of every
+    D_star ≤ max_depth comes from one traversal per distinct c.
+
+    A and C = V \\ A depend on the packs, so the distances are only valid
+    for the packs they were built with.
+    """
+
+    def __init__(
+        self,
+        G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
+        root: int,
+        terminals: Set[int],
+        packs: List[List[int]],
+        max_depth: int,
+        engine: str = "bfs"
+    ):
+        """
+        :param engine: "bfs" (one restricted search per c) or "sparse"
+                       (one distance matrix for all c, see sparse_reach)
+        """
+        if engine not in ("bfs", "sparse"):
+            raise ValueError(f"unknown cover-instance engine {engine!r}")
+        covered_by_packs = set().union(*packs) if packs else set()
+        self.A = {root} | covered_by_packs
+        C = set(G.nodes()) - self.A
+        self.max_depth = max_depth
+        self.terminals = terminals
+        # crossing edges in the order build_cover_instance emits keys
+        self.edges = [(a, c) for a in self.A for c in G.successors(a) if c in C]
+        crossing = list(dict.fromkeys(c for _, c in self.edges))
+        # c -> terminals grouped by hop distance within C
+        self.levels: Dict[int, List[List[int]]] = {}
+        if isinstance(G, CliqueGraph) and max_depth >= 1:
+            # hop 1 reaches all of C; the shared list repeats c, which the
+            # set union in instance() absorbs
+            shared = list(C & terminals)
+            for c in crossing:
+                self.levels[c] = [[c] if c in terminals else [], shared]
+            return
+        exclude, scratch = _restriction_masks(G, C)
+        if engine == "sparse":
+            term_list = [t for t in terminals if t in C]
+            if exclude is None:
+                exclude = np.fromiter((u not in C for u in G.nodes()), dtype=bool)
+            reach = reachability_matrix(G, crossing, max_depth, targets=term_list,
+                                        exclude=exclude, distances=True)
+            for i, c in enumerate(crossing):
+                lo, hi = reach.indptr[i], reach.indptr[i + 1]
+                by_depth: List[List[int]] = [[] for _ in range(max_depth + 1)]
+                for j, d in zip(reach.indices[lo:hi].tolist(), reach.data[lo:hi].tolist()):
+                    by_depth[d - 1].append(term_list[j])
+                self.levels[c] = by_depth
+            return
+        for c in crossing:
+            if exclude is not None:
+                levels = bfs_levels(G, c, max_depth, exclude=exclude, scratch=scratch)
+            else:
+                levels = bfs_levels(G, c, max_depth, allowed=C)
+            self.levels[c] = [[t for t in level if t in terminals] for level in levels]
+
+    def instance(
+        self,
+        D_star: int,
+        k: int
+    ) -> Tuple[Dict[Tuple[int, int], Set[int]], Dict[int, int], Dict[int, List[int]]]:
+        """build_cover_instance's (sets, budgets, cover_map) at depth D_star."""
+        if D_star > self.max_depth:
+            raise ValueError(
+                f"distances were recorded up to depth {self.max_depth}, not {D_star}"
+            )
+        rho = math.ceil(math.sqrt(k))
+        budgets = {a: rho for a in self.A}
+        sets: Dict[Tuple[int, int], Set[int]] = {}
+        cover_map: Dict[int, List[int]] = {}
+        cover_of: Dict[int, Set[int]] = {}
+        for a, c in self.edges:
+            cover = cover_of.get(c)
+            if cover is None:
+                cover = set()
+                for level in self.levels[c][:D_star + 1]:
+                    cover.update(level)
+                cover_of[c] = cover
+                if cover:
+                    cover_map[c] = list(cover)
+            if cover:
+                sets[(a, c)] = cover
+        return sets, budgets, cover_map
@@ -0,0 +1,182 @@
+# src/csr_graph.py
+
+from typing import Iterator, List, Optional, Tuple
+import numpy as np
+import networkx as nx
+
+
+class CSRGraph:
+    """
+    Read-only directed graph stored in compressed-sparse-row form.
+
+    Nodes are the contiguous integers 0..n-1. The successors of u are
+    indices[indptr[u]:indptr[u+1]]. The class exposes the subset of the
+    networkx.DiGraph API used by the pipeline (nodes, successors,
+    predecessors, out_degree, membership), so every stage accepts it in
+    place of a DiGraph.
+
+    `labels`, if given, maps each internal id to the node's original id
+    (e.g. the ids in a SNAP edge list) and must be sorted ascending.
+    """
+
+    def __init__(
+        self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        labels: Optional[np.ndarray] = None
+    ):
+        indptr = np.asanyarray(indptr)
+        indices = np.asanyarray(indices)
+        if indptr.ndim != 1 or len(indptr) == 0:
+            raise ValueError("indptr must be a non-empty 1-D array")
+        if indptr[-1] != len(indices):
+            raise ValueError("indptr[-1] must equal len(indices)")
+        if labels is not None and len(labels) != len(indptr) - 1:
+            raise ValueError("labels must have one entry per node")
+        self.indptr = indptr
+        self.indices = indices
+        self.labels = labels
+        self._n = len(indptr) - 1
+        self._rev: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def from_edges(
+        cls,
+        n: int,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        labels: Optional[np.ndarray] = None
+    ) -> "CSRGraph":
+        """
+        Build a CSR graph on n nodes from parallel arrays of edge endpoints.
+        Successors of each node are stored in ascending order.
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        for ends in (sources, targets):
+            if len(ends) and (ends.min() < 0 or ends.max() >= n):
+                raise ValueError(f"edge endpoints must lie in 0..{n - 1}")
+        order = np.lexsort((targets, sources))
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+        indices = targets[order].astype(_index_dtype(n), copy=False)
+        return cls(indptr, indices, labels)
+
+    # --- networkx-compatible read API ---------------------------------
+
+    def number_of_nodes(self) -> int:
+        return self._n
+
+    def number_of_edges(self) -> int:
+        return int(self.indptr[-1])
+
+    def nodes(self) -> range:
+        return range(self._n)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._n))
+
+    def __contains__(self, u) -> bool:
+        try:
+            return 0 <= u < self._n and int(u) == u
+        except TypeError:
+            return False
+
+    def successors(self, u: int) -> List[int]:
+        return self.indices[self.indptr[u]:self.indptr[u + 1]].tolist()
+
+    neighbors = successors
+
+    def predecessors(self, u: int) -> List[int]:
+        rev_indptr, rev_indices = self.reverse_arrays()
+        return rev_indices[rev_indptr[u]:rev_indptr[u + 1]].tolist()
+
+    def out_degree(self, u: int) -> int:
+        return int(self.indptr[u + 1] - self.indptr[u])
+
+    def has_edge(self, u: int, v: int) -> bool:
+        if u not in self or v not in self:
+            return False
+        row = self.indices[self.indptr[u]:self.indptr[u + 1]]
+        return bool(np.any(row == v))
+
+    def edges(self) -> Iterator[Tuple[int, int]]:
+        for u in range(self._n):
+            for v in self.successors(u):
+                yield (u, v)
+
+    # --- array access --------------------------------------------------
+
+    def node_ids(self, labels) -> np.ndarray:
+        """
+        Translate original node labels into internal ids.
+        Raises KeyError if a label is not present in the graph.
+        """
+        labels = np.asarray(labels)
+        if self.labels is None:
+            ids = labels.astype(np.int64)
+            if len(ids) and (ids.min() < 0 or ids.max() >= self._n):
+                raise KeyError("label out of range")
+            return ids
+        ids = np.searchsorted(self.labels, labels)
+        ids = np.minimum(ids, self._n - 1)
+        if len(ids) and not np.array_equal(self.labels[ids], labels):
+            raise KeyError("label not in graph")
+        return ids
+
+    def reverse_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (indptr, indices) of the transposed graph, built on first use.
+        """
+        if self._rev is None:
+            sources = np.repeat(
+                np.arange(self._n, dtype=np.int64), np.diff(self.indptr)
+            )
+            rev = CSRGraph.from_edges(self._n, self.indices, sources)
+            self._rev = (rev.indptr, rev.indices)
+        return self._rev
+
+    def __repr__(self) -> str:
+        return (f"CSRGraph(n={self._n}, m={self.number_of_edges()})")
+
+
+def _index_dtype(n: int):
+    return np.int32 if n < 2**31 else np.int64
+
+
+def from_networkx(G: nx.DiGraph) -> CSRGraph:
+    """
+    Convert a networkx DiGraph whose nodes are exactly 0..n-1 into a CSRGraph.
+    Successor order follows the networkx adjacency order, so traversals
+    visit nodes in the same order on both representations.
+
+    Relabel arbitrary graphs first with nx.convert_node_labels_to_integers.
+    """
+    n = G.number_of_nodes()
+    if any(not isinstance(u, (int, np.integer)) or not 0 <= u < n
+           for u in G.nodes()):
+        raise ValueError(
+            "from_networkx requires nodes labeled 0..n-1; "
+            "use nx.convert_node_labels_to_integers first"
+        )
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    for u in range(n):
+        indptr[u + 1] = G.out_degree(u)
+    np.cumsum(indptr, out=indptr)
+    indices = np.fromiter(
+        (v for u in range(n) for v in G.successors(u)),
+        dtype=_index_dtype(n),
+        count=int(indptr[-1])
+    )
+    return CSRGraph(indptr, indices)
+
+
+def to_networkx(G: CSRGraph) -> nx.DiGraph:
+    """Convert a CSRGraph back into a networkx DiGraph."""
+    H = nx.DiGraph()
+    H.add_nodes_from(G.nodes())
+    H.add_edges_from(G.edges())
+    return H
@@ -1,5 +1,9 @@
 import networkx as nx
-from typing import Optional
+import numpy as np
+from typing import Optional, Union
+
+from src.clique_graph import CliqueGraph
+from src.csr_graph import CSRGraph
 
 def generate_directed_ER(n: int, p: float, seed: Optional[int] = None) -> nx.DiGraph:
     """
@@ -14,13 +18,119 @@ def generate_directed_ER(n: int, p: float, seed: Optional[int] = None) -> nx.DiG
     """
     return nx.gnp_random_graph(n, p, seed=seed, directed=True)
 
-def generate_directed_clique(n: int) -> nx.DiGraph:
+def generate_sparse_directed_ER(
+    n: int,
+    p: float,
+    seed: Optional[int] = None
+) -> CSRGraph:
+    """
+    Generate a random directed Erdős–Rényi graph G(n, p) directly as a CSRGraph.
+
+    The n·(n-1) candidate edges are enumerated row-major (u, then v ≠ u) and
+    the gaps between consecutive kept edges are drawn as geometric variates,
+    so the work is O(n + m) rather than O(n²). Edge indices come out sorted,
+    which lets them be written straight into CSR arrays.
+
+    :param n: number of nodes (labeled 0..n-1)
+    :param p: edge-creation probability
+    :param seed: optional random seed for reproducibility
+    :return: a CSRGraph instance
+    """
+    if not 0.0 <= p <= 1.0:
+        raise ValueError("p must be in [0, 1]")
+    total = n * (n - 1)
+    if p == 0.0 or total == 0:
+        return CSRGraph.from_edges(n, np.empty(0, np.int64), np.empty(0, np.int64))
+
+    rng = np.random.default_rng(seed)
+    chunks = []
+    last = -1
+    while last < total - 1:
+        expected = (total - 1 - last) * p
+        size = int(expected + 4.0 * np.sqrt(expected) + 16)
+        positions = last + np.cumsum(rng.geometric(p, size=size))
+        chunks.append(positions)
+        last = int(positions[-1])
+    edge_ids = np.concatenate(chunks)
+    edge_ids = edge_ids[edge_ids < total]
+
+    # position r in row u skips the diagonal entry (u, u)
+    sources = edge_ids // (n - 1)
+    targets = edge_ids % (n - 1)
+    targets += targets >= sources
+    return CSRGraph.from_edges(n, sources, targets)
+
+def load_edge_list(
+    path: str,
+    comments: str = "#",
+    chunk_lines: int = 1_000_000
+) -> CSRGraph:
+    """
+    Load a plain-text directed edge list (SNAP style) into a CSRGraph.
+
+    Each non-comment line holds "u v" (extra columns are ignored) and
+    duplicate edges are dropped. Node ids may be arbitrary integers; they
+    are relabeled to 0..n-1 in ascending order and the original ids are
+    kept in `G.labels`.
+    The file is parsed in chunks of `chunk_lines` lines.
+
+    :param path: path to the edge-list file
+    :param comments: prefix marking comment lines
+    :param chunk_lines: number of lines parsed per NumPy batch
+    :return: a CSRGraph instance
+    """
+    sources, targets = [], []
+
+    def flush(lines):
+        ncols = len(lines[0].split())
+        if ncols < 2:
+            raise ValueError(f"expected at least two columns per edge in {path}")
+        arr = np.array(" ".join(lines).split(), dtype=np.int64)
+        if len(arr) != ncols * len(lines):
+            raise ValueError(f"inconsistent column count in {path}")
+        arr = arr.reshape(-1, ncols)
+        sources.append(arr[:, 0])
+        targets.append(arr[:, 1])
+
+    with open(path) as fh:
+        lines = []
+        for line in fh:
+            line = line.strip()
+            if not line or line.startswith(comments):
+                continue
+            lines.append(line)
+            if len(lines) >= chunk_lines:
+                flush(lines)
+                lines = []
+        if lines:
+            flush(lines)
+
+    if not sources:
+        return CSRGraph.from_edges(0, np.empty(0, np.int64), np.empty(0, np.int64))
+    src = np.concatenate(sources)
+    dst = np.concatenate(targets)
+    labels, ids = np.unique(np.concatenate([src, dst]), return_inverse=True)
+    ids = ids.reshape(-1)
+    n = len(labels)
+    # drop duplicate edges, as a DiGraph would
+    edge_ids = np.unique(ids[:len(src)] * n + ids[len(src):])
+    return CSRGraph.from_edges(n, edge_ids // n, edge_ids % n, labels)
+
+def generate_directed_clique(
+    n: int,
+    implicit: bool = False
+) -> Union[nx.DiGraph, CliqueGraph]:
     """
     Generate a directed clique on n nodes (every ordered pair except self-loops).
     
     :param n: number of nodes (labeled 0..n-1)
-    :return: a networkx.DiGraph instance with edges u→v for all u != v
+    :param implicit: return an O(1)-memory CliqueGraph instead of
+                     materializing the n·(n-1) edges
+    :return: a networkx.DiGraph instance with edges u→v for all u != v,
+             or a CliqueGraph if `implicit` is set
     """
+    if implicit:
+        return CliqueGraph(n)
     G = nx.DiGraph()
     G.add_nodes_from(range(n))
     for u in range(n):
@@ -1,35 +1,60 @@
+import heapq
 import math
-from collections import deque
-from typing import List, Set
+from typing import Dict, List, Optional, Set, Tuple, Union
 import networkx as nx
 
-def bfs_subtree_nodes(
-    G: nx.DiGraph,
-    source: int,
-    max_depth: int
-) -> Set[int]:
+from src.ball_index import BallIndex, TerminalBallIndex
+from src.bfs import bfs_subtree_nodes
+from src.bitset import BitIndexer, popcount
+from src.clique_graph import CliqueGraph
+from src.csr_graph import CSRGraph
+from src.parallel_packing import parallel_greedy_packing
+from src.sketch_packing import sketch_greedy_packing
+
+# Terminal subsets are sets, or int bitmaps when bitset=True
+TermSet = Union[Set[int], int]
+
+# Largest |T|/n for which engine="auto" counts coverage from the terminals
+REVERSE_ENGINE_MAX_RATIO = 0.1
+
+def build_ball_index(
+    G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
+    terminals: Set[int],
+    max_depth: int,
+    engine: str = "auto",
+    distances: bool = False
+) -> Union[BallIndex, TerminalBallIndex]:
     """
-    Perform a breadth‐first search from `source` up to `max_depth` hops,
-    and return the set of all visited nodes.
+    The ball index find_greedy_packing would build for `engine` ("auto",
+    "forward", "sparse" or "reverse"). With `distances=True` it keeps hop
+    distances, so one index at the largest depth of a D_star sweep serves
+    every smaller depth.
     """
-    visited = {source}
-    queue = deque([(source, 0)])
-    while queue:
-        u, depth = queue.popleft()
-        if depth >= max_depth:
-            continue
-        for v in G.successors(u):
-            if v not in visited:
-                visited.add(v)
-                queue.append((v, depth + 1))
-    return visited
+    if engine == "auto":
+        ratio = len(terminals) / max(1, G.number_of_nodes())
+        engine = "reverse" if ratio <= REVERSE_ENGINE_MAX_RATIO else "forward"
+    if engine == "forward":
+        return BallIndex(G, max_depth, distances=distances)
+    if engine == "sparse":
+        return BallIndex(G, max_depth, engine="sparse", distances=distances)
+    if engine == "reverse":
+        return TerminalBallIndex(G, max_depth, terminals, distances=distances)
+    raise ValueError(f"unknown packing engine {engine!r}")
 
 def find_greedy_packing(
-    G: nx.DiGraph,
+    G: Union[nx.DiGraph, CSRGraph, CliqueGraph],
     root: int,
     terminals: Set[int],
     k: int,
-    D_star: int
+    D_star: int,
+    ball_index: Optional[Union[BallIndex, TerminalBallIndex]] = None,
+    lazy: bool = False,
+    engine: str = "auto",
+    bitset: bool = False,
+    workers: int = 1,
+    sketch_size: int = 32,
+    exact_top: int = 16,
+    seed: Optional[int] = None
 ) -> List[List[int]]:
     """
     Extract up to rho = ceil(sqrt(k)) vertex‐disjoint subtrees of height ≤ D_star,
@@ -38,43 +63,134 @@ def find_greedy_packing(
     
     When k > 1, tries to find packs that cover at least rho terminals each.
     When k = 1, includes any pack that covers at least one terminal.
+
+    Candidate balls come from `ball_index` (a BallIndex or
+    TerminalBallIndex of depth D_star); if none is given one is built for
+    this call, so each ball is computed once instead of once per round.
+    Pass a prebuilt index to share it across queries on the same graph;
+    an index built with distances=True at a larger depth also serves every
+    smaller D_star (see BallIndex.at_depth), e.g. for a D_star sweep.
+    `engine` picks the index to build: "forward" (a ball per node),
+    "reverse" (a backward ball per terminal, cheaper when |T| ≪ n),
+    "sparse" (the forward index built by sparse boolean matrix products,
+    see sparse_reach) or "auto", which uses "reverse" when
+    |T|/n ≤ REVERSE_ENGINE_MAX_RATIO. When a pack is accepted, the index's
+    reverse map marks exactly the candidates whose balls it touches as
+    dead, so later rounds skip blocked candidates without traversing them.
+
+    engine="sketch" is an approximate mode for graphs too large for exact
+    balls (see sketch_packing): coverage is estimated from min-hash
+    sketches of `sketch_size` values per node, and only the `exact_top`
+    best candidates per round are evaluated exactly. `seed` seeds the
+    sketches.
+
+    With `lazy=True` candidates sit in a max-heap keyed on their last known
+    coverage. Coverage only shrinks as terminals get covered and nodes get
+    used, so a stale key is an upper bound and only the heap top needs to
+    be re-evaluated each round. Ties are broken exactly as in the full
+    scan, so both modes return the same packs.
+
+    With `bitset=True` the terminals covered by each ball and the set of
+    remaining terminals are Python big-int bitmaps over the terminals, so
+    coverage is a word-parallel AND plus popcount instead of per-element
+    hash probes. For k = 1 the lowest-indexed terminal is kept, which may
+    differ from the element the set path happens to iterate first.
+
+    With `workers > 1` each round's candidate scan is sharded across a
+    process pool over a shared-memory CSR copy of the graph (see
+    parallel_packing); no ball index is built and `ball_index`, `lazy`,
+    `engine` and `bitset` do not apply. Packs match the serial scan.
     """
     rho = math.ceil(math.sqrt(k))
     packs: List[List[int]] = []
+    if isinstance(G, CliqueGraph) and D_star >= 1 and root in G:
+        # every depth-≥1 ball is the whole clique, so each one contains root
+        return packs
+    if engine == "sketch":
+        return sketch_greedy_packing(G, root, terminals, k, D_star,
+                                     sketch_size=sketch_size,
+                                     exact_top=exact_top, seed=seed)
+    if workers > 1:
+        if ball_index is not None:
+            raise ValueError("ball_index cannot be combined with workers > 1")
+        return parallel_greedy_packing(G, root, terminals, k, D_star, workers)
     # Candidate nodes for subtree roots 
     candidates = set(G.nodes()) - {root}
+    if ball_index is None:
+        ball_index = build_ball_index(G, terminals, D_star, engine)
+    elif ball_index.max_depth != D_star:
+        # a deeper index built with distances=True narrows to D_star
+        ball_index = ball_index.at_depth(D_star)
+    if (isinstance(ball_index, TerminalBallIndex)
+            and not ball_index.terminals.issuperset(terminals)):
+        raise ValueError("ball_index was built for a different terminal set")
+    # Terminals inside each candidate's ball, computed on first use
+    all_terms = set(terminals)
+    ball_terms: Dict[int, TermSet] = {}
     # Terminals not yet covered
-    remaining_terms = set(terminals)
-    # Keep track of used nodes to ensure disjointness
-    used_nodes = {root}
+    if bitset:
+        indexer = BitIndexer(all_terms)
+        size = popcount
+        remaining_terms: TermSet = (1 << len(indexer)) - 1
+    else:
+        size = len
+        remaining_terms = set(terminals)
+    # Disjointness: a candidate is dead once its ball contains the root or
+    # a node of an accepted pack, which the reverse ball index reports
+    # directly when that node gets used
+    dead: Set[int] = set()
+    if root in G:
+        dead.update(ball_index.containing(root))
+
+    def candidate_cover(c) -> Optional[TermSet]:
+        """Remaining terminals c's subtree would cover, or None if blocked."""
+        # Skip if c's subtree overlaps the root or an accepted pack
+        if c in dead:
+            return None
+        if c not in ball_terms:
+            in_ball = ball_index.terminals_in_ball(c, all_terms)
+            ball_terms[c] = indexer.to_bits(in_ball) if bitset else in_ball
+        cover = ball_terms[c] & remaining_terms
+        # For k=1, take only the first terminal found
+        if k == 1 and cover:
+            cover = cover & -cover if bitset else {next(iter(cover))}
+        return cover
+
+    # Lazy mode: heap of (-coverage upper bound, scan position, node)
+    heap: List[Tuple[int, int, int]] = []
+    if lazy:
+        for i, c in enumerate(candidates):
+            cover = candidate_cover(c)
+            if cover:
+                heap.append((-size(cover), i, c))
+        heapq.heapify(heap)
     
     # Try to find up to rho packs
     while len(packs) < rho and remaining_terms:
         best_node = None
-        best_cover: Set[int] = set()
-        best_subtree: Set[int] = set()
+        best_cover: TermSet = 0 if bitset else set()
 
-        # Find the node whose depth‐D_star subtree covers the most remaining terminals
-        for c in candidates:
-            # Skip if this node is already used
-            if c in used_nodes:
-                continue
-                
-            subtree_nodes = bfs_subtree_nodes(G, c, D_star)
-            # Skip if subtree contains any used nodes (ensuring disjointness)
-            if not subtree_nodes.isdisjoint(used_nodes):
-                continue
-                
-            cover = subtree_nodes & remaining_terms
-            
-            # For k=1, take only the first terminal found
-            if k == 1 and cover:
-                cover = {next(iter(cover))}
-                
-            if len(cover) > len(best_cover):
-                best_node = c
-                best_cover = cover
-                best_subtree = subtree_nodes
+        if lazy:
+            # Re-evaluate the heap top until its stored bound is exact
+            while heap:
+                neg_est, i, c = heap[0]
+                cover = candidate_cover(c)
+                if not cover:
+                    # blocked or exhausted candidates never recover
+                    heapq.heappop(heap)
+                elif size(cover) == -neg_est:
+                    heapq.heappop(heap)
+                    best_node, best_cover = c, cover
+                    break
+                else:
+                    heapq.heapreplace(heap, (-size(cover), i, c))
+        else:
+            # Find the node whose depth‐D_star subtree covers the most remaining terminals
+            for c in candidates:
+                cover = candidate_cover(c)
+                if cover is not None and size(cover) > size(best_cover):
+                    best_node = c
+                    best_cover = cover
 
         # Stop if no more coverage is possible
         if not best_cover:
@@ -84,10 +200,15 @@ def find_greedy_packing(
         min_coverage = 1  # Always accept at least one terminal
             
         # If we found a valid pack, record it
-        if len(best_cover) >= min_coverage:
-            packs.append(list(best_cover))
-            used_nodes.update(best_subtree)
-            remaining_terms -= best_cover
+        if size(best_cover) >= min_coverage:
+            if bitset:
+                packs.append(indexer.from_bits(best_cover))
+                remaining_terms &= ~best_cover
+            else:
+                packs.append(list(best_cover))
+                remaining_terms -= best_cover
+            for u in ball_index.ball(best_node):
+                dead.update(ball_index.containing(u))
         else:
             # If no valid subtree found, we're done
             break
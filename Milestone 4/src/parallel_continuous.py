@@ -0,0 +1,160 @@
+# src/parallel_continuous.py
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import scipy.sparse as sp
+
+from src.shm import ArraySpecs, attach_arrays, share_array
+
+# Per-worker views of the shared arrays, set up by _init_worker
+_shared: Dict[str, np.ndarray] = {}
+_handles: List[shared_memory.SharedMemory] = []
+
+def _init_worker(specs: ArraySpecs):
+    """Attach to the shared arrays once per worker process."""
+    _shared.clear()
+    attach_arrays(specs, _shared, _handles)
+
+def _terminal_block(t0: int, t1: int, sampled: bool):
+    """
+    uncovered[t0:t1]: probability that each terminal is left uncovered by
+    R ~ x, or (sampled) the per-sample mask of terminals no drawn key hits.
+    """
+    t_indptr, t_keys = _shared["t_indptr"], _shared["t_keys"]
+    lo, hi = int(t_indptr[t0]), int(t_indptr[t1])
+    if sampled:
+        block = sp.csr_matrix(
+            (np.ones(hi - lo), t_keys[lo:hi], t_indptr[t0:t1 + 1] - lo),
+            shape=(t1 - t0, len(_shared["x"]))
+        )
+        hits = block @ _shared["drawn"].T.astype(np.float64)
+        _shared["uncovered"][t0:t1] = hits == 0
+    else:
+        x = _shared["x"]
+        _shared["uncovered"][t0:t1] = np.multiply.reduceat(
+            1.0 - x[t_keys[lo:hi]], t_indptr[t0:t1] - lo
+        )
+
+def _key_block(k0: int, k1: int, sampled: bool):
+    """grad[k0:k1] from the uncovered values of the keys' terminals."""
+    k_indptr, k_terms = _shared["k_indptr"], _shared["k_terms"]
+    uncovered = _shared["uncovered"]
+    lo, hi = int(k_indptr[k0]), int(k_indptr[k1])
+    if sampled:
+        block = sp.csr_matrix(
+            (np.ones(hi - lo), k_terms[lo:hi], k_indptr[k0:k1 + 1] - lo),
+            shape=(k1 - k0, len(uncovered))
+        )
+        gains = block @ uncovered
+        gains[_shared["drawn"][:, k0:k1].T.astype(bool)] = 0.0
+        _shared["grad"][k0:k1] = gains.mean(axis=1)
+    else:
+        owner = np.repeat(np.arange(k1 - k0), np.diff(k_indptr[k0:k1 + 1]))
+        _shared["grad"][k0:k1] = np.bincount(
+            owner, weights=uncovered[k_terms[lo:hi]], minlength=k1 - k0
+        )
+
+def _ranges(indptr: np.ndarray, n_shards: int) -> List[Tuple[int, int]]:
+    """Split rows of `indptr` into contiguous ranges of about equal entries."""
+    n = len(indptr) - 1
+    cuts = np.searchsorted(indptr, np.linspace(0, indptr[-1], n_shards + 1))
+    cuts[0], cuts[-1] = 0, n
+    cuts = np.maximum.accumulate(np.minimum(cuts, n))
+    return [(int(s), int(e)) for s, e in zip(cuts, cuts[1:]) if e > s]
+
+class ParallelGradient:
+    """
+    Gradient of the coverage multilinear extension (exact, or estimated
+    from a shared Bernoulli sample matrix) for pmcover_continuous, with the
+    work split across a process pool.
+
+    The key/terminal incidence lives in multiprocessing.shared_memory, both
+    terminal-major and key-major. Each call broadcasts x (and the drawn
+    samples) into shared buffers, then runs two phases: workers fill the
+    per-terminal uncovered values for ranges of terminals, then the
+    gradient for ranges of keys. Every terminal product and every key sum
+    is taken in the same order as the serial code, so gradients are
+    bit-identical to it. Use as a context manager or call close().
+    """
+
+    def __init__(
+        self,
+        key_idx: np.ndarray,
+        term_idx: np.ndarray,
+        n_keys: int,
+        n_terms: int,
+        workers: int,
+        samples: int = 0,
+        shards_per_worker: int = 4
+    ):
+        """
+        :param key_idx, term_idx: incidence pairs sorted by terminal, keys
+                                  ascending within a terminal
+        :param samples: rows of the shared sample matrix (0: exact gradient)
+        """
+        self.sampled = samples > 0
+        # key-major copy keeps terminals ascending within each key
+        by_key = np.argsort(key_idx, kind="stable")
+        t_indptr = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_idx, minlength=n_terms), out=t_indptr[1:])
+        k_indptr = np.zeros(n_keys + 1, dtype=np.int64)
+        np.cumsum(np.bincount(key_idx, minlength=n_keys), out=k_indptr[1:])
+        arrays = {
+            "t_indptr": t_indptr,
+            "t_keys": np.ascontiguousarray(key_idx),
+            "k_indptr": k_indptr,
+            "k_terms": np.ascontiguousarray(term_idx[by_key]),
+            "x": np.zeros(n_keys),
+            "grad": np.zeros(n_keys),
+            "uncovered": np.zeros((n_terms, samples) if self.sampled else n_terms),
+        }
+        if self.sampled:
+            arrays["drawn"] = np.zeros((samples, n_keys), dtype=np.uint8)
+
+        n_shards = max(1, workers * shards_per_worker)
+        self._term_ranges = _ranges(t_indptr, n_shards)
+        self._key_ranges = _ranges(k_indptr, n_shards)
+        self._handles: List[shared_memory.SharedMemory] = []
+        self._views: Dict[str, np.ndarray] = {}
+        self._pool = None
+        try:
+            specs: ArraySpecs = {}
+            for name, array in arrays.items():
+                shm, self._views[name] = share_array(array)
+                self._handles.append(shm)
+                specs[name] = (shm.name, array.shape, array.dtype.str)
+            self._pool = mp.Pool(workers, initializer=_init_worker, initargs=(specs,))
+        except BaseException:
+            self.close()
+            raise
+
+    def gradient(self, x: np.ndarray, drawn: Optional[np.ndarray] = None) -> np.ndarray:
+        """Gradient at x, from the samples × m Bernoulli draws if sampled."""
+        self._views["x"][...] = x
+        if self.sampled:
+            self._views["drawn"][...] = drawn
+        self._pool.starmap(_terminal_block,
+                           [(s, e, self.sampled) for s, e in self._term_ranges])
+        self._pool.starmap(_key_block,
+                           [(s, e, self.sampled) for s, e in self._key_ranges])
+        return self._views["grad"].copy()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        # views must be released before their buffers can be closed
+        self._views.clear()
+        for shm in self._handles:
+            shm.close()
+            shm.unlink()
+        self._handles = []
+
+    def __enter__(self) -> "ParallelGradient":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,157 @@
+# src/parallel_packing.py
+
+import math
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Dict, List, Set, Tuple, Union
+import numpy as np
+import networkx as nx
+
+from src.bfs import bfs_subtree_nodes
+from src.csr_graph import CSRGraph, from_networkx
+from src.shm import ArraySpecs, attach_arrays, share_array
+
+# Per-worker views of the shared arrays, set up by _init_worker
+_shared: Dict[str, np.ndarray] = {}
+_handles: List[shared_memory.SharedMemory] = []
+
+def _init_worker(specs: ArraySpecs, D_star: int, k: int):
+    """Attach to the shared arrays once per worker process."""
+    _shared.clear()
+    attach_arrays(specs, _shared, _handles)
+    _shared["D_star"] = D_star
+    _shared["k"] = k
+
+def _scan_shard(start: int, end: int) -> Tuple[int, int]:
+    """
+    Evaluate candidates order[start:end] against the current round state.
+
+    Returns (best coverage, scan position) of the shard, with ties going to
+    the smallest position. Candidates whose ball touches a used node are
+    flagged in the shared `dead` mask, which only this shard writes for
+    these positions, so they are skipped in later rounds.
+    """
+    indptr, indices = _shared["indptr"], _shared["indices"]
+    order, dead = _shared["order"], _shared["dead"]
+    used, remaining = _shared["used"], _shared["remaining"]
+    D_star, k = _shared["D_star"], _shared["k"]
+    best_count, best_pos = 0, -1
+    for pos in range(start, end):
+        if dead[pos]:
+            continue
+        c = int(order[pos])
+        # depth-bounded BFS from c, abandoned as soon as it hits a used node
+        blocked = bool(used[c])
+        visited = {c}
+        frontier = [c]
+        depth = 0
+        while frontier and depth < D_star and not blocked:
+            nxt = []
+            for u in frontier:
+                for v in indices[indptr[u]:indptr[u + 1]].tolist():
+                    if v in visited:
+                        continue
+                    if used[v]:
+                        blocked = True
+                        break
+                    visited.add(v)
+                    nxt.append(v)
+                if blocked:
+                    break
+            frontier = nxt
+            depth += 1
+        if blocked:
+            dead[pos] = 1
+            continue
+        count = int(remaining[np.fromiter(visited, dtype=np.int64)].sum())
+        if k == 1:
+            count = min(count, 1)
+        if count > best_count:
+            best_count, best_pos = count, pos
+    return best_count, best_pos
+
+def parallel_greedy_packing(
+    G: Union[nx.DiGraph, CSRGraph],
+    root: int,
+    terminals: Set[int],
+    k: int,
+    D_star: int,
+    workers: int,
+    shards_per_worker: int = 4
+) -> List[List[int]]:
+    """
+    find_greedy_packing with each round's candidate scan sharded across a
+    process pool.
+
+    The CSR arrays, the terminal/used masks and the scan order live in
+    multiprocessing.shared_memory, so nothing is pickled per task beyond a
+    (start, end) range. Shards report their best (coverage, scan position)
+    and the global winner is the maximum coverage with the smallest
+    position, which is exactly the tie-breaking of the serial scan.
+    The graph must have nodes 0..n-1 (networkx graphs are converted).
+    """
+    rho = math.ceil(math.sqrt(k))
+    packs: List[List[int]] = []
+    if not isinstance(G, CSRGraph):
+        G = from_networkx(G)
+    n = G.number_of_nodes()
+    # Same scan order as the serial implementation
+    candidates = set(G.nodes()) - {root}
+    order = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+    all_terms = set(terminals)
+    remaining_terms = set(terminals)
+
+    term_mask = np.zeros(n, dtype=np.uint8)
+    term_ids = [t for t in all_terms if t in G]
+    term_mask[term_ids] = 1
+    used_mask = np.zeros(n, dtype=np.uint8)
+    if root in G:
+        used_mask[root] = 1
+    arrays = {
+        "indptr": np.ascontiguousarray(G.indptr),
+        "indices": np.ascontiguousarray(G.indices),
+        "order": order,
+        "dead": np.zeros(len(order), dtype=np.uint8),
+        "used": used_mask,
+        "remaining": term_mask,
+    }
+    handles: List[shared_memory.SharedMemory] = []
+    views: Dict[str, np.ndarray] = {}
+    try:
+        specs: ArraySpecs = {}
+        for name, array in arrays.items():
+            shm, views[name] = share_array(array)
+            handles.append(shm)
+            specs[name] = (shm.name, array.shape, array.dtype.str)
+
+        n_shards = max(1, workers * shards_per_worker)
+        bounds = np.linspace(0, len(order), n_shards + 1).astype(int)
+        ranges = [(int(s), int(e)) for s, e in zip(bounds, bounds[1:]) if e > s]
+
+        with mp.Pool(workers, initializer=_init_worker,
+                     initargs=(specs, D_star, k)) as pool:
+            while len(packs) < rho and remaining_terms:
+                results = pool.starmap(_scan_shard, ranges)
+                best_count, best_pos = 0, -1
+                for count, pos in results:
+                    if count > best_count:
+                        best_count, best_pos = count, pos
+                # Stop if no more coverage is possible
+                if best_count == 0:
+                    break
+                c = int(order[best_pos])
+                ball = bfs_subtree_nodes(G, c, D_star)
+                cover = all_terms.intersection(sorted(ball)) & remaining_terms
+                if k == 1:
+                    cover = {next(iter(cover))}
+                packs.append(list(cover))
+                remaining_terms -= cover
+                views["used"][list(ball)] = 1
+                views["remaining"][[t for t in cover if t in G]] = 0
+    finally:
+        # views must be released before their buffers can be closed
+        views.clear()
+        for shm in handles:
+            shm.close()
+            shm.unlink()
+    return packs
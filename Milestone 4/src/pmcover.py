@@ -1,9 +1,12 @@
 from typing import Dict, List, Set, Tuple
 
+from src.bitset import BitIndexer, popcount
+
 def pmcover_half(
     sets: Dict[Tuple[int, int], Set[int]],
     budgets: Dict[int, int],
-    k: int
+    k: int,
+    bitset: bool = False
 ) -> List[Tuple[int, int]]:
     """
     Greedy 1/2‐approximation for the partition‐matroid coverage instance.
@@ -11,13 +14,20 @@ def pmcover_half(
     :param sets: mapping from keys (a, c) to the set of terminals covered by c
     :param budgets: mapping from each a to its maximum allowed selections (B*)
     :param k: number of terminals we still need to cover (k_rem)
+    :param bitset: hold the cover sets and the covered set as big-int
+                   bitmaps over the terminals, so each marginal gain is an
+                   AND-NOT plus popcount; the selection is unchanged
     :return: list of selected keys (a, c)
     """
+    if bitset:
+        indexer = BitIndexer(set().union(*sets.values()) if sets else ())
+        items_of = {key: indexer.to_bits(items) for key, items in sets.items()}
+        covered_bits = 0
     covered: Set[int] = set()
     selected: List[Tuple[int, int]] = []
     used: Dict[int, int] = {a: 0 for a in budgets}
 
-    while len(covered) < k:
+    while (popcount(covered_bits) if bitset else len(covered)) < k:
         best_key = None
         best_gain = 0
 
@@ -27,7 +37,10 @@ def pmcover_half(
             if used.get(a, 0) >= budgets.get(a, 0):
                 continue
             # marginal gain = uncovered items this key would cover
-            gain = len(items - covered)
+            if bitset:
+                gain = popcount(items_of[key] & ~covered_bits)
+            else:
+                gain = len(items - covered)
             if gain > best_gain:
                 best_gain = gain
                 best_key = key
@@ -40,6 +53,9 @@ def pmcover_half(
         selected.append(best_key)
         a, _ = best_key
         used[a] = used.get(a, 0) + 1
-        covered |= sets[best_key]
+        if bitset:
+            covered_bits |= items_of[best_key]
+        else:
+            covered |= sets[best_key]
 
     return selected
@@ -0,0 +1,285 @@
+# src/pmcover_auto.py
+
+import math
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import numpy as np
+from scipy.optimize import nnls
+
+from src.pmcover import pmcover_half
+from src.pmcover_bitmatrix import pmcover_bitmatrix
+from src.pmcover_continuous import pmcover_continuous
+from src.pmcover_incremental import pmcover_incremental
+from src.pmcover_lazy import pmcover_lazy
+from src.pmcover_stochastic import pmcover_stochastic
+from src.pmcover_streaming import pmcover_streaming
+
+Engine = Callable[..., List[Tuple[int, int]]]
+
+# name -> engine(sets, budgets, k, **options)
+ENGINES: Dict[str, Engine] = {}
+
+def register_engine(name: str, engine: Engine):
+    """
+    Make `engine` available as pmcover(..., method=name). It is called as
+    engine(sets, budgets, k, **options) and returns the selected keys.
+    method="auto" also considers it as a first-stage greedy once it has a
+    cost in the `costs` passed to pmcover.
+    """
+    ENGINES[name] = engine
+
+register_engine("half", pmcover_half)
+register_engine("incremental", pmcover_incremental)
+register_engine("lazy", pmcover_lazy)
+register_engine("bitmatrix", pmcover_bitmatrix)
+register_engine("stochastic", pmcover_stochastic)
+register_engine("streaming", pmcover_streaming)
+register_engine("continuous", pmcover_continuous)
+
+# Terms of the cost model, as computed by cost_terms(); an engine's
+# predicted time is the dot product of its costs with them
+COST_TERMS = ("keys", "total_size", "tail", "key_steps")
+# Seconds per unit of each COST_TERMS entry; continuous is per iteration.
+# Fitted with calibrate() via experiments/run_pmcover_calibration.py.
+DEFAULT_COSTS: Dict[str, Tuple[float, ...]] = {
+    "lazy": (2.5e-07, 8.9e-09, 8.5e-07, 0.0),
+    "incremental": (0.0, 3.1e-07, 7.4e-07, 1.5e-08),
+    "bitmatrix": (1.4e-06, 3.7e-07, 2.3e-08, 2.4e-08),
+    "stochastic": (7.3e-07, 2.3e-09, 1.9e-08, 8.7e-09),
+    "continuous": (1.9e-07, 1.2e-07, 0.0, 0.0),
+}
+# costed engines method="auto" keeps for a time-budget fallback
+# (stochastic) or a refinement (continuous) instead of running them first
+SECOND_STAGE = {"stochastic", "continuous"}
+# the bit-matrix engine is only predicted below this matrix size (bytes)
+DENSE_MAX_BYTES = 256 * 2**20
+# fewer continuous-greedy iterations than this are not worth running
+MIN_CONTINUOUS_ITERS = 5
+
+def instance_stats(
+    sets: Dict[Tuple[int, int], Set[int]],
+    budgets: Dict[int, int],
+    k: int
+) -> Dict[str, float]:
+    """
+    Statistics method="auto" decides on: keys (m), total_size (Σ |S|),
+    universe (|∪ S|), k, rank (Σ_a min(B_a, keys of a): most selections
+    possible), skew (share of keys in the largest partition), upper_bound
+    (Σ_a of the B_a largest sets of a, capped at universe: no selection
+    covers more) and steps (min(rank, ⌈k · rank / bound⌉), bound being
+    the upper bound before the cap: the selections k takes at the mean
+    size of a budgeted pick, an estimate of the greedy's step count).
+
+    `skew` measures how keys, not budgets, are spread over partitions:
+    that is what changes the greedy engines' work per element (once the
+    largest partition's budget fills, its share of the keys drops out of
+    every later step), so it stands in for the budget skew of the cost
+    model. cost_terms() turns these into the model's terms.
+    """
+    sizes_of: Dict[int, List[int]] = {}
+    universe: Set[Any] = set()
+    for key, items in sets.items():
+        sizes_of.setdefault(key[0], []).append(len(items))
+        universe.update(items)
+    m = len(sets)
+    rank = 0
+    bound = 0
+    for a, sizes in sizes_of.items():
+        budget = max(0, budgets.get(a, 0))
+        rank += min(budget, len(sizes))
+        bound += sum(sorted(sizes, reverse=True)[:budget])
+    return {
+        "keys": m,
+        "total_size": sum(sum(sizes) for sizes in sizes_of.values()),
+        "universe": len(universe),
+        "k": k,
+        "rank": rank,
+        "skew": max(map(len, sizes_of.values())) / m if m else 0.0,
+        "upper_bound": min(bound, len(universe)),
+        "steps": min(rank, math.ceil(k * rank / bound)) if bound else 0,
+    }
+
+def cost_terms(stats: Dict[str, float]) -> Tuple[float, ...]:
+    """
+    The COST_TERMS of an instance with instance_stats `stats`:
+
+      keys        m: building the heaps and indexes
+      total_size  Σ |S|: reading every set once
+      tail        total_size · depth · (1 - skew), depth = min(1, k /
+                  upper_bound): the sets a lazy greedy re-scores as k
+                  nears what the instance can cover, except those of a
+                  dominant partition whose budget fills early
+      key_steps   m · steps: one scan over the keys per selection
+    """
+    depth = min(1.0, stats["k"] / max(1, stats["upper_bound"]))
+    return (
+        stats["keys"],
+        stats["total_size"],
+        stats["total_size"] * depth * (1.0 - stats["skew"]),
+        stats["keys"] * stats["steps"],
+    )
+
+def predict_seconds(
+    name: str,
+    stats: Dict[str, float],
+    costs: Dict[str, Tuple[float, ...]] = DEFAULT_COSTS
+) -> float:
+    """Predicted run time of engine `name`: its costs times cost_terms(stats)."""
+    return sum(c * term for c, term in zip(costs[name], cost_terms(stats)))
+
+def _coverage(sets: Dict[Tuple[int, int], Set[int]], selection: List[Tuple[int, int]]) -> int:
+    return len(set().union(*(sets[key] for key in selection))) if selection else 0
+
+def pmcover(
+    sets: Dict[Tuple[int, int], Set[int]],
+    budgets: Dict[int, int],
+    k: int,
+    method: str = "auto",
+    time_budget: Optional[float] = None,
+    costs: Optional[Dict[str, Tuple[float, ...]]] = None,
+    report: Optional[Dict[str, Any]] = None,
+    **options
+) -> List[Tuple[int, int]]:
+    """
+    Partition-matroid coverage through one entry point.
+
+    method names an engine in ENGINES ("half", "incremental", "lazy",
+    "bitmatrix", "stochastic", "streaming", "continuous" or a registered
+    one), which is called with `options`. method="auto" instead:
+
+      1. runs the first-stage greedy with the lowest predicted time
+         (lazy, incremental or bitmatrix, from the calibrated costs of
+         the instance's COST_TERMS), or stochastic greedy (seeded with
+         options["seed"]) if that prediction exceeds `time_budget`;
+      2. stops there if it covers k terminals, or if its coverage already
+         meets the instance upper bound;
+      3. otherwise runs continuous greedy (with `options`), scaling its
+         iterations down to what the remaining time budget is predicted
+         to allow, and keeps whichever selection covers more (capped at
+         k, then fewer keys).
+
+    :param time_budget: seconds available, None for no limit; used for
+                        predictions only, engines are never interrupted
+    :param costs: per-engine seconds per unit of each COST_TERMS entry,
+                  e.g. from calibrate(); defaults to DEFAULT_COSTS
+    :param report: optional dict filled with stats, predicted seconds
+                   (per iteration for continuous), the engines run and the
+                   one whose selection is returned
+    :return: list of selected keys (a, c)
+    """
+    if report is None:
+        report = {}
+    if method != "auto":
+        if method not in ENGINES:
+            raise ValueError(
+                f"unknown pmcover method {method!r}; choose 'auto' or one of "
+                f"{sorted(ENGINES)}"
+            )
+        report.update(engines=[method], chosen=method)
+        return ENGINES[method](sets, budgets, k, **options)
+
+    start = time.perf_counter()
+    costs = DEFAULT_COSTS if costs is None else costs
+    stats = instance_stats(sets, budgets, k)
+    report.update(stats=stats, engines=[], chosen=None)
+    if not sets or k <= 0:
+        return []
+
+    candidates = [name for name in costs if name in ENGINES and name not in SECOND_STAGE]
+    if stats["keys"] * stats["universe"] / 8 > DENSE_MAX_BYTES and "bitmatrix" in candidates:
+        candidates.remove("bitmatrix")
+    predicted = {name: predict_seconds(name, stats, costs) for name in costs}
+    report["predicted"] = predicted
+    first = min(candidates, key=predicted.get, default="lazy")
+    if (time_budget is not None and "stochastic" in costs
+            and predicted.get(first, 0.0) > time_budget):
+        first = "stochastic"
+    if first == "stochastic":
+        # the same seed makes the fallback's sample reproducible
+        selection = ENGINES[first](sets, budgets, k, seed=options.get("seed"))
+    else:
+        selection = ENGINES[first](sets, budgets, k)
+    covered = _coverage(sets, selection)
+    report["engines"].append(first)
+    report["chosen"] = first
+    if covered >= min(k, stats["upper_bound"]) or "continuous" not in costs:
+        return selection
+
+    # the cheap greedy missed a target that may be reachable
+    iters = options.pop("iters", 50)
+    per_iter = predicted["continuous"]
+    if time_budget is not None:
+        remaining = time_budget - (time.perf_counter() - start)
+        iters = min(iters, math.floor(remaining / per_iter))
+    if iters < MIN_CONTINUOUS_ITERS:
+        return selection
+    refined = ENGINES["continuous"](sets, budgets, k, iters=iters, **options)
+    report["engines"].append("continuous")
+    if (min(_coverage(sets, refined), k), -len(refined)) > (min(covered, k), -len(selection)):
+        report["chosen"] = "continuous"
+        return refined
+    return selection
+
+def calibrate(
+    n_keys: int = 8_000,
+    n_anchors: int = 400,
+    universe: int = 4_000,
+    max_size: int = 40,
+    dense_size: int = 200,
+    budget: int = 3,
+    seed: int = 0,
+    engines: Optional[List[str]] = None
+) -> Dict[str, Tuple[float, ...]]:
+    """
+    Micro-benchmark behind DEFAULT_COSTS: time each engine on sparse sets
+    (power-law sizes up to max_size) and dense ones (dense_size / 2 to
+    dense_size items), each spread uniformly or with 90% of the keys in
+    the first partition, at k = universe / 20, universe / 3 and universe;
+    the engines trade places over these shapes (lazy leads while k is
+    shallow, the bit matrix once k nears what dense sets can cover).
+    Returns per engine the non-negative least-squares fit of its times on
+    the COST_TERMS, weighted towards relative error (continuous is timed
+    at 5 iterations and fitted per iteration).
+    """
+    rng = random.Random(seed)
+
+    def instance(root_share: float, dense: bool):
+        sets = {}
+        for c in range(n_keys):
+            a = 0 if rng.random() < root_share else rng.randrange(n_anchors)
+            if dense:
+                size = rng.randint(dense_size // 2, dense_size)
+            elif a == 0 and root_share:
+                size = max_size
+            else:
+                size = 1 + int(rng.random() ** 3 * (max_size - 1))
+            sets[(a, c)] = set(rng.sample(range(universe), min(size, universe)))
+        budgets = {a: budget for a in range(n_anchors)}
+        return sets, budgets
+
+    names = engines if engines is not None else list(DEFAULT_COSTS)
+    terms: List[Tuple[float, ...]] = []
+    measured: Dict[str, List[float]] = {name: [] for name in names}
+    for root_share in (0.0, 0.9):
+        for dense in (False, True):
+            sets, budgets = instance(root_share, dense)
+            for k in (universe // 20, universe // 3, universe):
+                terms.append(cost_terms(instance_stats(sets, budgets, k)))
+                for name in names:
+                    t0 = time.perf_counter()
+                    if name == "continuous":
+                        ENGINES[name](sets, budgets, k, iters=5)
+                        elapsed = (time.perf_counter() - t0) / 5
+                    else:
+                        ENGINES[name](sets, budgets, k)
+                        elapsed = time.perf_counter() - t0
+                    measured[name].append(elapsed)
+    X = np.array(terms, dtype=float)
+    costs = {}
+    for name, seconds in measured.items():
+        y = np.array(seconds)
+        weight = 1.0 / np.sqrt(np.maximum(y, 1e-6))
+        coef, _ = nnls(X * weight[:, None], y * weight)
+        costs[name] = tuple(float(c) for c in coef)
+    return costs
@@ -0,0 +1,122 @@
+# src/pmcover_bitmatrix.py
+
+from itertools import chain
+from typing import Dict, Hashable, List, Set, Tuple
+import numpy as np
+
+from src.bitset import popcount_words
+
+def pmcover_bitmatrix(
+    sets: Dict[Tuple[int, int], Set[int]],
+    budgets: Dict[int, int],
+    k: int,
+    batch: int = 256
+) -> List[Tuple[int, int]]:
+    """
+    pmcover_half on a dense bit matrix; the selection is identical (max
+    marginal gain, ties to the earliest key in `sets`).
+
+    Row i of a keys × ⌈|U|/64⌉ uint64 matrix holds key i's cover set, one
+    bit per terminal, and a gain is popcount(row & ~covered) over whole
+    rows at once. Gains only shrink, so each key keeps an upper bound
+    (its last score) as in lazy greedy: a step rescores, in one batched
+    pass, the stale keys among the `batch` highest bounds plus all keys
+    tied at the top bound, until every key at the top is fresh. That top
+    is then the true maximum gain and its earliest key is pmcover_half's
+    pick. Filled partitions get a bound of -1, so budget checks are array
+    masks too.
+
+    The matrix takes m · |U| / 8 bytes, so this suits mid-size instances
+    (e.g. 20k keys × 20k terminals is 50 MB); pmcover_incremental keeps
+    the same selection in O(total set size) memory.
+
+    :param sets: mapping from keys (a, c) to the set of terminals covered by c
+    :param budgets: mapping from each a to its maximum allowed selections (B*)
+    :param k: number of terminals we still need to cover (k_rem)
+    :param batch: how many of the highest bounds to rescore together
+    :return: list of selected keys (a, c)
+    """
+    keys = list(sets)
+    m = len(keys)
+    if m == 0 or k <= 0:
+        return []
+
+    # intern terminals (by value when they are all integers) and anchors
+    items_of = [sets[key] for key in keys]
+    sizes = np.fromiter(map(len, items_of), dtype=np.int64, count=m)
+    rows = np.repeat(np.arange(m), sizes)
+    flat = list(chain.from_iterable(items_of))
+    cols = None
+    if all(isinstance(x, (int, np.integer)) for x in flat):
+        # casting anything else (e.g. floats) to int64 would merge terminals
+        try:
+            values = np.fromiter(flat, dtype=np.int64, count=len(flat))
+            _, cols = np.unique(values, return_inverse=True)
+            n_terms = int(cols.max()) + 1 if len(cols) else 0
+        except OverflowError:
+            cols = None
+    if cols is None:
+        term_id: Dict[Hashable, int] = {}
+        cols = np.fromiter((term_id.setdefault(x, len(term_id)) for x in flat),
+                           dtype=np.int64, count=len(flat))
+        n_terms = len(term_id)
+    anchor_id: Dict[Hashable, int] = {}
+    anchor_idx = np.fromiter(
+        (anchor_id.setdefault(key[0], len(anchor_id)) for key in keys),
+        dtype=np.int64, count=m
+    )
+    budget_left = np.array([budgets.get(a, 0) for a in anchor_id], dtype=np.int64)
+    # key positions of each anchor, for retiring a filled partition
+    by_anchor = np.argsort(anchor_idx, kind="stable")
+    anchor_start = np.searchsorted(anchor_idx[by_anchor], np.arange(len(anchor_id) + 1))
+
+    # pack the incidence into 64-bit words, one row per key
+    n_words = max(1, (n_terms + 63) // 64)
+    matrix = np.zeros((m, n_words), dtype=np.uint64)
+    np.bitwise_or.at(matrix, (rows, cols >> 6),
+                     np.left_shift(np.uint64(1), (cols & 63).astype(np.uint64)))
+
+    # upper bounds on the gains, exact where fresh[i] == step
+    bound = sizes.copy()
+    # ineligible keys sit below 0 and are never scored
+    bound[budget_left[anchor_idx] <= 0] = -1
+    fresh = np.zeros(m, dtype=np.int64)
+    step = 0
+    uncovered = np.full(n_words, np.iinfo(np.uint64).max, dtype=np.uint64)
+    n_covered = 0
+    selected: List[Tuple[int, int]] = []
+
+    while n_covered < k:
+        top = int(bound.max())
+        # stop if no positive gain
+        if top <= 0:
+            break
+        tied = np.flatnonzero(bound == top)
+        stale = tied[fresh[tied] != step]
+        if len(stale):
+            # rescore the stale keys among the highest bounds in one pass
+            if len(stale) < batch:
+                cut = min(batch, m - 1)
+                head = np.argpartition(-bound, cut)[:cut + 1]
+                head = head[(fresh[head] != step) & (bound[head] > 0)]
+                stale = np.union1d(stale, head)
+            bound[stale] = popcount_words(matrix[stale] & uncovered) \
+                .sum(axis=1, dtype=np.int64)
+            fresh[stale] = step
+            continue
+
+        # every key bounded by `top` now has exact gain `top`: take the
+        # earliest, as pmcover_half does
+        best = int(tied[0])
+        selected.append(keys[best])
+        n_covered += top
+        uncovered &= ~matrix[best]
+        step += 1
+        a = anchor_idx[best]
+        budget_left[a] -= 1
+        if budget_left[a] == 0:
+            bound[by_anchor[anchor_start[a]:anchor_start[a + 1]]] = -1
+        else:
+            bound[best] = 0
+
+    return selected
@@ -1,34 +1,220 @@
 # src/pmcover_continuous.py
 
 import random
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+import numpy as np
+import scipy.sparse as sp
+
+from src.parallel_continuous import ParallelGradient
+
+def _incidence(
+    sets: Dict[Tuple[Any, Any], Set[Any]],
+    keys: List[Tuple[Any, Any]]
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Key/terminal incidence pairs in COO form, sorted by terminal:
+    (key index, terminal index, number of distinct terminals).
+    """
+    term_id: Dict[Any, int] = {}
+    key_idx: List[int] = []
+    term_idx: List[int] = []
+    for i, key in enumerate(keys):
+        for t in sets[key]:
+            key_idx.append(i)
+            term_idx.append(term_id.setdefault(t, len(term_id)))
+    key_idx = np.asarray(key_idx, dtype=np.int64)
+    term_idx = np.asarray(term_idx, dtype=np.int64)
+    order = np.argsort(term_idx, kind="stable")
+    return key_idx[order], term_idx[order], len(term_id)
+
+def _exact_gradient(
+    x: np.ndarray,
+    key_idx: np.ndarray,
+    term_idx: np.ndarray,
+    term_starts: np.ndarray
+) -> np.ndarray:
+    """
+    grad_i = E[f(R ∪ {i}) - f(R)] over R ~ x, counting 0 when i ∈ R, which
+    for coverage is Σ_{t ∈ S_i} Π_{j ∋ t} (1 - x_j): terminal t adds one
+    exactly when no set containing it is in R ∪ {i}.
+    """
+    if len(key_idx) == 0:
+        return np.zeros(len(x))
+    # probability that terminal t is left uncovered by R
+    uncovered = np.multiply.reduceat(1.0 - x[key_idx], term_starts)
+    return np.bincount(key_idx, weights=uncovered[term_idx], minlength=len(x))
+
+def _shared_sample_gradient(
+    drawn: np.ndarray,
+    incidence: sp.csr_matrix
+) -> np.ndarray:
+    """
+    Monte Carlo estimate of the same gradient from one `samples × m`
+    Bernoulli(x) matrix `drawn` shared by every coordinate: per sample,
+    terminal hit counts are Rᵀ-products with the key × terminal incidence,
+    and key gains are products of the uncovered-terminal mask back through it.
+    """
+    hits = incidence.T @ drawn.T.astype(np.float64)        # terminals × samples
+    gains = incidence @ (hits == 0).astype(np.float64)     # keys × samples
+    gains[drawn.T] = 0.0
+    return gains.mean(axis=1)
+
+def _step_directions(
+    grad: np.ndarray,
+    anchor_idx: np.ndarray,
+    budget_of: np.ndarray
+) -> np.ndarray:
+    """
+    Keys raised by one continuous-greedy step: the budget[a] keys of each
+    partition with the highest gradient, ties to the earliest key (the
+    same choice as walking all keys by descending gradient).
+    """
+    order = np.argsort(-grad, kind="stable")
+    anchors = anchor_idx[order]
+    grouped = np.argsort(anchors, kind="stable")
+    anchors = anchors[grouped]
+    rank = np.arange(len(anchors)) - np.searchsorted(anchors, anchors, side="left")
+    return order[grouped[rank < budget_of[anchors]]]
 
 def pmcover_continuous(
     sets: Dict[Tuple[Any, Any], Set[Any]],
     budgets: Dict[Any, int],
     k: int,
     iters: int = 50,
-    samples: int = 20
+    samples: int = 20,
+    gradient: str = "exact",
+    seed: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
+    workers: int = 1
 ) -> List[Tuple[Any, Any]]:
     """
     Continuous greedy + rounding for a (1 - 1/e)-approximation
     of maximum coverage under a partition matroid constraint.
-    
+
     Args:
         sets: Mapping from (a, c) pairs to the set of terminals covered.
         budgets: Mapping from each 'a' to the max number of sets allowed.
         k: Target number of terminals to cover.
         iters: Number of continuous-greedy iterations.
-        samples: Number of Monte Carlo samples for gradient estimation.
-    
+        samples: Number of Monte Carlo samples for gradient estimation
+            (gradient="shared" or "sample").
+        gradient: "exact" uses the closed form of the coverage multilinear
+            extension, Σ_{t ∈ S_i} Π_{j ∋ t} (1 - x_j), in O(total set size)
+            per iteration with NumPy; "shared" estimates it from one
+            samples × m Bernoulli matrix per iteration, shared by every
+            coordinate and evaluated with sparse products; "sample" draws
+            fresh subsets per coordinate from the global `random` module,
+            at O(m · samples · m) set work per iteration.
+        seed: Seed for the gradient="shared" generator (ignored if rng given).
+        rng: numpy Generator for gradient="shared"; the same seed or
+            generator state gives the same selection in any process.
+        workers: With workers > 1 ("exact" and "shared" only) each
+            iteration's gradient is split over a process pool sharing the
+            incidence arrays (see parallel_continuous); the selection is
+            bit-identical to workers=1 for the same seed.
+
     Returns:
         A list of selected (a, c) keys respecting budgets, covering ≥ k terminals.
     """
     keys = list(sets.keys())
     m = len(keys)
-    x = [0.0] * m             # fractional solution vector
     dt = 1.0 / iters
 
+    if gradient in ("exact", "shared"):
+        if gradient == "shared" and rng is None:
+            rng = np.random.default_rng(seed)
+        x = _continuous_greedy_arrays(sets, budgets, keys, iters, dt,
+                                      gradient, samples, rng, workers)
+    elif gradient == "sample":
+        if workers > 1:
+            raise ValueError('gradient="sample" draws from the global random '
+                             'module and cannot be combined with workers > 1')
+        x = _continuous_greedy_sampled(sets, budgets, keys, iters, samples, dt)
+    else:
+        raise ValueError(f"unknown gradient engine {gradient!r}")
+
+    # Rounding Phase: greedy by fractional weights x
+    selected: List[Tuple[Any, Any]] = []
+    covered = set()
+    used = {a: 0 for a in budgets}
+    for i in sorted(range(m), key=lambda i: -x[i]):
+        a, _ = keys[i]
+        if used.get(a, 0) < budgets.get(a, 0):
+            selected.append(keys[i])
+            used[a] += 1
+            covered |= sets[keys[i]]
+        if len(covered) >= k:
+            break
+
+    return selected
+
+def _continuous_greedy_arrays(
+    sets: Dict[Tuple[Any, Any], Set[Any]],
+    budgets: Dict[Any, int],
+    keys: List[Tuple[Any, Any]],
+    iters: int,
+    dt: float,
+    gradient: str,
+    samples: int,
+    rng: Optional[np.random.Generator],
+    workers: int
+) -> List[float]:
+    """
+    Fractional solution x after `iters` steps along the exact gradient or
+    its shared-sample estimate.
+    """
+    m = len(keys)
+    key_idx, term_idx, n_terms = _incidence(sets, keys)
+    incidence = None
+    if gradient == "shared" and workers <= 1:
+        incidence = sp.csr_matrix(
+            (np.ones(len(key_idx)), (key_idx, term_idx)), shape=(m, n_terms)
+        )
+    term_starts = np.flatnonzero(np.r_[True, term_idx[1:] != term_idx[:-1]]) \
+        if len(term_idx) else term_idx
+    anchor_id: Dict[Any, int] = {}
+    anchor_idx = np.fromiter(
+        (anchor_id.setdefault(key[0], len(anchor_id)) for key in keys),
+        dtype=np.int64, count=m
+    )
+    budget_of = np.array([budgets.get(a, 0) for a in anchor_id], dtype=np.int64)
+
+    pool = None
+    if workers > 1:
+        pool = ParallelGradient(key_idx, term_idx, m, n_terms, workers,
+                                samples if gradient == "shared" else 0)
+    x = np.zeros(m)
+    try:
+        for _ in range(iters):
+            drawn = None
+            if gradient == "shared":
+                drawn = rng.random((samples, m)) < x
+            if pool is not None:
+                grad = pool.gradient(x, drawn)
+            elif gradient == "exact":
+                grad = _exact_gradient(x, key_idx, term_idx, term_starts)
+            else:
+                grad = _shared_sample_gradient(drawn, incidence)
+            # Move x in direction of gradient, projected to matroid polytope
+            step = _step_directions(grad, anchor_idx, budget_of)
+            x[step] = np.minimum(1.0, x[step] + dt)
+    finally:
+        if pool is not None:
+            pool.close()
+    return x.tolist()
+
+def _continuous_greedy_sampled(
+    sets: Dict[Tuple[Any, Any], Set[Any]],
+    budgets: Dict[Any, int],
+    keys: List[Tuple[Any, Any]],
+    iters: int,
+    samples: int,
+    dt: float
+) -> List[float]:
+    """Fractional solution x after `iters` steps along a sampled gradient."""
+    m = len(keys)
+    x = [0.0] * m             # fractional solution vector
+
     def f_value(S: List[Tuple[Any, Any]]) -> int:
         """Compute the coverage |⋃_{key in S} sets[key]|."""
         covered = set()
@@ -58,21 +244,7 @@ def pmcover_continuous(
         # Sort keys by descending estimated gradient
         for i in sorted(range(m), key=lambda i: -grad[i]):
             a, _ = keys[i]
-            if used[a] < budgets[a]:
+            if used.get(a, 0) < budgets.get(a, 0):
                 x[i] = min(1.0, x[i] + dt)
                 used[a] += 1
-
-    # Rounding Phase: greedy by fractional weights x
-    selected: List[Tuple[Any, Any]] = []
-    covered = set()
-    used = {a: 0 for a in budgets}
-    for i in sorted(range(m), key=lambda i: -x[i]):
-        a, _ = keys[i]
-        if used[a] < budgets[a]:
-            selected.append(keys[i])
-            used[a] += 1
-            covered |= sets[keys[i]]
-        if len(covered) >= k:
-            break
-
-    return selected
+    return x
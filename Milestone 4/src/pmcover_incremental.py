@@ -0,0 +1,80 @@
+# src/pmcover_incremental.py
+
+import heapq
+from typing import Dict, Hashable, List, Set, Tuple
+
+def pmcover_incremental(
+    sets: Dict[Tuple[int, int], Set[int]],
+    budgets: Dict[int, int],
+    k: int
+) -> List[Tuple[int, int]]:
+    """
+    pmcover_half with incrementally maintained gains; the selection is
+    identical (max marginal gain, ties to the earliest key in `sets`).
+
+    Keys are interned as their position in `sets`. A terminal -> keys
+    inverted index and integer gain counters replace the per-round set
+    differences: covering a terminal decrements the gain of exactly the
+    keys containing it. Eligible keys sit in a bucket queue indexed by
+    gain, each bucket a min-heap of key positions with lazy deletion
+    (entries whose gain moved or whose partition filled are dropped when
+    they surface). Gains only decrease, so the max-gain pointer only moves
+    down and the whole run costs O(total set size · log m).
+
+    :param sets: mapping from keys (a, c) to the set of terminals covered by c
+    :param budgets: mapping from each a to its maximum allowed selections (B*)
+    :param k: number of terminals we still need to cover (k_rem)
+    :return: list of selected keys (a, c)
+    """
+    keys = list(sets)
+    anchor = [key[0] for key in keys]
+    gain = [len(sets[key]) for key in keys]
+    used: Dict[int, int] = {a: 0 for a in budgets}
+
+    # terminal -> positions of the keys containing it
+    holders: Dict[Hashable, List[int]] = {}
+    for i, key in enumerate(keys):
+        for x in sets[key]:
+            holders.setdefault(x, []).append(i)
+
+    def eligible(i: int) -> bool:
+        a = anchor[i]
+        return used.get(a, 0) < budgets.get(a, 0)
+
+    top = max(gain, default=0)
+    buckets: List[List[int]] = [[] for _ in range(top + 1)]
+    for i in range(len(keys)):
+        if gain[i] > 0 and eligible(i):
+            # positions arrive in increasing order, so each bucket is a heap
+            buckets[gain[i]].append(i)
+
+    covered: Set[Hashable] = set()
+    selected: List[Tuple[int, int]] = []
+    while len(covered) < k:
+        # Find the earliest eligible key with the maximum gain
+        while top > 0:
+            bucket = buckets[top]
+            while bucket and (gain[bucket[0]] != top or not eligible(bucket[0])):
+                heapq.heappop(bucket)
+            if bucket:
+                break
+            top -= 1
+        # stop if no positive gain
+        if top == 0:
+            break
+
+        best = heapq.heappop(buckets[top])
+        key = keys[best]
+        selected.append(key)
+        a = anchor[best]
+        used[a] = used.get(a, 0) + 1
+        for x in sets[key]:
+            if x in covered:
+                continue
+            covered.add(x)
+            for j in holders[x]:
+                gain[j] -= 1
+                if gain[j] > 0 and eligible(j):
+                    heapq.heappush(buckets[gain[j]], j)
+
+    return selected
@@ -1,40 +1,97 @@
 # src/pmcover_lazy.py
 
 import heapq
+from bisect import bisect_left
 from typing import Dict, List, Set, Tuple
 
+from src.bitset import BitIndexer, popcount
+
 def pmcover_lazy(
     sets: Dict[Tuple[int, int], Set[int]],
     budgets: Dict[int, int],
-    k: int
+    k: int,
+    bitset: bool = False
 ) -> List[Tuple[int, int]]:
     """
     Lazy‐greedy 1/2‐approximation for the partition‐matroid coverage instance.
-    Uses a max‐heap of (neg_gain, key) and only recomputes gain when it becomes stale.
+    Uses max‐heaps of (neg_gain, key) and only recomputes gain when it
+    becomes stale.
+
+    Each partition a has its own sub-heap, and a top-level heap holds one
+    entry per partition: its leader (sub-heap top). When a's budget fills
+    its leader is simply not re-inserted, so the whole partition is retired
+    in O(1) instead of having every remaining key popped, re-scored and
+    dropped. Keys are interned as integers in sorted key order, so heap
+    ties break exactly as they would on the (a, c) tuples themselves and
+    the selection is that of a single global heap.
+
+    With `bitset=True` every cover set and the covered set are Python
+    big-int bitmaps over the terminals, so a gain is an AND-NOT plus
+    popcount instead of a set difference; the selection is the same.
     """
-    covered: Set[int] = set()
+    n_covered = 0
     selected: List[Tuple[int, int]] = []
     used: Dict[int, int] = {a: 0 for a in budgets}
 
-    # Initialize heap with estimated gains = full set sizes
-    heap: List[Tuple[int, Tuple[int,int]]] = [
-        (-len(items), key) for key, items in sets.items()
-    ]
-    heapq.heapify(heap)
+    try:
+        keys = sorted(sets)
+        grouped = True
+    except TypeError:
+        # unorderable keys: ties follow insertion order instead
+        keys = list(sets)
+        grouped = False
+    items_of = [sets[key] for key in keys]
 
-    while len(covered) < k and heap:
-        neg_est, key = heapq.heappop(heap)
-        a, _ = key
+    # Initialize sub-heaps with estimated gains = full set sizes
+    entries = list(zip([-len(items) for items in items_of], range(len(keys))))
+    if bitset:
+        indexer = BitIndexer(set().union(*items_of))
+        items_of = [indexer.to_bits(items) for items in items_of]
+        covered = 0
+    else:
+        covered = set()
+    part_heaps: Dict[int, List[Tuple[int, int]]] = {}
+    if grouped:
+        # sorted keys keep each partition contiguous; (a,) sorts just
+        # before every (a, c)
+        anchors = sorted({key[0] for key in keys})
+        bounds = [bisect_left(keys, (a,)) for a in anchors] + [len(keys)]
+        for a, lo, hi in zip(anchors, bounds, bounds[1:]):
+            part_heaps[a] = entries[lo:hi]
+    else:
+        for entry, key in zip(entries, keys):
+            part_heaps.setdefault(key[0], []).append(entry)
+    leaders: List[Tuple[int, int, int]] = []
+    for a, heap in part_heaps.items():
+        if budgets.get(a, 0) > 0:
+            heapq.heapify(heap)
+            neg_est, i = heap[0]
+            leaders.append((neg_est, i, a))
+    heapq.heapify(leaders)
+
+    while n_covered < k and leaders:
+        neg_est, i, a = heapq.heappop(leaders)
+        heap = part_heaps[a]
+        heapq.heappop(heap)
         # Compute true marginal gain
-        true_gain = len(sets[key] - covered)
-        # If this matches the previous estimate and budget allows, select
-        if -neg_est == true_gain and used[a] < budgets[a]:
-            selected.append(key)
-            used[a] += 1
-            covered |= sets[key]
+        if bitset:
+            true_gain = popcount(items_of[i] & ~covered)
+        else:
+            true_gain = len(items_of[i] - covered)
+        # If this matches the previous estimate, select
+        if -neg_est == true_gain:
+            selected.append(keys[i])
+            used[a] = used.get(a, 0) + 1
+            covered |= items_of[i]
+            n_covered += true_gain
         # Otherwise push back with updated gain
-        elif used[a] < budgets[a] and true_gain > 0:
-            heapq.heappush(heap, (-true_gain, key))
-        # else discard (no budget or no gain)
+        elif true_gain > 0:
+            heapq.heappush(heap, (-true_gain, i))
+        # else discard (no gain)
+
+        # Re-enter the partition under its new leader while it has budget
+        if heap and used.get(a, 0) < budgets.get(a, 0):
+            neg_est, i = heap[0]
+            heapq.heappush(leaders, (neg_est, i, a))
 
     return selected
@@ -0,0 +1,96 @@
+# src/pmcover_stochastic.py
+
+import math
+import random
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+def pmcover_stochastic(
+    sets: Dict[Tuple[int, int], Set[int]],
+    budgets: Dict[int, int],
+    k: int,
+    epsilon: float = 0.1,
+    seed: Optional[int] = None
+) -> List[Tuple[int, int]]:
+    """
+    Stochastic greedy for the partition-matroid coverage instance: each
+    step scores only a random sample of the eligible keys and takes the
+    best of those (ties to the earliest key in `sets`).
+
+    The sample size is ⌈(m / r) · ln(1/ε)⌉, with m the eligible keys and
+    r = Σ_a min(B_a, |keys of a|) the most selections any solution can
+    make, so a whole run scores about m · ln(1/ε) keys instead of m per
+    step. Keys live in a pool with O(1) swap-removal: a key leaves it when
+    it is selected, when a sample shows it has no gain left (gains never
+    grow back), or when its partition's budget fills. When the sample
+    covers the whole pool the selection is exactly pmcover_half's.
+
+    :param sets: mapping from keys (a, c) to the set of terminals covered by c
+    :param budgets: mapping from each a to its maximum allowed selections (B*)
+    :param k: number of terminals we still need to cover (k_rem)
+    :param epsilon: sampling slack in (0, 1); smaller samples more keys
+    :param seed: seed for the sampling RNG
+    :return: list of selected keys (a, c)
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError(f"epsilon must lie in (0, 1), got {epsilon}")
+    rng = random.Random(seed)
+    keys = list(sets)
+    anchor = [key[0] for key in keys]
+    used: Dict[int, int] = {a: 0 for a in budgets}
+
+    # eligible key positions; where[i] is i's slot in pool, or -1
+    pool: List[int] = []
+    where = [-1] * len(keys)
+    members: Dict[int, List[int]] = {}
+    for i, key in enumerate(keys):
+        if sets[key] and budgets.get(anchor[i], 0) > 0:
+            where[i] = len(pool)
+            pool.append(i)
+            members.setdefault(anchor[i], []).append(i)
+    if not pool:
+        return []
+
+    def remove(i: int):
+        slot = where[i]
+        if slot < 0:
+            return
+        last = pool.pop()
+        if last != i:
+            pool[slot] = last
+            where[last] = slot
+        where[i] = -1
+
+    rank = sum(min(budgets[a], len(keys_of)) for a, keys_of in members.items())
+    sample_size = max(1, math.ceil(len(pool) / rank * math.log(1 / epsilon)))
+
+    covered: Set[Hashable] = set()
+    selected: List[Tuple[int, int]] = []
+    while len(covered) < k and pool:
+        best, best_gain = -1, 0
+        exhausted = []
+        for slot in rng.sample(range(len(pool)), min(sample_size, len(pool))):
+            i = pool[slot]
+            # marginal gain = uncovered items this key would cover
+            gain = len(sets[keys[i]] - covered)
+            if gain > best_gain or (gain == best_gain and gain > 0 and i < best):
+                best, best_gain = i, gain
+            elif gain == 0:
+                exhausted.append(i)
+        for i in exhausted:
+            remove(i)
+        if best < 0:
+            continue
+
+        # select it
+        key = keys[best]
+        selected.append(key)
+        remove(best)
+        a = anchor[best]
+        used[a] = used.get(a, 0) + 1
+        covered |= sets[key]
+        if used[a] >= budgets[a]:
+            # the partition is full: retire its remaining keys
+            for i in members[a]:
+                remove(i)
+
+    return selected
@@ -0,0 +1,83 @@
+# src/pmcover_streaming.py
+
+import math
+from typing import Dict, Hashable, Iterable, List, Mapping, Set, Tuple, Union
+
+class _Sieve:
+    """One candidate solution, accepting keys whose gain reaches `tau`."""
+
+    __slots__ = ("tau", "covered", "selected", "used")
+
+    def __init__(self, tau: int):
+        self.tau = tau
+        self.covered: Set[Hashable] = set()
+        self.selected: List[Tuple[int, int]] = []
+        self.used: Dict[int, int] = {}
+
+def pmcover_streaming(
+    stream: Union[Mapping[Tuple[int, int], Set[int]],
+                  Iterable[Tuple[Tuple[int, int], Set[int]]]],
+    budgets: Dict[int, int],
+    k: int,
+    epsilon: float = 0.1
+) -> List[Tuple[int, int]]:
+    """
+    Single-pass sieve streaming for the partition-matroid coverage instance.
+
+    Keys arrive once, as (key, cover_set) pairs (a `sets` dict is read via
+    .items()), and are never stored. Sieve i keeps its own solution and
+    accepts an arriving key when its anchor still has budget there and its
+    marginal gain is at least τ_i = ⌈(1+ε)^i⌉. Gains are integers, so grid
+    points rounding to the same τ would keep identical sieves and only the
+    first is opened. Thresholds above the largest set seen so far could
+    not have accepted any earlier key, so sieves are opened lazily as that
+    maximum Δ grows: O(min(Δ, log_{1+ε} Δ)) of them. A sieve stops
+    accepting once it covers k terminals. The result is the sieve
+    with the most coverage (capped at k), then the fewest keys.
+
+    Memory is O(min(Δ, log_{1+ε} Δ) · (k + Δ + B)) for the covered terminals and
+    selected keys of every sieve, with B = Σ_a B_a, independent of the
+    total size of the instance.
+
+    :param stream: (key (a, c), terminals covered by c) pairs, or a mapping
+                   of them such as build_cover_instance's sets
+    :param budgets: mapping from each a to its maximum allowed selections (B*)
+    :param k: number of terminals we still need to cover (k_rem)
+    :param epsilon: threshold grid ratio; smaller keeps more sieves
+    :return: list of selected keys (a, c)
+    """
+    if epsilon <= 0:
+        raise ValueError(f"epsilon must be positive, got {epsilon}")
+    if isinstance(stream, Mapping):
+        stream = stream.items()
+    sieves: List[_Sieve] = []
+    base = 1.0 + epsilon
+    next_tau = 1
+
+    for key, items in stream:
+        a = key[0]
+        budget = budgets.get(a, 0)
+        size = len(items)
+        if size == 0 or budget <= 0:
+            continue
+        # open the thresholds this set size newly reaches
+        while next_tau <= size:
+            sieves.append(_Sieve(next_tau))
+            # the first grid point (1+ε)^i above it, skipping those that
+            # round to the threshold just opened
+            i = math.floor(math.log(next_tau) / math.log1p(epsilon)) + 1
+            next_tau = max(next_tau + 1, math.ceil(base ** i))
+        for sieve in sieves:
+            if sieve.tau > size:
+                break
+            if len(sieve.covered) >= k or sieve.used.get(a, 0) >= budget:
+                continue
+            gain = sum(1 for x in items if x not in sieve.covered)
+            if gain >= sieve.tau:
+                sieve.selected.append(key)
+                sieve.used[a] = sieve.used.get(a, 0) + 1
+                sieve.covered.update(items)
+
+    best = max(reversed(sieves), default=None,
+               key=lambda s: (min(len(s.covered), k), -len(s.selected)))
+    return list(best.selected) if best is not None else []
@@ -0,0 +1,30 @@
+# src/shm.py
+
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple
+import numpy as np
+
+# name -> (shared-memory block name, shape, dtype string)
+ArraySpecs = Dict[str, Tuple[str, Tuple[int, ...], str]]
+
+def share_array(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Copy `array` into a new shared-memory block and return a view of it."""
+    shm = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    view[...] = array
+    return shm, view
+
+def attach_arrays(
+    specs: ArraySpecs,
+    views: Dict[str, np.ndarray],
+    handles: List[shared_memory.SharedMemory]
+) -> None:
+    """
+    Attach to the blocks described by `specs` (e.g. in a worker process),
+    storing an array view per name in `views` and the open blocks in
+    `handles`, which must outlive the views.
+    """
+    for name, (shm_name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        handles.append(shm)
+        views[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
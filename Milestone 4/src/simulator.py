@@ -1,9 +1,11 @@
-from typing import Set
+from typing import Set, Union
 import networkx as nx
 import time
 
+from src.csr_graph import CSRGraph
+
 def simulate_broadcast_rounds(
-    tree: nx.DiGraph,
+    tree: Union[nx.DiGraph, CSRGraph],
     root: int,
     terminals: Set[int],
     timeout_seconds: float = 10.0  # Add timeout parameter with default 10 seconds
@@ -15,7 +17,7 @@ def simulate_broadcast_rounds(
     We continue until at least all `terminals` are informed, or no progress
     is possible.
 
-    :param tree: a directed tree (DiGraph) rooted at `root`
+    :param tree: a directed tree (DiGraph or CSRGraph) rooted at `root`
     :param root: the root node index
     :param terminals: the set of terminals we care about (subset of tree nodes)
     :param timeout_seconds: maximum execution time in seconds
@@ -0,0 +1,112 @@
+# src/sketch_packing.py
+
+import math
+from typing import List, Optional, Set, Union
+import numpy as np
+import networkx as nx
+
+from src.bfs import bfs_subtree_nodes
+from src.csr_graph import CSRGraph, from_networkx
+
+def _propagate(values: np.ndarray, indptr: np.ndarray, indices: np.ndarray,
+               depth: int, combine) -> np.ndarray:
+    """
+    Apply `depth` rounds of values[u] = combine(values[u], values[succ(u)]),
+    so each row ends up aggregating its depth-bounded ball.
+    `combine` is a ufunc (np.minimum / np.maximum) used via reduceat.
+    """
+    rows = np.flatnonzero(np.diff(indptr))
+    starts = indptr[rows]
+    for _ in range(depth):
+        if len(rows) == 0:
+            break
+        gathered = values[indices]
+        agg = combine.reduceat(gathered, starts, axis=0)
+        values = values.copy()
+        values[rows] = combine(values[rows], agg)
+    return values
+
+def sketch_greedy_packing(
+    G: Union[nx.DiGraph, CSRGraph],
+    root: int,
+    terminals: Set[int],
+    k: int,
+    D_star: int,
+    sketch_size: int = 32,
+    exact_top: int = 16,
+    seed: Optional[int] = None
+) -> List[List[int]]:
+    """
+    Approximate greedy packing for graphs too large for exact balls.
+
+    Each terminal draws `sketch_size` Exp(1) values; D_star rounds of
+    element-wise min over successor rows give every node the minima over
+    its ball, and (sketch_size - 1) / sum(minima) estimates how many
+    terminals the ball holds (relative error ≈ 1/sqrt(sketch_size)).
+    Blocking is exact: the used-node mask is OR-propagated the same way
+    each round. Only the `exact_top` best-estimated unblocked candidates
+    get an exact BFS, and the best exact cover among them is accepted.
+
+    The sketches are built once: a covered terminal lies in a used ball,
+    so every node whose ball contains it is blocked from then on, and the
+    estimates of unblocked nodes stay exact for the remaining terminals.
+
+    Memory is O(n · sketch_size) for the sketches plus O(m · sketch_size)
+    transient during propagation, instead of one exact ball per node.
+    The graph must have nodes 0..n-1 (networkx graphs are converted).
+
+    :param sketch_size: values per node; larger is more accurate and slower
+    :param exact_top: candidates re-scored exactly per round
+    :param seed: seed for the sketch values
+    """
+    if sketch_size < 2:
+        raise ValueError("sketch_size must be at least 2")
+    rho = math.ceil(math.sqrt(k))
+    packs: List[List[int]] = []
+    if not isinstance(G, CSRGraph):
+        G = from_networkx(G)
+    n = G.number_of_nodes()
+    indptr, indices = np.asarray(G.indptr), np.asarray(G.indices)
+    rng = np.random.default_rng(seed)
+
+    remaining_terms = {t for t in terminals if t in G}
+    term_ids = np.fromiter(remaining_terms, dtype=np.int64, count=len(remaining_terms))
+    minima = np.full((n, sketch_size), np.inf, dtype=np.float32)
+    minima[term_ids] = rng.exponential(size=(len(term_ids), sketch_size))
+    minima = _propagate(minima, indptr, indices, D_star, np.minimum)
+    with np.errstate(divide="ignore"):
+        initial_estimate = (sketch_size - 1) / minima.sum(axis=1, dtype=np.float64)
+    del minima
+    used = np.zeros(n, dtype=bool)
+    if root in G:
+        used[root] = True
+
+    while len(packs) < rho and remaining_terms:
+        # Covered terminals lie inside used balls, so any node whose ball
+        # lost a terminal is blocked; unblocked estimates never go stale
+        blocked = _propagate(used, indptr, indices, D_star, np.maximum)
+        estimate = np.where(blocked, 0.0, initial_estimate)
+        live = np.flatnonzero(estimate > 0)
+        if len(live) == 0:
+            break
+        # highest estimate first, node id breaks ties
+        top = live[np.lexsort((live, -estimate[live]))[:exact_top]]
+
+        best_cover: Set[int] = set()
+        best_ball: Set[int] = set()
+        for c in top.tolist():
+            ball = bfs_subtree_nodes(G, c, D_star)
+            cover = remaining_terms.intersection(ball)
+            if k == 1 and cover:
+                cover = {next(iter(cover))}
+            if len(cover) > len(best_cover):
+                best_cover, best_ball = cover, ball
+
+        # Stop if no more coverage is possible
+        if not best_cover:
+            break
+        packs.append(list(best_cover))
+        remaining_terms -= best_cover
+        used[list(best_ball)] = True
+
+    return packs
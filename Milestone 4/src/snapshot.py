@@ -0,0 +1,123 @@
+# src/snapshot.py
+
+import json
+import os
+from typing import Iterable, Optional, Set, Tuple
+import numpy as np
+
+from src.csr_graph import CSRGraph
+from src.graph_loader import load_edge_list
+
+SNAPSHOT_VERSION = 1
+
+def _replace_file(path: str, write) -> None:
+    """
+    Write `path` through a temporary sibling and rename it into place, so
+    readers (including earlier memory-maps of the old file) never see a
+    truncated file.
+    """
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as fh:
+            write(fh)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def save_snapshot(
+    path: str,
+    G: CSRGraph,
+    root: Optional[int] = None,
+    terminals: Optional[Iterable[int]] = None
+) -> None:
+    """
+    Write a CSRGraph (plus optional root and terminal set, as internal ids)
+    to the directory `path` as raw .npy arrays and a small meta.json.
+
+    The arrays can be reopened with numpy memory-mapping, so loading a
+    snapshot costs only the page faults actually touched. Overwriting a
+    snapshot first removes its meta.json, along with any labels.npy or
+    terminals.npy the new snapshot does not write, so the directory is
+    not a valid snapshot again until every new file is in place.
+    """
+    os.makedirs(path, exist_ok=True)
+    meta_path = os.path.join(path, "meta.json")
+    stale = [meta_path]
+    if G.labels is None:
+        stale.append(os.path.join(path, "labels.npy"))
+    if terminals is None:
+        stale.append(os.path.join(path, "terminals.npy"))
+    for name in stale:
+        if os.path.exists(name):
+            os.remove(name)
+
+    def save(name: str, array: np.ndarray) -> None:
+        _replace_file(os.path.join(path, name), lambda fh: np.save(fh, array))
+
+    save("indptr.npy", np.asarray(G.indptr))
+    save("indices.npy", np.asarray(G.indices))
+    if G.labels is not None:
+        save("labels.npy", np.asarray(G.labels))
+    if terminals is not None:
+        terms = np.fromiter(terminals, dtype=np.int64)
+        terms.sort()
+        save("terminals.npy", terms)
+    meta = {
+        "version": SNAPSHOT_VERSION,
+        "n": G.number_of_nodes(),
+        "m": G.number_of_edges(),
+        "root": None if root is None else int(root),
+        "has_labels": G.labels is not None,
+        "has_terminals": terminals is not None,
+    }
+    # meta.json is written last so a half-written snapshot is never valid
+    _replace_file(meta_path, lambda fh: fh.write(json.dumps(meta).encode()))
+
+def load_snapshot(
+    path: str,
+    mmap: bool = True
+) -> Tuple[CSRGraph, Optional[int], Optional[Set[int]]]:
+    """
+    Reopen a snapshot written by save_snapshot.
+
+    :param path: snapshot directory
+    :param mmap: memory-map the arrays read-only instead of reading them
+    :return: (graph, root, terminals); root/terminals are None if not stored
+    """
+    with open(os.path.join(path, "meta.json")) as fh:
+        meta = json.load(fh)
+    if meta.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"unsupported snapshot version {meta.get('version')}")
+    mode = "r" if mmap else None
+    indptr = np.load(os.path.join(path, "indptr.npy"), mmap_mode=mode)
+    indices = np.load(os.path.join(path, "indices.npy"), mmap_mode=mode)
+    labels = None
+    if meta["has_labels"]:
+        labels = np.load(os.path.join(path, "labels.npy"), mmap_mode=mode)
+    G = CSRGraph(indptr, indices, labels)
+    terminals = None
+    if meta["has_terminals"]:
+        terminals = set(np.load(os.path.join(path, "terminals.npy")).tolist())
+    return G, meta["root"], terminals
+
+def open_edge_list(
+    edge_list_path: str,
+    snapshot_path: Optional[str] = None
+) -> Tuple[CSRGraph, Optional[int], Optional[Set[int]]]:
+    """
+    Load an edge list through a cached snapshot.
+
+    The first call parses the text file and writes the snapshot to
+    `snapshot_path` (default: "<edge_list_path>.csr"); later calls reopen
+    the snapshot via memory-mapping, unless the edge list is newer.
+    """
+    if snapshot_path is None:
+        snapshot_path = edge_list_path + ".csr"
+    meta_path = os.path.join(snapshot_path, "meta.json")
+    if (os.path.exists(meta_path)
+            and os.path.getmtime(meta_path) >= os.path.getmtime(edge_list_path)):
+        return load_snapshot(snapshot_path)
+    G = load_edge_list(edge_list_path)
+    save_snapshot(snapshot_path, G)
+    return load_snapshot(snapshot_path)
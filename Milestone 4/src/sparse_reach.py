@@ -0,0 +1,110 @@
+# src/sparse_reach.py
+
+from typing import Hashable, Iterable, List, Optional, Tuple, Union
+import numpy as np
+import networkx as nx
+import scipy.sparse as sp
+
+from src.csr_graph import CSRGraph
+
+def adjacency_matrix(G: Union[nx.DiGraph, CSRGraph]) -> Tuple[sp.csr_matrix, List[Hashable]]:
+    """
+    Boolean adjacency of G as a scipy CSR matrix, plus the node order of
+    its rows/columns (list(G.nodes())). CSR graphs share their own index
+    arrays with the matrix, so it must not be modified in place.
+    """
+    nodes = list(G.nodes())
+    n = len(nodes)
+    if isinstance(G, CSRGraph):
+        indices = np.asarray(G.indices)
+        data = np.ones(len(indices), dtype=bool)
+        return sp.csr_matrix((data, indices, np.asarray(G.indptr)), shape=(n, n)), nodes
+    if isinstance(G, nx.Graph):
+        A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None,
+                                     dtype=bool, format="csr")
+        return sp.csr_matrix(A), nodes
+    # any other graph type exposing successors()
+    pos = {u: i for i, u in enumerate(nodes)}
+    rows, cols = [], []
+    for u in nodes:
+        for v in G.successors(u):
+            rows.append(pos[u])
+            cols.append(pos[v])
+    data = np.ones(len(rows), dtype=bool)
+    return sp.csr_matrix((data, (rows, cols)), shape=(n, n)), nodes
+
+def reachability_matrix(
+    G: Union[nx.DiGraph, CSRGraph],
+    sources: Iterable[Hashable],
+    max_depth: int,
+    targets: Optional[Iterable[Hashable]] = None,
+    exclude: Optional[np.ndarray] = None,
+    chunk_size: int = 4096,
+    distances: bool = False
+) -> sp.csr_matrix:
+    """
+    Depth-bounded reachability of many sources at once, by sparse boolean
+    matrix products instead of one BFS per source.
+
+    Row i, column j is True iff targets[j] lies within `max_depth` hops of
+    sources[i], i.e. targets[j] ∈ bfs_subtree_nodes(G, sources[i], max_depth).
+    Each round multiplies only the newly reached frontier F by the
+    adjacency A (R ← R ∨ F·A), so an edge is expanded at most once per
+    source. Sources are processed `chunk_size` rows at a time and only the
+    target columns of each chunk are kept, bounding peak memory.
+
+    :param targets: column nodes (default: all nodes, in G.nodes() order)
+    :param exclude: boolean mask over G.nodes() order of nodes never stepped
+                    onto, e.g. the complement of C = V \\ A; sources are
+                    always reached
+    :param distances: store 1 + hop distance instead of True, so one
+                      matrix at D_max answers every D ≤ D_max
+                      (entries with data ≤ D + 1)
+    :returns: len(sources) × len(targets) CSR matrix with sorted column
+              indices, boolean (or int16 distances + 1)
+    """
+    A, nodes = adjacency_matrix(G)
+    n = len(nodes)
+    identity = isinstance(G, CSRGraph)
+    pos = None if identity else {u: i for i, u in enumerate(nodes)}
+    src = np.fromiter((u if identity else pos[u] for u in sources), dtype=np.int64)
+    if targets is None:
+        cols = None
+    else:
+        cols = np.fromiter((t if identity else pos[t] for t in targets), dtype=np.int64)
+    if exclude is not None:
+        # only step onto allowed nodes: drop edges into excluded columns
+        keep = ~np.asarray(exclude, dtype=bool)[A.indices]
+        row_ids = np.repeat(np.arange(n), np.diff(A.indptr))[keep]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_ids, minlength=n), out=indptr[1:])
+        A = sp.csr_matrix((A.data[keep], A.indices[keep], indptr), shape=A.shape)
+
+    blocks = []
+    for start in range(0, len(src), chunk_size):
+        chunk = src[start:start + chunk_size]
+        rows = np.arange(len(chunk))
+        reached = sp.csr_matrix((np.ones(len(chunk), dtype=bool), (rows, chunk)),
+                                shape=(len(chunk), n))
+        frontier = reached
+        dist = sp.csr_matrix(reached, dtype=np.int16) if distances else None
+        for depth in range(1, max_depth + 1):
+            step = frontier @ A
+            # new = step ∧ ¬reached
+            frontier = step > reached
+            if frontier.nnz == 0:
+                break
+            reached = reached + frontier
+            if distances:
+                dist = dist + sp.csr_matrix(frontier, dtype=np.int16) * (depth + 1)
+        if distances:
+            reached = dist
+        if cols is not None:
+            reached = reached[:, cols]
+        reached = sp.csr_matrix(reached, dtype=np.int16 if distances else bool)
+        reached.sort_indices()
+        blocks.append(reached)
+    width = n if cols is None else len(cols)
+    if not blocks:
+        return sp.csr_matrix((0, width), dtype=np.int16 if distances else bool)
+    return sp.vstack(blocks, format="csr")
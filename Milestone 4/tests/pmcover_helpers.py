@@ -0,0 +1,12 @@
+import random
+
+def random_cover_instance(seed, anchors=6, per_anchor=15, universe=150, max_size=20,
+                          min_size=0, min_budget=0, max_budget=3):
+    """Random pmcover instance: per_anchor keys (a, c) for each anchor a."""
+    rng = random.Random(seed)
+    sets = {
+        (a, c): set(rng.sample(range(universe), rng.randint(min_size, max_size)))
+        for a in range(anchors) for c in rng.sample(range(1000), per_anchor)
+    }
+    budgets = {a: rng.randint(min_budget, max_budget) for a in range(anchors)}
+    return sets, budgets
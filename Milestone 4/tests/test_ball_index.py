@@ -0,0 +1,116 @@
+import networkx as nx
+import pytest
+from src.ball_index import BallIndex, TerminalBallIndex
+from src.bfs import bfs_subtree_nodes
+from src.csr_graph import from_networkx
+from src.graph_loader import generate_directed_ER
+from src.greedy_packing import build_ball_index, find_greedy_packing
+
+def test_balls_match_bfs():
+    """Every indexed ball equals the depth-bounded BFS from that node."""
+    G = generate_directed_ER(50, 0.06, seed=4)
+    index = BallIndex(G, 2)
+    assert len(index) == 50
+    for u in G.nodes():
+        assert set(index.ball(u)) == bfs_subtree_nodes(G, u, 2)
+        assert index.ball_size(u) == len(bfs_subtree_nodes(G, u, 2))
+
+def test_sparse_engine_matches_bfs_engine():
+    """Balls built by sparse matrix products equal the per-node BFS balls."""
+    G = generate_directed_ER(60, 0.05, seed=8)
+    for H in (G, from_networkx(G)):
+        bfs = BallIndex(H, 3)
+        sparse = BallIndex(H, 3, engine="sparse")
+        assert sparse.indptr.tolist() == bfs.indptr.tolist()
+        assert sparse.members.tolist() == bfs.members.tolist()
+    labelled = nx.DiGraph([("r", "x"), ("x", "y"), ("y", "z")])
+    index = BallIndex(labelled, 2, sources=["x"], engine="sparse")
+    assert set(index.ball("x")) == {"x", "y", "z"}
+
+def test_ball_index_non_integer_labels():
+    """Arbitrary node labels are mapped to positions and back."""
+    G = nx.DiGraph([("r", "x"), ("x", "y"), ("y", "z")])
+    index = BallIndex(G, 2, sources=["x"])
+    assert "x" in index and "r" not in index
+    assert set(index.ball("x")) == {"x", "y", "z"}
+
+def test_packing_reuses_prebuilt_index():
+    """A shared index gives the same packs as the per-call default."""
+    G = from_networkx(generate_directed_ER(80, 0.05, seed=8))
+    terminals = set(range(50, 80))
+    index = BallIndex(G, 2)
+    for k in (1, 4, 16):
+        assert find_greedy_packing(G, 0, terminals, k, 2, ball_index=index) == \
+            find_greedy_packing(G, 0, terminals, k, 2)
+
+def test_packing_rejects_wrong_depth():
+    """A deeper index without recorded distances cannot serve D_star."""
+    G = generate_directed_ER(10, 0.2, seed=1)
+    with pytest.raises(ValueError):
+        find_greedy_packing(G, 0, {3}, 1, 2, ball_index=BallIndex(G, 3))
+
+def test_reverse_index_is_transpose():
+    """containing(v) lists exactly the sources whose ball holds v."""
+    G = generate_directed_ER(40, 0.08, seed=6)
+    index = BallIndex(G, 2)
+    for v in G.nodes():
+        expected = {u for u in G.nodes() if v in bfs_subtree_nodes(G, u, 2)}
+        assert set(index.containing(v)) == expected
+
+def test_terminal_index_matches_forward_balls():
+    """Backward BFS from terminals yields the same per-node coverage."""
+    G = from_networkx(generate_directed_ER(60, 0.06, seed=2))
+    terminals = {3, 17, 29, 44}
+    forward = BallIndex(G, 2)
+    reverse = TerminalBallIndex(G, 2, terminals)
+    for u in G.nodes():
+        assert reverse.terminals_in_ball(u, terminals) == \
+            forward.terminals_in_ball(u, terminals)
+        assert set(reverse.ball(u)) == set(forward.ball(u))
+        assert set(reverse.containing(u)) == set(forward.containing(u))
+
+def test_packing_engines_agree():
+    """Forward, sparse, reverse and auto engines return identical packs."""
+    G = generate_directed_ER(120, 0.03, seed=12)
+    terminals = {7, 19, 33, 58, 90, 101}
+    for k in (1, 4, 9):
+        packs = find_greedy_packing(G, 0, terminals, k, 3, engine="forward")
+        for engine in ("sparse", "reverse", "auto"):
+            assert find_greedy_packing(G, 0, terminals, k, 3, engine=engine) == packs
+    with pytest.raises(ValueError):
+        find_greedy_packing(G, 0, terminals, 4, 3, engine="sideways")
+
+def test_at_depth_matches_fresh_index():
+    """An index with distances at depth 3 yields the depth-1/2 indices."""
+    G = generate_directed_ER(60, 0.05, seed=14)
+    for engine in ("bfs", "sparse"):
+        deep = BallIndex(G, 3, engine=engine, distances=True)
+        for D in (0, 1, 2, 3):
+            fresh = BallIndex(G, D)
+            view = deep.at_depth(D)
+            assert view.indptr.tolist() == fresh.indptr.tolist()
+            assert view.members.tolist() == fresh.members.tolist()
+            assert sorted(view.containing(5)) == sorted(fresh.containing(5))
+    with pytest.raises(ValueError):
+        BallIndex(G, 3).at_depth(2)
+
+def test_packing_depth_sweep_reuses_one_index():
+    """Every D_star ≤ D_max gives the packs of a per-depth index
+    (the order inside a pack follows set iteration and may differ)."""
+    G = generate_directed_ER(100, 0.03, seed=21)
+    terminals = set(range(3, 100, 4))
+    for engine in ("forward", "reverse"):
+        index = build_ball_index(G, terminals, 4, engine=engine, distances=True)
+        for D in (1, 2, 3, 4):
+            swept = find_greedy_packing(G, 0, terminals, 9, D, ball_index=index)
+            fresh = find_greedy_packing(G, 0, terminals, 9, D, engine=engine)
+            assert [sorted(pack) for pack in swept] == [sorted(pack) for pack in fresh]
+
+def test_packing_rejects_deeper_index_for_other_terminals():
+    """A deeper reverse index narrowed by at_depth still checks its terminals."""
+    G = generate_directed_ER(100, 0.03, seed=21)
+    terminals = set(range(3, 100, 4))
+    index = build_ball_index(G, {5}, 4, engine="reverse", distances=True)
+    for D in (3, 4):
+        with pytest.raises(ValueError):
+            find_greedy_packing(G, 0, terminals, 9, D, ball_index=index)
@@ -0,0 +1,100 @@
+from collections import deque
+import numpy as np
+import networkx as nx
+import pytest
+from src.bfs import bfs_distances, bfs_subtree_nodes, frontier_bfs
+from src.complete import shortest_path
+from src.csr_graph import from_networkx, to_networkx
+from src.graph_loader import generate_directed_ER, generate_sparse_directed_ER
+
+def deque_bfs(G, source, max_depth=None, allowed=None):
+    """Reference BFS returning {node: (depth, parent)}."""
+    info = {source: (0, -1)}
+    queue = deque([source])
+    while queue:
+        u = queue.popleft()
+        depth = info[u][0]
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for v in G.successors(u):
+            if v in info or (allowed is not None and v not in allowed):
+                continue
+            info[v] = (depth + 1, u)
+            queue.append(v)
+    return info
+
+def test_frontier_bfs_matches_deque_order_and_depths():
+    """Same visit order and depths as a FIFO BFS."""
+    G = from_networkx(generate_directed_ER(80, 0.05, seed=2))
+    for source in (0, 17, 55):
+        for max_depth in (None, 1, 2):
+            visited, depths = frontier_bfs(G.indptr, G.indices, source,
+                                           max_depth=max_depth)
+            ref = deque_bfs(G, source, max_depth)
+            assert visited.tolist() == list(ref)
+            assert depths.tolist() == [ref[v][0] for v in ref]
+
+def test_frontier_bfs_exclusion_mask():
+    """Excluded nodes are never entered; sources are always visited."""
+    G = from_networkx(nx.DiGraph([(0, 1), (1, 2), (0, 3), (3, 4), (4, 2)]))
+    exclude = np.zeros(5, dtype=bool)
+    exclude[[0, 1]] = True
+    visited, depths = frontier_bfs(G.indptr, G.indices, 0, exclude=exclude)
+    assert visited.tolist() == [0, 3, 4, 2]
+    assert depths.tolist() == [0, 1, 2, 3]
+
+def test_shared_scratch_mask_is_cleared_between_searches():
+    """Searches sharing one scratch mask match fresh ones and leave it all-False."""
+    G = generate_sparse_directed_ER(3000, 2e-3, seed=4)
+    exclude = np.zeros(3000, dtype=bool)
+    exclude[::4] = True
+    scratch = np.zeros(3000, dtype=bool)
+    for source in (1, 5, 9, 5):
+        for D in (2, 6):
+            assert bfs_subtree_nodes(G, source, D, scratch=scratch) == \
+                   bfs_subtree_nodes(G, source, D)
+            assert bfs_distances(G, source, D, exclude=exclude, scratch=scratch) == \
+                   bfs_distances(G, source, D, exclude=exclude)
+            assert not scratch.any()
+    visited, _ = frontier_bfs(G.indptr, G.indices, 5, scratch=scratch)
+    assert visited.tolist() == frontier_bfs(G.indptr, G.indices, 5)[0].tolist()
+    assert not scratch.any()
+
+def test_csr_subtree_nodes_matches_networkx():
+    """The hybrid CSR search agrees with the generic one, with and without restrictions."""
+    G = generate_sparse_directed_ER(3000, 2e-3, seed=4)
+    H = to_networkx(G)
+    allowed = set(range(0, 3000, 3)) | {5}
+    for D in (1, 3, 6):
+        assert bfs_subtree_nodes(G, 5, D) == bfs_subtree_nodes(H, 5, D)
+        assert bfs_subtree_nodes(G, 5, D, allowed) == bfs_subtree_nodes(H, 5, D, allowed)
+        assert bfs_subtree_nodes(G, 5, D, reverse=True) == \
+               bfs_subtree_nodes(H, 5, D, reverse=True)
+
+def test_csr_shortest_path():
+    """CSR shortest paths are the FIFO BFS paths and raise on unreachable targets."""
+    G = from_networkx(generate_directed_ER(60, 0.05, seed=7))
+    ref = deque_bfs(G, 0)
+    for t in ref:
+        path = [t]
+        while ref[path[-1]][1] != -1:
+            path.append(ref[path[-1]][1])
+        assert shortest_path(G, 0, t) == path[::-1]
+    G = from_networkx(nx.DiGraph([(0, 1), (2, 1)]))
+    with pytest.raises(nx.NetworkXNoPath):
+        shortest_path(G, 0, 2)
+
+def test_bfs_distances_match_reference():
+    """Hop distances agree with a FIFO BFS on networkx and CSR graphs."""
+    G = generate_sparse_directed_ER(2000, 3e-3, seed=6)
+    H = to_networkx(G)
+    allowed = set(range(1, 2000, 2)) | {4}
+    for D in (1, 4):
+        ref = {v: d for v, (d, _) in deque_bfs(H, 4, D).items()}
+        assert bfs_distances(G, 4, D) == ref
+        assert bfs_distances(H, 4, D) == ref
+        restricted = {v: d for v, (d, _) in deque_bfs(H, 4, D, allowed).items()}
+        assert bfs_distances(G, 4, D, allowed=allowed) == restricted
+        exclude = np.ones(2000, dtype=bool)
+        exclude[list(allowed)] = False
+        assert bfs_distances(G, 4, D, exclude=exclude) == restricted
@@ -0,0 +1,31 @@
+import pytest
+import numpy as np
+from src.bitset import (
+    BitIndexer, _popcount_words_table, bits_from_positions, popcount,
+    popcount_words, positions_from_bits
+)
+
+def test_positions_roundtrip():
+    """Small and large position lists survive the bitmap roundtrip."""
+    for positions in ([], [0], [3, 64, 65], list(range(0, 500, 7))):
+        bits = bits_from_positions(positions, 600)
+        assert popcount(bits) == len(positions)
+        assert positions_from_bits(bits) == positions
+
+def test_indexer_set_algebra():
+    """Bitmap AND / AND-NOT agree with set intersection / difference."""
+    universe = ["x", "y", "z", "w"]
+    idx = BitIndexer(universe)
+    a, b = {"x", "z", "w"}, {"z", "y"}
+    bits_a, bits_b = idx.to_bits(a), idx.to_bits(b)
+    assert set(idx.from_bits(bits_a & bits_b)) == a & b
+    assert set(idx.from_bits(bits_a & ~bits_b)) == a - b
+    assert idx.to_bits({"not-in-universe"}) == 0
+
+def test_popcount_words():
+    """Vectorized word popcounts (and the byte-table fallback) match popcount."""
+    rng = np.random.default_rng(0)
+    words = rng.integers(0, 2**63, size=(5, 7), dtype=np.uint64) << np.uint64(1)
+    expected = [[popcount(int(w)) for w in row] for row in words]
+    assert popcount_words(words).tolist() == expected
+    assert _popcount_words_table(words).tolist() == expected
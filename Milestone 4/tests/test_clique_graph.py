@@ -0,0 +1,48 @@
+import networkx as nx
+import pytest
+from src.clique_graph import CliqueGraph
+from src.complete import complete, shortest_path
+from src.graph_loader import generate_directed_clique
+from src.greedy_packing import find_greedy_packing, bfs_subtree_nodes
+
+def test_implicit_clique_matches_materialized():
+    """The implicit clique must expose the same adjacency as the DiGraph one."""
+    n = 7
+    G = generate_directed_clique(n)
+    K = generate_directed_clique(n, implicit=True)
+    assert isinstance(K, CliqueGraph)
+    assert K.number_of_nodes() == n
+    assert K.number_of_edges() == G.number_of_edges()
+    for u in range(n):
+        assert K.successors(u) == sorted(G.successors(u))
+        assert K.out_degree(u) == n - 1
+    assert sorted(K.edges()) == sorted(G.edges())
+
+def test_clique_balls_closed_form():
+    """BFS balls on the implicit clique agree with generic BFS."""
+    n = 9
+    G = generate_directed_clique(n)
+    K = CliqueGraph(n)
+    allowed = {2, 3, 5}
+    for depth in (0, 1, 3):
+        assert bfs_subtree_nodes(K, 4, depth) == bfs_subtree_nodes(G, 4, depth)
+        assert bfs_subtree_nodes(K, 2, depth, allowed=allowed) == \
+            bfs_subtree_nodes(G, 2, depth, allowed=allowed)
+
+def test_clique_packing_matches_materialized():
+    """Greedy packing is identical on both clique representations."""
+    n = 12
+    G = generate_directed_clique(n)
+    K = CliqueGraph(n)
+    terminals = {3, 5, 8, 11}
+    for D_star in (0, 1, 2):
+        assert find_greedy_packing(K, 0, terminals, 4, D_star) == \
+            find_greedy_packing(G, 0, terminals, 4, D_star)
+
+def test_large_implicit_clique_is_cheap():
+    """A 20k-node clique never materializes its ~400M edges."""
+    K = CliqueGraph(20000)
+    assert find_greedy_packing(K, 0, {1, 2, 3}, 4, 3) == []
+    assert shortest_path(K, 0, 19999) == [0, 19999]
+    T = complete(K, 0, [], [(0, 7)], {7: [7, 123]}, 4)
+    assert nx.has_path(T, 0, 123)
@@ -0,0 +1,143 @@
+import math
+import networkx as nx
+from src.bfs import bfs_subtree_nodes
+from src.clique_graph import CliqueGraph
+from src.cover_instance import (CoverDistances, build_cover_instance,
+                                reduce_cover_instance, stream_cover_instance)
+from src.csr_graph import from_networkx
+from src.graph_loader import generate_directed_ER, generate_directed_clique
+from src.pmcover import pmcover_half
+from src.pmcover_lazy import pmcover_lazy
+
+def reference_cover_instance(G, root, terminals, packs, D_star, k):
+    """Per-edge construction: one restricted BFS for every a->c edge."""
+    A = {root} | (set().union(*packs) if packs else set())
+    C = set(G.nodes()) - A
+    budgets = {a: math.ceil(math.sqrt(k)) for a in A}
+    sets, cover_map = {}, {}
+    for a in A:
+        for c in G.successors(a):
+            if c not in C:
+                continue
+            cover = bfs_subtree_nodes(G, c, D_star, allowed=C) & terminals
+            if cover:
+                sets[(a, c)] = cover
+                cover_map[c] = list(cover)
+    return sets, budgets, cover_map
+
+def test_matches_per_edge_construction():
+    """Same keys (in the same order), sets and budgets as the per-edge version."""
+    G = generate_directed_ER(60, 0.08, seed=3)
+    terminals = set(range(1, 60, 3))
+    packs = [[1, 4], [7]]
+    for D_star in (1, 2, 3):
+        got = build_cover_instance(G, 0, terminals, packs, D_star, k=9)
+        ref = reference_cover_instance(G, 0, terminals, packs, D_star, k=9)
+        assert list(got[0].items()) == list(ref[0].items())
+        assert got[1] == ref[1]
+        assert {c: set(v) for c, v in got[2].items()} == \
+               {c: set(v) for c, v in ref[2].items()}
+
+def test_cover_sets_shared_per_c():
+    """All keys with the same c share a single cover-set object."""
+    G = nx.DiGraph([(0, 3), (1, 3), (2, 3), (3, 4)])
+    sets, budgets, cover_map = build_cover_instance(G, 0, {1, 2, 4}, [[1, 2]], 1, k=4)
+    assert set(sets) == {(0, 3), (1, 3), (2, 3)}
+    assert sets[(0, 3)] == {4}
+    assert sets[(0, 3)] is sets[(1, 3)] is sets[(2, 3)]
+    assert budgets == {0: 2, 1: 2, 2: 2}
+    assert cover_map == {3: [4]}
+
+def test_csr_and_implicit_clique_backends():
+    """CSR and implicit-clique graphs give the networkx instance."""
+    G = generate_directed_ER(40, 0.1, seed=5)
+    terminals = set(range(0, 40, 4)) - {0}
+    args = (0, terminals, [[4]], 2, 4)
+    assert build_cover_instance(from_networkx(G), *args)[0] == \
+           build_cover_instance(G, *args)[0]
+
+    clique = generate_directed_clique(12)
+    args = (0, {2, 5, 9}, [[2]], 1, 4)
+    implicit = build_cover_instance(CliqueGraph(12), *args)
+    explicit = build_cover_instance(clique, *args)
+    assert implicit[0] == explicit[0]
+    assert implicit[1] == explicit[1]
+
+def test_sparse_engine_matches_bfs():
+    """engine='sparse' yields the same instance as the per-c searches."""
+    G = generate_directed_ER(80, 0.06, seed=9)
+    terminals = set(range(2, 80, 3))
+    packs = [[2, 5], [11]]
+    for H in (G, from_networkx(G)):
+        for D_star in (1, 3):
+            bfs = build_cover_instance(H, 0, terminals, packs, D_star, k=9)
+            sparse = build_cover_instance(H, 0, terminals, packs, D_star, k=9,
+                                          engine="sparse")
+            assert list(sparse[0].items()) == list(bfs[0].items())
+            assert {c: set(v) for c, v in sparse[2].items()} == \
+                   {c: set(v) for c, v in bfs[2].items()}
+
+def test_cover_distances_answer_every_depth():
+    """One CoverDistances at depth 3 reproduces build_cover_instance for D ≤ 3."""
+    G = generate_directed_ER(70, 0.06, seed=13)
+    terminals = set(range(1, 70, 3))
+    packs = [[1, 4], [10]]
+    for H in (G, from_networkx(G)):
+        for engine in ("bfs", "sparse"):
+            dist = CoverDistances(H, 0, terminals, packs, 3, engine=engine)
+            for D_star in (0, 1, 2, 3):
+                got = dist.instance(D_star, k=9)
+                ref = build_cover_instance(H, 0, terminals, packs, D_star, k=9)
+                assert list(got[0].items()) == list(ref[0].items())
+                assert got[1] == ref[1]
+                assert {c: set(v) for c, v in got[2].items()} == \
+                       {c: set(v) for c, v in ref[2].items()}
+
+def test_reduce_drops_dominated_keys_per_anchor():
+    """Subsets and duplicates under one anchor go; other anchors are untouched."""
+    big, small, dup = {1, 2, 3}, {2, 3}, {1, 2, 3}
+    sets = {(0, 10): small, (0, 11): big, (0, 12): dup,
+            (5, 13): {2, 3}, (5, 14): {4}, (7, 15): {1, 2, 3}}
+    reduced, stats = reduce_cover_instance(sets)
+    assert list(reduced) == [(0, 11), (5, 13), (5, 14), (7, 15)]
+    # identical content under different anchors shares one object
+    assert reduced[(7, 15)] is reduced[(0, 11)]
+    assert stats == {
+        "keys_before": 6, "keys_after": 4,
+        "distinct_before": 3, "distinct_after": 3,
+        "elements_before": 14, "elements_after": 9,
+    }
+
+def test_reduce_keeps_greedy_coverage():
+    """The pmcover greedy variants cover as much on the reduced instance."""
+    G = generate_directed_ER(150, 0.04, seed=17)
+    terminals = set(range(1, 150, 4))
+    packs = [[1, 5]]
+    sets, budgets, _ = build_cover_instance(G, 0, terminals, packs, 2, k=16)
+    reduced, stats = reduce_cover_instance(sets)
+    assert stats["keys_after"] <= stats["keys_before"]
+    for pmcover in (pmcover_half, pmcover_lazy):
+        full = set().union(*(sets[key] for key in pmcover(sets, budgets, 30)))
+        small = set().union(*(reduced[key] for key in pmcover(reduced, budgets, 30)))
+        assert len(small) >= len(full)
+
+def test_reduce_collapses_clique_instance():
+    """On a clique every c under an anchor has the same set, so one key remains."""
+    sets, budgets, _ = build_cover_instance(CliqueGraph(30), 0, {3, 7, 9}, [[3]], 1, k=4)
+    reduced, stats = reduce_cover_instance(sets)
+    assert stats["keys_after"] == len(budgets)
+    assert stats["distinct_after"] == 1
+
+def test_stream_yields_the_built_instance():
+    """The lazy stream carries the same (key, cover) pairs and budgets."""
+    G = generate_directed_ER(50, 0.08, seed=9)
+    terminals = set(range(1, 50, 3))
+    packs = [[1, 4]]
+    cases = [(G, 2), (from_networkx(G), 2), (CliqueGraph(10), 1), (CliqueGraph(10), 0)]
+    for graph, D_star in cases:
+        sets, budgets, _ = build_cover_instance(graph, 0, terminals, packs, D_star, 9)
+        stream_budgets, pairs = stream_cover_instance(graph, 0, terminals, packs,
+                                                      D_star, 9)
+        assert stream_budgets == budgets
+        streamed = dict(pairs)
+        assert streamed == sets
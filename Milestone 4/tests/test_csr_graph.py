@@ -0,0 +1,65 @@
+import networkx as nx
+import pytest
+from src.csr_graph import CSRGraph, from_networkx, to_networkx
+from src.complete import complete
+from src.graph_loader import generate_directed_ER
+from src.greedy_packing import find_greedy_packing, bfs_subtree_nodes
+from src.simulator import simulate_broadcast_rounds
+
+def test_from_networkx_roundtrip():
+    """Converting to CSR and back should preserve nodes and edges."""
+    G = generate_directed_ER(30, 0.1, seed=3)
+    C = from_networkx(G)
+    assert C.number_of_nodes() == 30
+    assert C.number_of_edges() == G.number_of_edges()
+    H = to_networkx(C)
+    assert sorted(H.edges()) == sorted(G.edges())
+
+def test_successor_order_matches_networkx():
+    """CSR successors must follow networkx adjacency order."""
+    G = nx.DiGraph()
+    G.add_nodes_from(range(4))
+    G.add_edges_from([(0, 3), (0, 1), (0, 2), (2, 0)])
+    C = from_networkx(G)
+    assert C.successors(0) == [3, 1, 2]
+    assert C.predecessors(0) == [2]
+    assert C.out_degree(0) == 3
+    assert C.has_edge(2, 0) and not C.has_edge(0, 0)
+    assert 3 in C and 4 not in C and -1 not in C
+
+def test_from_networkx_rejects_noncontiguous_labels():
+    """Non 0..n-1 labels must be relabeled before conversion."""
+    G = nx.DiGraph([("a", "b")])
+    with pytest.raises(ValueError):
+        from_networkx(G)
+
+def test_from_edges_sorts_successors():
+    """Successor lists come out in ascending order whatever the edge order."""
+    C = CSRGraph.from_edges(3, [2, 0, 0], [1, 2, 1])
+    assert C.successors(0) == [1, 2]
+    assert C.successors(1) == []
+    assert C.successors(2) == [1]
+
+def test_from_edges_rejects_out_of_range_endpoints():
+    """Sources and targets outside 0..n-1 raise instead of growing indptr."""
+    for sources, targets in (([0, 3], [1, 2]), ([0, 1], [1, 3]), ([-1], [0])):
+        with pytest.raises(ValueError):
+            CSRGraph.from_edges(3, sources, targets)
+
+def test_pipeline_matches_on_csr():
+    """Packing, stitching and simulation agree between DiGraph and CSR."""
+    G = generate_directed_ER(60, 0.08, seed=11)
+    C = from_networkx(G)
+    terminals = set(range(40, 60))
+    assert bfs_subtree_nodes(G, 5, 2) == bfs_subtree_nodes(C, 5, 2)
+    packs_nx = find_greedy_packing(G, 0, terminals, 9, 2)
+    packs_csr = find_greedy_packing(C, 0, terminals, 9, 2)
+    assert packs_nx == packs_csr
+    T = complete(C, 0, packs_csr, [], {}, 9)
+    for pack in packs_csr:
+        assert nx.has_path(T, 0, pack[0])
+
+def test_simulator_accepts_csr_tree():
+    """A CSR tree 0→1→2, 0→3 broadcasts to {2, 3} in 2 rounds."""
+    T = CSRGraph.from_edges(4, [0, 1, 0], [1, 2, 3])
+    assert simulate_broadcast_rounds(T, 0, {2, 3}) == 2
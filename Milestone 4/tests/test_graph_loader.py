@@ -1,6 +1,9 @@
 import networkx as nx
 import pytest
-from src.graph_loader import generate_directed_ER, generate_directed_clique
+from src.csr_graph import CSRGraph
+from src.graph_loader import (
+    generate_directed_ER, generate_directed_clique, generate_sparse_directed_ER
+)
 
 def test_ER_node_count_and_type():
     """ER graph should have exactly n nodes and be directed."""
@@ -43,3 +46,24 @@ def test_clique_node_count_and_edges():
                 assert G.has_edge(u, v)
             else:
                 assert not G.has_edge(u, v)
+
+def test_sparse_ER_reproducible_and_simple():
+    """Sparse ER must be seeded, loop-free and duplicate-free."""
+    G1 = generate_sparse_directed_ER(200, 0.05, seed=9)
+    G2 = generate_sparse_directed_ER(200, 0.05, seed=9)
+    assert isinstance(G1, CSRGraph)
+    assert G1.number_of_nodes() == 200
+    assert list(G1.edges()) == list(G2.edges())
+    edges = list(G1.edges())
+    assert len(edges) == len(set(edges))
+    assert all(u != v for u, v in edges)
+
+def test_sparse_ER_edge_probability():
+    """p=1 gives the full digraph, p=0 none; mid p is close to n(n-1)p."""
+    n = 8
+    assert generate_sparse_directed_ER(n, 1.0, seed=1).number_of_edges() == n * (n - 1)
+    assert generate_sparse_directed_ER(n, 0.0, seed=1).number_of_edges() == 0
+    n, p = 400, 0.02
+    m = generate_sparse_directed_ER(n, p, seed=5).number_of_edges()
+    expected = n * (n - 1) * p
+    assert abs(m - expected) < 5 * expected ** 0.5
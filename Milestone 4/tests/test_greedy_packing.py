@@ -66,3 +66,38 @@ def test_vertex_disjointness():
         pack_nodes = set(pack)
         assert all_nodes.isdisjoint(pack_nodes)
         all_nodes |= pack_nodes
+
+def test_lazy_mode_matches_full_scan():
+    """
+    Lazy-heap candidate selection must return exactly the packs of the
+    full per-round scan, including tie-breaking.
+    """
+    from src.graph_loader import generate_directed_ER
+    for seed in range(5):
+        G = generate_directed_ER(60, 0.05, seed=seed)
+        terminals = set(range(30, 60, 2))
+        for k in (1, 4, 16):
+            eager = find_greedy_packing(G, 0, terminals, k, 2)
+            lazy = find_greedy_packing(G, 0, terminals, k, 2, lazy=True)
+            assert eager == lazy
+
+def test_bitset_mode_matches_sets():
+    """Bitmap coverage gives the same packs as Python sets (k > 1)."""
+    from src.graph_loader import generate_directed_ER
+    G = generate_directed_ER(80, 0.05, seed=21)
+    terminals = set(range(20, 80, 3))
+    for k in (4, 16):
+        for lazy in (False, True):
+            packs = find_greedy_packing(G, 0, terminals, k, 2, lazy=lazy)
+            bit_packs = find_greedy_packing(G, 0, terminals, k, 2, lazy=lazy,
+                                            bitset=True)
+            assert [sorted(p) for p in bit_packs] == [sorted(p) for p in packs]
+
+def test_parallel_scan_matches_serial():
+    """A process-pool scan returns the serial packs, ties included."""
+    from src.graph_loader import generate_directed_ER
+    G = generate_directed_ER(70, 0.05, seed=5)
+    terminals = set(range(10, 70, 4))
+    for k in (1, 9):
+        assert find_greedy_packing(G, 0, terminals, k, 2, workers=2) == \
+            find_greedy_packing(G, 0, terminals, k, 2)
@@ -0,0 +1,129 @@
+from functools import partial
+import random
+import pytest
+from src.pmcover_auto import (
+    COST_TERMS, DEFAULT_COSTS, ENGINES, calibrate, instance_stats, pmcover,
+    predict_seconds, register_engine
+)
+from src.pmcover import pmcover_half
+from src.pmcover_bitmatrix import pmcover_bitmatrix
+from src.pmcover_lazy import pmcover_lazy
+from src.pmcover_stochastic import pmcover_stochastic
+from pmcover_helpers import random_cover_instance
+
+random_instance = partial(random_cover_instance, anchors=8, per_anchor=20,
+                          universe=200, max_size=15, min_size=1, min_budget=1)
+
+# greedy takes ('a', 1) first and then finds nothing new for b;
+# ('a', 2) + ('b', 3) covers all 5
+TRAP = {('a', 1): {1, 2, 3}, ('a', 2): {4, 5}, ('b', 3): {1, 2, 3}}
+TRAP_BUDGETS = {'a': 1, 'b': 1}
+# lazy is the cheapest first stage whatever the calibrated defaults say
+LAZY_FIRST = {"lazy": (1e-9,) * 4, "incremental": (1.0,) * 4,
+              "bitmatrix": (1.0,) * 4, "stochastic": (1.0,) * 4,
+              "continuous": (1e-9,) * 4}
+
+def dense_instance(seed, keys=400, anchors=40, universe=128):
+    """Sets of a quarter to half the universe, budget 3 per anchor."""
+    rng = random.Random(seed)
+    sets = {(rng.randrange(anchors), c): set(rng.sample(range(universe), rng.randint(32, 64)))
+            for c in range(keys)}
+    return sets, {a: 3 for a in range(anchors)}
+
+def test_explicit_methods_call_the_engine():
+    """A named method is the engine itself, options included."""
+    sets, budgets = random_instance(1)
+    assert pmcover(sets, budgets, 50, method="half") == pmcover_half(sets, budgets, 50)
+    assert pmcover(sets, budgets, 50, method="lazy") == pmcover_lazy(sets, budgets, 50)
+    assert pmcover(sets, budgets, 50, method="continuous", iters=5, seed=1) == \
+        ENGINES["continuous"](sets, budgets, 50, iters=5, seed=1)
+    with pytest.raises(ValueError):
+        pmcover(sets, budgets, 50, method="simplex")
+
+def test_register_engine():
+    """Registered engines are callable by name and join the auto race once costed."""
+    calls = []
+    def first_fit(sets, budgets, k):
+        calls.append(k)
+        return [next(iter(sets))]
+    register_engine("first_fit", first_fit)
+    try:
+        assert pmcover(TRAP, TRAP_BUDGETS, 1, method="first_fit") == [('a', 1)]
+        report = {}
+        costs = dict(DEFAULT_COSTS, first_fit=(0.0,) * len(COST_TERMS))
+        assert pmcover(TRAP, TRAP_BUDGETS, 3, costs=costs, report=report) == [('a', 1)]
+        assert report["engines"] == ["first_fit"] and calls == [1, 3]
+    finally:
+        del ENGINES["first_fit"]
+
+def test_instance_stats():
+    """Sizes, rank, key skew, coverage upper bound and step estimate of a small instance."""
+    stats = instance_stats(TRAP, {'a': 1}, 5)
+    assert stats["keys"] == 3 and stats["total_size"] == 8
+    assert stats["universe"] == 5 and stats["rank"] == 1
+    assert stats["skew"] == pytest.approx(2 / 3)
+    assert stats["upper_bound"] == 3 and stats["steps"] == 1
+    # a budget of 2 per anchor takes about 5 / (8 / 3) selections
+    assert instance_stats(TRAP, {'a': 2, 'b': 2}, 5)["steps"] == 2
+
+def test_default_costs_trade_engines_on_depth():
+    """With DEFAULT_COSTS lazy leads on a shallow target and the bit matrix
+    once k asks for every terminal of dense sets."""
+    sets, budgets = dense_instance(0)
+    universe = len(set().union(*sets.values()))
+    report = {}
+    pmcover(sets, budgets, universe // 20, report=report)
+    assert report["engines"][0] == "lazy"
+    report = {}
+    chosen = pmcover(sets, budgets, universe, report=report)
+    assert report["engines"][0] == "bitmatrix"
+    assert report["predicted"]["bitmatrix"] < report["predicted"]["lazy"]
+    assert chosen == pmcover_bitmatrix(sets, budgets, universe)
+
+def test_auto_stops_after_cheap_greedy_when_target_met():
+    """Reachable targets are served by the first-stage greedy alone."""
+    sets, budgets = random_instance(2)
+    report = {}
+    chosen = pmcover(sets, budgets, 20, costs=LAZY_FIRST, report=report)
+    assert report["engines"] == ["lazy"] and report["chosen"] == "lazy"
+    assert chosen == pmcover_lazy(sets, budgets, 20)
+
+def test_auto_escalates_when_greedy_misses():
+    """Continuous greedy runs only when the greedy misses a reachable target."""
+    report = {}
+    chosen = pmcover(TRAP, TRAP_BUDGETS, 5, costs=LAZY_FIRST, report=report, iters=10)
+    assert report["engines"] == ["lazy", "continuous"]
+    assert report["chosen"] == "continuous"
+    assert set().union(*(TRAP[key] for key in chosen)) == {1, 2, 3, 4, 5}
+
+    # unreachable beyond the greedy's coverage: no escalation
+    report = {}
+    pmcover(TRAP, {'a': 1}, 5, costs=LAZY_FIRST, report=report)
+    assert report["engines"] == ["lazy"]
+
+def test_auto_respects_time_budget():
+    """A greedy predicted over budget gives way to stochastic greedy, and
+    with no time left the expensive engine is skipped."""
+    report = {}
+    pmcover(TRAP, TRAP_BUDGETS, 5, time_budget=0.0, report=report)
+    assert report["engines"] == ["stochastic"]
+
+    sets, budgets = random_instance(3)
+    report = {}
+    chosen = pmcover(sets, budgets, 20, time_budget=1e-12, report=report)
+    assert report["engines"] == ["stochastic"]
+    for a, budget in budgets.items():
+        assert sum(1 for key in chosen if key[0] == a) <= budget
+    # the fallback is seeded from the options
+    assert pmcover(sets, budgets, 20, time_budget=1e-12, seed=5) == \
+        pmcover_stochastic(sets, budgets, 20, seed=5)
+
+def test_calibrate_reports_costs():
+    """calibrate() fits non-negative costs on every term for the engines asked."""
+    costs = calibrate(n_keys=300, n_anchors=20, universe=300, max_size=10,
+                      dense_size=40, engines=["lazy", "continuous"])
+    assert set(costs) == {"lazy", "continuous"}
+    for coef in costs.values():
+        assert len(coef) == len(COST_TERMS) and min(coef) >= 0 and max(coef) > 0
+    stats = instance_stats(*dense_instance(1), 50)
+    assert predict_seconds("lazy", stats, costs) > 0
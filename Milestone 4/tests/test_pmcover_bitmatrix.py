@@ -0,0 +1,34 @@
+import random
+from src.pmcover import pmcover_half
+from src.pmcover_bitmatrix import pmcover_bitmatrix
+from pmcover_helpers import random_cover_instance as random_instance
+
+def test_bitmatrix_matches_half():
+    """Same selection, in the same order, as the set-based greedy."""
+    for seed in range(40):
+        sets, budgets = random_instance(seed)
+        for k in (1, 10, 60, 1000):
+            assert pmcover_bitmatrix(sets, budgets, k) == pmcover_half(sets, budgets, k)
+
+def test_bitmatrix_ties_budgets_and_labels():
+    """Ties go to the earliest key; missing budgets exclude; any hashable terminals."""
+    sets = {('b', 1): {'x', 'y'}, ('a', 2): {'z', 'w'}, ('a', 3): {'x', 'y'},
+            ('z', 4): {'p', 'q', 'r'}}
+    budgets = {'a': 1, 'b': 1}
+    assert pmcover_bitmatrix(sets, budgets, 4) == [('b', 1), ('a', 2)]
+    assert pmcover_bitmatrix(sets, budgets, 4) == pmcover_half(sets, budgets, 4)
+    assert pmcover_bitmatrix({}, budgets, 3) == []
+    # floats and mixed labels are interned by value, never cast to int
+    floats = {('a', 1): {1.5, 1.7}, ('b', 2): {1.2}}
+    assert pmcover_bitmatrix(floats, budgets, 3) == [('a', 1), ('b', 2)]
+    mixed = {('a', 1): {1, 'x', 2.5}, ('b', 2): {2, 'x'}, ('b', 3): {1, 2.5}}
+    for k in (1, 3, 5):
+        assert pmcover_bitmatrix(mixed, budgets, k) == pmcover_half(mixed, budgets, k)
+
+def test_bitmatrix_wide_universe():
+    """Terminals spread over many 64-bit words."""
+    rng = random.Random(7)
+    sets = {(a, c): set(rng.sample(range(2000), rng.randint(1, 200)))
+            for a in range(10) for c in range(12)}
+    budgets = {a: 2 for a in range(10)}
+    assert pmcover_bitmatrix(sets, budgets, 1500) == pmcover_half(sets, budgets, 1500)
@@ -49,3 +49,127 @@ def test_continuous_zero_gain():
     chosen = pmcover_continuous(sets, budgets, k, iters=4, samples=4)
     # Should pick only one because budget a=1
     assert len(chosen) == 1
+
+def _brute_force_gradient(sets, keys, x):
+    """E[f(R ∪ {i}) - f(R)] with gain 0 when i ∈ R, by enumerating every R."""
+    from itertools import product
+    grad = [0.0] * len(keys)
+    for bits in product((0, 1), repeat=len(keys)):
+        prob = 1.0
+        for xi, b in zip(x, bits):
+            prob *= xi if b else 1 - xi
+        R = set().union(*(sets[key] for key, b in zip(keys, bits) if b))
+        for i, key in enumerate(keys):
+            if not bits[i]:
+                grad[i] += prob * len(sets[key] - R)
+    return grad
+
+def test_exact_gradient_matches_enumeration():
+    """The closed-form gradient equals the expectation over all subsets."""
+    import numpy as np
+    from src.pmcover_continuous import _exact_gradient, _incidence
+    sets = {
+        ('a', 1): {1, 2, 3},
+        ('a', 2): {3, 4},
+        ('b', 3): {1, 4, 5},
+        ('b', 4): set(),
+        ('c', 5): {5, 6},
+    }
+    keys = list(sets)
+    key_idx, term_idx, _ = _incidence(sets, keys)
+    starts = np.flatnonzero(np.r_[True, term_idx[1:] != term_idx[:-1]])
+    for x in ([0.0] * 5, [0.3, 0.5, 0.1, 0.9, 0.7], [1.0, 0.2, 1.0, 0.0, 0.4]):
+        got = _exact_gradient(np.array(x), key_idx, term_idx, starts)
+        assert np.allclose(got, _brute_force_gradient(sets, keys, x))
+
+def test_exact_and_sampled_agree_on_clear_instance():
+    """With a clear best key per partition both engines pick the same keys."""
+    import random
+    sets = {
+        ('a', 1): {1, 2, 3, 4},
+        ('a', 2): {1},
+        ('b', 3): {5, 6, 7},
+        ('b', 4): {4},
+    }
+    budgets = {'a': 1, 'b': 1}
+    random.seed(0)
+    sampled = pmcover_continuous(sets, budgets, 7, iters=5, samples=10,
+                                 gradient="sample")
+    exact = pmcover_continuous(sets, budgets, 7, iters=5)
+    assert set(exact) == set(sampled) == {('a', 1), ('b', 3)}
+
+def test_unknown_gradient_engine():
+    """An unknown gradient name raises ValueError."""
+    with pytest.raises(ValueError):
+        pmcover_continuous({('a', 1): {1}}, {'a': 1}, 1, gradient="newton")
+
+def test_shared_sample_gradient_is_unbiased():
+    """Averaged over many shared samples the estimate approaches the exact gradient."""
+    import numpy as np
+    import scipy.sparse as sp
+    from src.pmcover_continuous import _incidence, _shared_sample_gradient
+    sets = {
+        ('a', 1): {1, 2, 3},
+        ('a', 2): {3, 4},
+        ('b', 3): {1, 4, 5},
+        ('c', 5): {5, 6},
+    }
+    keys = list(sets)
+    key_idx, term_idx, n_terms = _incidence(sets, keys)
+    incidence = sp.csr_matrix((np.ones(len(key_idx)), (key_idx, term_idx)),
+                              shape=(len(keys), n_terms))
+    x = [0.3, 0.5, 0.1, 0.7]
+    drawn = np.random.default_rng(1).random((20000, len(x))) < np.array(x)
+    est = _shared_sample_gradient(drawn, incidence)
+    assert np.allclose(est, _brute_force_gradient(sets, keys, x), atol=0.05)
+
+def test_shared_sample_mode_is_reproducible():
+    """The same seed, or equally seeded generators, give the same selection."""
+    import numpy as np
+    import random
+    rnd = random.Random(3)
+    sets = {(a, c): set(rnd.sample(range(60), rnd.randint(1, 12)))
+            for a in range(6) for c in range(8)}
+    budgets = {a: 2 for a in range(6)}
+    runs = [pmcover_continuous(sets, budgets, 50, iters=10, samples=8,
+                               gradient="shared", seed=7) for _ in range(2)]
+    runs.append(pmcover_continuous(sets, budgets, 50, iters=10, samples=8,
+                                   gradient="shared",
+                                   rng=np.random.default_rng(7)))
+    assert runs[0] == runs[1] == runs[2]
+    for a in budgets:
+        assert sum(1 for key in runs[0] if key[0] == a) <= budgets[a]
+
+def test_parallel_gradient_is_bit_identical():
+    """Process-parallel gradients reproduce the serial x exactly."""
+    import numpy as np
+    import random
+    from src.parallel_continuous import ParallelGradient
+    from src.pmcover_continuous import (_exact_gradient, _incidence,
+                                        _shared_sample_gradient)
+    import scipy.sparse as sp
+    rnd = random.Random(5)
+    sets = {(a, c): set(rnd.sample(range(300), rnd.randint(1, 30)))
+            for a in range(20) for c in range(15)}
+    keys = list(sets)
+    m = len(keys)
+    key_idx, term_idx, n_terms = _incidence(sets, keys)
+    starts = np.flatnonzero(np.r_[True, term_idx[1:] != term_idx[:-1]])
+    incidence = sp.csr_matrix((np.ones(len(key_idx)), (key_idx, term_idx)),
+                              shape=(m, n_terms))
+    x = np.random.default_rng(0).random(m)
+    drawn = np.random.default_rng(1).random((6, m)) < x
+    with ParallelGradient(key_idx, term_idx, m, n_terms, 2) as pool:
+        assert np.array_equal(pool.gradient(x),
+                              _exact_gradient(x, key_idx, term_idx, starts))
+    with ParallelGradient(key_idx, term_idx, m, n_terms, 2, samples=6) as pool:
+        assert np.array_equal(pool.gradient(x, drawn),
+                              _shared_sample_gradient(drawn, incidence))
+
+    budgets = {a: 3 for a in range(20)}
+    for gradient in ("exact", "shared"):
+        serial = pmcover_continuous(sets, budgets, 250, iters=8, samples=6,
+                                    gradient=gradient, seed=2)
+        parallel = pmcover_continuous(sets, budgets, 250, iters=8, samples=6,
+                                      gradient=gradient, seed=2, workers=2)
+        assert parallel == serial
@@ -51,3 +51,16 @@ def test_half_respects_budget():
     chosen = pmcover_half(sets, budgets, k)
     # Only 'b' may be chosen
     assert all(key[0] != 'a' for key in chosen)
+
+def test_half_bitset_matches_sets():
+    """The bitmap representation must not change the selection."""
+    import random
+    rng = random.Random(3)
+    sets = {
+        (a, c): set(rng.sample(range(40), rng.randint(1, 10)))
+        for a in range(4) for c in range(10)
+    }
+    budgets = {a: 2 for a in range(4)}
+    for k in (1, 10, 40):
+        assert pmcover_half(sets, budgets, k, bitset=True) == \
+            pmcover_half(sets, budgets, k)
@@ -0,0 +1,27 @@
+from functools import partial
+from src.pmcover import pmcover_half
+from src.pmcover_incremental import pmcover_incremental
+from pmcover_helpers import random_cover_instance
+
+random_instance = partial(random_cover_instance, anchors=6, per_anchor=15,
+                          universe=60, max_size=8, min_size=1)
+
+def test_incremental_matches_half():
+    """Same selection, in the same order, as the recomputing greedy."""
+    for seed in range(40):
+        sets, budgets = random_instance(seed)
+        for k in (1, 7, 30, 60, 1000):
+            assert pmcover_incremental(sets, budgets, k) == pmcover_half(sets, budgets, k)
+
+def test_incremental_ties_go_to_earliest_key():
+    """Equal gains are broken by position in `sets`, as in pmcover_half."""
+    sets = {('b', 1): {1, 2}, ('a', 2): {3, 4}, ('a', 3): {1, 2}}
+    budgets = {'a': 1, 'b': 1}
+    assert pmcover_incremental(sets, budgets, 4) == [('b', 1), ('a', 2)]
+
+def test_incremental_budgets_and_missing_anchors():
+    """Zero or missing budgets exclude a partition entirely."""
+    sets = {('a', 1): {1, 2, 3}, ('b', 2): {4}, ('z', 3): {5, 6, 7, 8}}
+    budgets = {'a': 0, 'b': 1}
+    assert pmcover_incremental(sets, budgets, 8) == [('b', 2)]
+    assert pmcover_incremental({}, budgets, 3) == []
@@ -1,5 +1,6 @@
 import pytest
 from src.pmcover_lazy import pmcover_lazy
+from pmcover_helpers import random_cover_instance
 
 def test_lazy_simple_match_half():
     """
@@ -58,3 +59,47 @@ def test_lazy_empty_instance():
     assert pmcover_lazy({}, {}, 0) == []
     # If no sets but k>0, still returns empty
     assert pmcover_lazy({}, {}, 3) == []
+
+def global_heap_lazy(sets, budgets, k):
+    """Reference: lazy greedy over one global heap of (neg_gain, key)."""
+    import heapq
+    covered, selected = set(), []
+    used = {a: 0 for a in budgets}
+    heap = [(-len(items), key) for key, items in sets.items()]
+    heapq.heapify(heap)
+    while len(covered) < k and heap:
+        neg_est, key = heapq.heappop(heap)
+        a, _ = key
+        true_gain = len(sets[key] - covered)
+        if -neg_est == true_gain and used[a] < budgets[a]:
+            selected.append(key)
+            used[a] += 1
+            covered |= sets[key]
+        elif used[a] < budgets[a] and true_gain > 0:
+            heapq.heappush(heap, (-true_gain, key))
+    return selected
+
+def test_lazy_partition_heaps_match_global_heap():
+    """Per-partition heaps select exactly what a single global heap selects."""
+    import random
+    for seed in range(30):
+        rng = random.Random(seed)
+        sets = {}
+        for c in range(150):
+            # skewed: partition 0 holds most keys
+            a = 0 if rng.random() < 0.7 else rng.randrange(1, 6)
+            sets[(a, c)] = set(rng.sample(range(80), rng.randint(1, 12)))
+        budgets = {a: rng.randint(0, 3) for a in range(6)}
+        for k in (1, 10, 40, 80):
+            assert pmcover_lazy(sets, budgets, k) == global_heap_lazy(sets, budgets, k)
+
+def test_lazy_bitset_matches_sets():
+    """The bitmap covered set gives the same selection as the set one."""
+    for seed in range(20):
+        sets, budgets = random_cover_instance(seed)
+        for k in (1, 10, 60, 1000):
+            assert pmcover_lazy(sets, budgets, k, bitset=True) == \
+                pmcover_lazy(sets, budgets, k)
+    mixed = {('a', 1): {'x', 2}, ('a', 2): {2.5}, ('b', 3): {'x', 2.5, 7}}
+    assert pmcover_lazy(mixed, {'a': 2, 'b': 1}, 4, bitset=True) == \
+        pmcover_lazy(mixed, {'a': 2, 'b': 1}, 4)
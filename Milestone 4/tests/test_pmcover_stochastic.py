@@ -0,0 +1,57 @@
+from functools import partial
+import random
+import pytest
+from src.pmcover import pmcover_half
+from src.pmcover_incremental import pmcover_incremental
+from src.pmcover_stochastic import pmcover_stochastic
+from pmcover_helpers import random_cover_instance
+
+random_instance = partial(random_cover_instance, anchors=8, per_anchor=25,
+                          universe=120, max_size=10)
+
+def test_stochastic_respects_budgets_and_gains():
+    """Budgets hold and every pick adds at least one new terminal."""
+    for seed in range(20):
+        sets, budgets = random_instance(seed)
+        chosen = pmcover_stochastic(sets, budgets, 80, epsilon=0.3, seed=seed)
+        for a, budget in budgets.items():
+            assert sum(1 for key in chosen if key[0] == a) <= budget
+        covered = set()
+        for key in chosen:
+            assert sets[key] - covered
+            covered |= sets[key]
+
+def test_stochastic_is_seeded():
+    """The same seed gives the same selection."""
+    sets, budgets = random_instance(3)
+    runs = [pmcover_stochastic(sets, budgets, 100, epsilon=0.5, seed=11)
+            for _ in range(3)]
+    assert runs[0] == runs[1] == runs[2]
+
+def test_stochastic_full_sample_matches_half():
+    """When every step samples the whole pool it is the exact greedy."""
+    for seed in range(20):
+        sets, budgets = random_instance(seed)
+        for k in (1, 30, 1000):
+            assert pmcover_stochastic(sets, budgets, k, epsilon=1e-300, seed=seed) \
+                == pmcover_half(sets, budgets, k)
+
+def test_stochastic_coverage_close_to_half():
+    """With the default ε the coverage stays close to the exact greedy's."""
+    rng = random.Random(0)
+    sets = {(a, c): set(rng.sample(range(3000), rng.randint(1, 40)))
+            for a in range(200) for c in range(20)}
+    budgets = {a: 2 for a in range(200)}
+    def coverage(selection):
+        return len(set().union(*(sets[key] for key in selection)))
+    # pmcover_incremental makes pmcover_half's selection, faster
+    half = coverage(pmcover_incremental(sets, budgets, 3000))
+    stochastic = coverage(pmcover_stochastic(sets, budgets, 3000, seed=1))
+    assert stochastic >= 0.9 * half
+
+def test_stochastic_edge_cases():
+    """Empty instances and zero budgets select nothing; epsilon lies in (0, 1)."""
+    assert pmcover_stochastic({}, {'a': 1}, 3) == []
+    assert pmcover_stochastic({('a', 1): {1}}, {'a': 0}, 1) == []
+    with pytest.raises(ValueError):
+        pmcover_stochastic({('a', 1): {1}}, {'a': 1}, 1, epsilon=0)
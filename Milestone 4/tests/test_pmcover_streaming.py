@@ -0,0 +1,58 @@
+from functools import partial
+import pytest
+from src.cover_instance import build_cover_instance, stream_cover_instance
+from src.graph_loader import generate_directed_ER
+from src.pmcover_incremental import pmcover_incremental
+from src.pmcover_streaming import pmcover_streaming
+from pmcover_helpers import random_cover_instance
+
+random_instance = partial(random_cover_instance, anchors=10, per_anchor=30,
+                          universe=300, max_size=20, max_budget=4)
+
+def coverage(sets, selection):
+    return len(set().union(*(sets[key] for key in selection)))
+
+def test_streaming_respects_budgets_and_consumes_a_generator():
+    """A one-shot generator is enough, and budgets hold."""
+    for seed in range(20):
+        sets, budgets = random_instance(seed)
+        chosen = pmcover_streaming((pair for pair in sets.items()), budgets, 150)
+        assert chosen == pmcover_streaming(sets, budgets, 150)
+        assert len(set(chosen)) == len(chosen)
+        for a, budget in budgets.items():
+            assert sum(1 for key in chosen if key[0] == a) <= budget
+
+def test_streaming_reaches_reachable_targets():
+    """Small targets are met, and coverage stays within half of the greedy's."""
+    for seed in range(20):
+        sets, budgets = random_instance(seed)
+        greedy = coverage(sets, pmcover_incremental(sets, budgets, 1000))
+        assert coverage(sets, pmcover_streaming(sets, budgets, 1000)) >= greedy / 2
+        k = min(20, greedy)
+        assert coverage(sets, pmcover_streaming(sets, budgets, k)) >= k
+
+def test_streaming_straight_from_cover_instance():
+    """Solving the lazy stream matches solving the materialized instance."""
+    G = generate_directed_ER(80, 0.06, seed=2)
+    terminals = set(range(1, 80, 2))
+    sets, budgets, _ = build_cover_instance(G, 0, terminals, [[1, 3]], 2, 16)
+    stream_budgets, pairs = stream_cover_instance(G, 0, terminals, [[1, 3]], 2, 16)
+    chosen = pmcover_streaming(pairs, stream_budgets, 16)
+    assert all(key in sets for key in chosen)
+    assert coverage(sets, chosen) >= min(16, coverage(sets, pmcover_incremental(sets, budgets, 16))) / 2
+
+def test_streaming_thresholds_are_distinct_integers():
+    """A fine grid opens one sieve per integer threshold, not one per grid point."""
+    for seed in range(5):
+        sets, budgets = random_instance(seed)
+        # (1+1e-6)^i needs millions of grid points to pass the largest set
+        assert pmcover_streaming(sets, budgets, 150, epsilon=1e-6) == \
+               pmcover_streaming(sets, budgets, 150, epsilon=1e-3)
+
+def test_streaming_edge_cases():
+    """Empty streams, zero budgets and k = 0 select nothing; epsilon is > 0."""
+    assert pmcover_streaming({}, {'a': 1}, 3) == []
+    assert pmcover_streaming({('a', 1): {1}}, {'a': 0}, 1) == []
+    assert pmcover_streaming({('a', 1): {1}}, {'a': 1}, 0) == []
+    with pytest.raises(ValueError):
+        pmcover_streaming({('a', 1): {1}}, {'a': 1}, 1, epsilon=0)
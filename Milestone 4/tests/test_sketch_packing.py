@@ -0,0 +1,38 @@
+import math
+import pytest
+from src.bfs import bfs_subtree_nodes
+from src.graph_loader import generate_sparse_directed_ER
+from src.greedy_packing import find_greedy_packing
+
+def test_sketch_packs_are_valid_and_disjoint():
+    """Approximate packs still cover distinct terminals via disjoint balls."""
+    G = generate_sparse_directed_ER(300, 0.01, seed=3)
+    terminals = set(range(200, 300))
+    k = 36
+    packs = find_greedy_packing(G, 0, terminals, k, 2, engine="sketch", seed=1)
+    assert 1 <= len(packs) <= math.ceil(math.sqrt(k))
+    covered = set()
+    for pack in packs:
+        assert set(pack) <= terminals
+        assert covered.isdisjoint(pack)
+        covered |= set(pack)
+
+def test_sketch_with_full_rescoring_matches_exact_coverage():
+    """Re-scoring every live candidate exactly recovers the exact best first pack."""
+    G = generate_sparse_directed_ER(150, 0.02, seed=7)
+    terminals = set(range(100, 150))
+    exact = find_greedy_packing(G, 0, terminals, 4, 2)
+    approx = find_greedy_packing(G, 0, terminals, 4, 2, engine="sketch",
+                                 exact_top=150, seed=0)
+    assert len(approx[0]) == len(exact[0])
+
+def test_sketch_is_seeded():
+    """The same seed gives the same packs; sketches need at least two values."""
+    G = generate_sparse_directed_ER(200, 0.015, seed=4)
+    terminals = set(range(120, 200))
+    runs = [find_greedy_packing(G, 0, terminals, 25, 2, engine="sketch",
+                                sketch_size=4, exact_top=1, seed=9)
+            for _ in range(2)]
+    assert runs[0] == runs[1]
+    with pytest.raises(ValueError):
+        find_greedy_packing(G, 0, terminals, 25, 2, engine="sketch", sketch_size=1)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from src.graph_loader import load_edge_list, generate_sparse_directed_ER
+from src.snapshot import save_snapshot, load_snapshot, open_edge_list
+
+EDGE_LIST = """# Directed graph: toy.txt
+# FromNodeId\tToNodeId
+10\t20
+10\t30
+20\t30
+30\t10
+20\t30
+"""
+
+def write_edges(tmp_path):
+    path = tmp_path / "toy.txt"
+    path.write_text(EDGE_LIST)
+    return str(path)
+
+def test_load_edge_list_relabels_and_dedupes(tmp_path):
+    """SNAP ids are relabeled to 0..n-1 and duplicate edges dropped."""
+    G = load_edge_list(write_edges(tmp_path))
+    assert G.number_of_nodes() == 3
+    assert G.number_of_edges() == 4
+    assert G.labels.tolist() == [10, 20, 30]
+    assert sorted(G.edges()) == [(0, 1), (0, 2), (1, 2), (2, 0)]
+    assert G.node_ids([30, 10]).tolist() == [2, 0]
+    with pytest.raises(KeyError):
+        G.node_ids([15])
+
+def test_snapshot_roundtrip_memmap(tmp_path):
+    """Snapshots reopen via memmap with root and terminals intact."""
+    G = generate_sparse_directed_ER(100, 0.05, seed=2)
+    snap = str(tmp_path / "er.csr")
+    save_snapshot(snap, G, root=0, terminals={5, 7, 9})
+    H, root, terminals = load_snapshot(snap)
+    assert isinstance(H.indices, np.memmap)
+    assert root == 0
+    assert terminals == {5, 7, 9}
+    assert list(H.edges()) == list(G.edges())
+    assert H.labels is None
+
+def test_open_edge_list_caches_snapshot(tmp_path):
+    """The first open writes the snapshot, the second reuses it."""
+    path = write_edges(tmp_path)
+    G1, root, terminals = open_edge_list(path)
+    assert root is None and terminals is None
+    assert (tmp_path / "toy.txt.csr" / "meta.json").exists()
+    G2, _, _ = open_edge_list(path)
+    assert isinstance(G2.indptr, np.memmap)
+    assert list(G2.edges()) == list(G1.edges())
+    assert G2.labels.tolist() == [10, 20, 30]
+
+def test_interrupted_overwrite_leaves_no_valid_snapshot(tmp_path, monkeypatch):
+    """A save that fails midway never leaves old metadata over new arrays."""
+    snap = str(tmp_path / "er.csr")
+    old = generate_sparse_directed_ER(50, 0.1, seed=1)
+    save_snapshot(snap, old, root=0)
+    H, _, _ = load_snapshot(snap)
+    new = generate_sparse_directed_ER(80, 0.1, seed=2)
+    real_save = np.save
+    def failing_save(fh, array):
+        if array.shape == new.indices.shape:
+            raise OSError("disk full")
+        real_save(fh, array)
+    monkeypatch.setattr(np, "save", failing_save)
+    with pytest.raises(OSError):
+        save_snapshot(snap, new)
+    with pytest.raises(FileNotFoundError):
+        load_snapshot(snap)
+    assert not list((tmp_path / "er.csr").glob("*.tmp"))
+    # the earlier memory-map still reads the old graph
+    assert list(H.edges()) == list(old.edges())
+    monkeypatch.undo()
+    save_snapshot(snap, new)
+    assert list(load_snapshot(snap)[0].edges()) == list(new.edges())
+
+def test_overwrite_removes_optional_arrays(tmp_path):
+    """Labels and terminals of an overwritten snapshot do not linger."""
+    snap = tmp_path / "toy.csr"
+    save_snapshot(str(snap), load_edge_list(write_edges(tmp_path)), terminals={1})
+    assert (snap / "labels.npy").exists() and (snap / "terminals.npy").exists()
+    save_snapshot(str(snap), generate_sparse_directed_ER(20, 0.1, seed=3))
+    assert not (snap / "labels.npy").exists()
+    assert not (snap / "terminals.npy").exists()
+    H, _, terminals = load_snapshot(str(snap))
+    assert H.labels is None and terminals is None
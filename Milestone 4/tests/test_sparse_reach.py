@@ -0,0 +1,36 @@
+import numpy as np
+import networkx as nx
+from src.bfs import bfs_subtree_nodes
+from src.csr_graph import from_networkx
+from src.graph_loader import generate_directed_ER
+from src.sparse_reach import reachability_matrix
+
+def test_rows_match_bfs_balls():
+    """Row i holds exactly the depth-bounded ball of sources[i]."""
+    G = generate_directed_ER(70, 0.05, seed=11)
+    for H in (G, from_networkx(G)):
+        for D in (0, 1, 3):
+            reach = reachability_matrix(H, range(70), D, chunk_size=16)
+            assert reach.shape == (70, 70)
+            for u in range(70):
+                row = reach.indices[reach.indptr[u]:reach.indptr[u + 1]]
+                assert set(row.tolist()) == bfs_subtree_nodes(G, u, D)
+
+def test_targets_and_exclusion_mask():
+    """Columns follow `targets`; excluded nodes are never stepped onto."""
+    G = nx.DiGraph([("s", "x"), ("x", "t"), ("s", "y"), ("y", "z"), ("z", "u")])
+    nodes = list(G.nodes())
+    exclude = np.array([u == "x" for u in nodes])
+    reach = reachability_matrix(G, ["s", "x"], 3, targets=["t", "u", "x"],
+                                exclude=exclude)
+    assert reach.toarray().tolist() == [[False, True, False],
+                                        [True, False, True]]
+
+def test_exclusion_leaves_csr_graph_untouched():
+    """Masking the adjacency never writes into the graph's own arrays."""
+    G = from_networkx(generate_directed_ER(40, 0.1, seed=3))
+    indices = G.indices.copy()
+    exclude = np.zeros(40, dtype=bool)
+    exclude[::2] = True
+    reachability_matrix(G, range(40), 2, exclude=exclude)
+    assert G.indices.tolist() == indices.tolist()